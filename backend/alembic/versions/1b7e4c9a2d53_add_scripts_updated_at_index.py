@@ -0,0 +1,28 @@
+"""Add scripts updated_at index
+
+Revision ID: 1b7e4c9a2d53
+Revises: f0a6c2d9e351
+Create Date: 2026-10-19 20:41:12.517309
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7e4c9a2d53'
+down_revision: Union[str, Sequence[str], None] = 'f0a6c2d9e351'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_scripts_updated_at', 'scripts', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scripts_updated_at', table_name='scripts')
@@ -0,0 +1,62 @@
+"""Add scripts query indexes
+
+Revision ID: 3c1f2a9d7b4e
+Revises: 95ba76b307f6
+Create Date: 2026-10-19 10:12:31.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f2a9d7b4e'
+down_revision: Union[str, Sequence[str], None] = '95ba76b307f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _check_duplicate_video_ids() -> None:
+    """고유 인덱스 생성 전에 중복된 youtube_video_id 확인
+
+    중복 행을 임의로 삭제하면 대본이 유실되므로 자동 정리하지 않고
+    중복 목록과 함께 마이그레이션을 중단합니다. 빈 문자열은 업로드되지
+    않은 상태와 같으므로 NULL로 정규화합니다.
+    """
+    bind = op.get_bind()
+    bind.execute(
+        sa.text("UPDATE scripts SET youtube_video_id = NULL WHERE youtube_video_id = ''")
+    )
+    duplicates = bind.execute(
+        sa.text(
+            "SELECT youtube_video_id, COUNT(*) AS count, MIN(id) AS first_id "
+            "FROM scripts WHERE youtube_video_id IS NOT NULL "
+            "GROUP BY youtube_video_id HAVING COUNT(*) > 1 "
+            "ORDER BY first_id"
+        )
+    ).all()
+    if duplicates:
+        details = ", ".join(
+            f"{row.youtube_video_id} ({row.count}건)" for row in duplicates
+        )
+        raise RuntimeError(
+            "scripts.youtube_video_id 중복으로 고유 인덱스를 만들 수 없습니다: "
+            f"{details}. 중복 대본을 정리한 뒤 다시 실행하세요."
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _check_duplicate_video_ids()
+    op.create_index('ix_scripts_status_created_at', 'scripts', ['status', 'created_at'], unique=False)
+    op.create_index('ix_scripts_status_updated_at', 'scripts', ['status', 'updated_at'], unique=False)
+    op.create_index('ix_scripts_youtube_video_id', 'scripts', ['youtube_video_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scripts_youtube_video_id', table_name='scripts')
+    op.drop_index('ix_scripts_status_updated_at', table_name='scripts')
+    op.drop_index('ix_scripts_status_created_at', table_name='scripts')
@@ -0,0 +1,93 @@
+"""Use AUTOINCREMENT for scripts ids
+
+Revision ID: 6d2f8b3e1a74
+Revises: 1b7e4c9a2d53
+Create Date: 2026-10-19 22:14:05.308127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2f8b3e1a74'
+down_revision: Union[str, Sequence[str], None] = '1b7e4c9a2d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 테이블 재생성 시 함께 삭제되는 FTS5 동기화 트리거 (7a4d2e9c1b05와 동일)
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS scripts_fts_ai AFTER INSERT ON scripts BEGIN
+        INSERT INTO scripts_fts(rowid, title, description, tags, content)
+        VALUES (new.id, new.title, new.description, new.tags, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scripts_fts_ad AFTER DELETE ON scripts BEGIN
+        INSERT INTO scripts_fts(scripts_fts, rowid, title, description, tags, content)
+        VALUES ('delete', old.id, old.title, old.description, old.tags, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scripts_fts_au
+    AFTER UPDATE OF title, description, tags, content ON scripts BEGIN
+        INSERT INTO scripts_fts(scripts_fts, rowid, title, description, tags, content)
+        VALUES ('delete', old.id, old.title, old.description, old.tags, old.content);
+        INSERT INTO scripts_fts(rowid, title, description, tags, content)
+        VALUES (new.id, new.title, new.description, new.tags, new.content);
+    END
+    """,
+]
+
+
+def _rebuild_scripts(autoincrement: bool) -> None:
+    with op.batch_alter_table(
+        'scripts',
+        recreate='always',
+        table_kwargs={'sqlite_autoincrement': autoincrement},
+    ):
+        pass
+    for trigger in FTS_TRIGGERS:
+        op.execute(trigger)
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    SQLite의 기본 rowid 할당은 가장 큰 ID 행이 삭제되면 그 ID를 재사용하므로
+    archived_scripts로 옮긴 대본과 새 대본의 ID가 겹칠 수 있습니다.
+    AUTOINCREMENT는 sqlite_sequence에 기록된 최댓값 이하를 재사용하지 않으며,
+    시퀀스를 보관 대본 ID까지 포함한 최댓값으로 맞춥니다.
+    PostgreSQL 시퀀스는 값을 재사용하지 않으므로 변경하지 않습니다.
+    """
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    _rebuild_scripts(autoincrement=True)
+
+    bind = op.get_bind()
+    max_id = bind.execute(
+        sa.text(
+            "SELECT MAX(id) FROM ("
+            "SELECT MAX(id) AS id FROM scripts "
+            "UNION ALL SELECT MAX(id) FROM archived_scripts)"
+        )
+    ).scalar()
+    if max_id is None:
+        return
+    bind.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = 'scripts'"))
+    bind.execute(
+        sa.text("INSERT INTO sqlite_sequence(name, seq) VALUES ('scripts', :seq)"),
+        {'seq': max_id},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    _rebuild_scripts(autoincrement=False)
@@ -0,0 +1,66 @@
+"""Add scripts FTS5 search index
+
+Revision ID: 7a4d2e9c1b05
+Revises: 3c1f2a9d7b4e
+Create Date: 2026-10-19 11:02:47.615930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4d2e9c1b05'
+down_revision: Union[str, Sequence[str], None] = '3c1f2a9d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS scripts_fts USING fts5(
+            title, description, tags, content,
+            content='scripts', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS scripts_fts_ai AFTER INSERT ON scripts BEGIN
+            INSERT INTO scripts_fts(rowid, title, description, tags, content)
+            VALUES (new.id, new.title, new.description, new.tags, new.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS scripts_fts_ad AFTER DELETE ON scripts BEGIN
+            INSERT INTO scripts_fts(scripts_fts, rowid, title, description, tags, content)
+            VALUES ('delete', old.id, old.title, old.description, old.tags, old.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS scripts_fts_au
+        AFTER UPDATE OF title, description, tags, content ON scripts BEGIN
+            INSERT INTO scripts_fts(scripts_fts, rowid, title, description, tags, content)
+            VALUES ('delete', old.id, old.title, old.description, old.tags, old.content);
+            INSERT INTO scripts_fts(rowid, title, description, tags, content)
+            VALUES (new.id, new.title, new.description, new.tags, new.content);
+        END
+    """)
+    # 기존 대본 색인
+    op.execute("INSERT INTO scripts_fts(scripts_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS scripts_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS scripts_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS scripts_fts_ai")
+    op.execute("DROP TABLE IF EXISTS scripts_fts")
@@ -0,0 +1,57 @@
+"""Use trigram tokenizer for scripts FTS5 index
+
+Revision ID: 9c3e5f1a7b26
+Revises: 6d2f8b3e1a74
+Create Date: 2026-10-19 22:48:31.772046
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5f1a7b26'
+down_revision: Union[str, Sequence[str], None] = '6d2f8b3e1a74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# trigram 토크나이저가 추가된 SQLite 버전
+TRIGRAM_MIN_SQLITE_VERSION = (3, 34, 0)
+
+
+def _recreate_fts(tokenize: str) -> None:
+    # 동기화 트리거는 이름으로 scripts_fts를 참조하므로 그대로 유지됨
+    op.execute("DROP TABLE IF EXISTS scripts_fts")
+    op.execute(f"""
+        CREATE VIRTUAL TABLE scripts_fts USING fts5(
+            title, description, tags, content,
+            content='scripts', content_rowid='id',
+            tokenize='{tokenize}'
+        )
+    """)
+    op.execute("INSERT INTO scripts_fts(scripts_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    version = bind.execute(sa.text("SELECT sqlite_version()")).scalar()
+    if tuple(int(part) for part in version.split('.')) < TRIGRAM_MIN_SQLITE_VERSION:
+        raise RuntimeError(
+            f"FTS5 trigram 토크나이저는 SQLite 3.34 이상이 필요합니다 (현재 {version})."
+        )
+
+    _recreate_fts('trigram')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    _recreate_fts('unicode61 remove_diacritics 2')
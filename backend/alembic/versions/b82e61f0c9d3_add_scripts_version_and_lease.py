@@ -0,0 +1,32 @@
+"""Add scripts version and upload lease columns
+
+Revision ID: b82e61f0c9d3
+Revises: 7a4d2e9c1b05
+Create Date: 2026-10-19 13:26:05.482731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b82e61f0c9d3'
+down_revision: Union[str, Sequence[str], None] = '7a4d2e9c1b05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('scripts', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('scripts', sa.Column('lease_owner', sa.String(length=100), nullable=True))
+    op.add_column('scripts', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('scripts', 'lease_expires_at')
+    op.drop_column('scripts', 'lease_owner')
+    op.drop_column('scripts', 'version')
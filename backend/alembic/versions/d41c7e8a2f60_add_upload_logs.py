@@ -0,0 +1,47 @@
+"""Add upload_logs event table
+
+Revision ID: d41c7e8a2f60
+Revises: b82e61f0c9d3
+Create Date: 2026-10-19 15:02:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41c7e8a2f60'
+down_revision: Union[str, Sequence[str], None] = 'b82e61f0c9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'upload_logs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('script_id', sa.Integer(), nullable=False),
+        sa.Column('event', sa.String(length=30), nullable=False),
+        sa.Column('from_status', sa.String(length=20), nullable=True),
+        sa.Column('to_status', sa.String(length=20), nullable=True),
+        sa.Column('duration_ms', sa.Float(), nullable=True),
+        sa.Column('bytes', sa.BigInteger(), nullable=True),
+        sa.Column('youtube_video_id', sa.String(length=50), nullable=True),
+        sa.Column('lease_owner', sa.String(length=100), nullable=True),
+        sa.Column('error_type', sa.String(length=100), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_upload_logs_script_id', 'upload_logs', ['script_id'], unique=False)
+    op.create_index('ix_upload_logs_created_at_event', 'upload_logs', ['created_at', 'event'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_upload_logs_created_at_event', table_name='upload_logs')
+    op.drop_index('ix_upload_logs_script_id', table_name='upload_logs')
+    op.drop_table('upload_logs')
@@ -0,0 +1,84 @@
+"""Add normalized tags and script_tags tables
+
+Revision ID: e5b93a7c4d18
+Revises: d41c7e8a2f60
+Create Date: 2026-10-19 16:40:12.903551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b93a7c4d18'
+down_revision: Union[str, Sequence[str], None] = 'd41c7e8a2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _split_tags(raw):
+    """app.repositories.tag_repository.split_tags와 동일한 규칙"""
+    tags = []
+    for tag in (raw or '').split(','):
+        tag = tag.strip()[:100]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tags = op.create_table(
+        'tags',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_tags_name', 'tags', ['name'], unique=True)
+    script_tags = op.create_table(
+        'script_tags',
+        sa.Column('script_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['script_id'], ['scripts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('script_id', 'tag_id'),
+    )
+    op.create_index('ix_script_tags_tag_id_script_id', 'script_tags', ['tag_id', 'script_id'], unique=False)
+
+    # 기존 scripts.tags 문자열 백필
+    bind = op.get_bind()
+    scripts = sa.table('scripts', sa.column('id', sa.Integer), sa.column('tags', sa.Text))
+    parsed = {
+        script_id: _split_tags(raw)
+        for script_id, raw in bind.execute(
+            sa.select(scripts.c.id, scripts.c.tags).where(scripts.c.tags.isnot(None))
+        )
+    }
+    names = sorted({name for names in parsed.values() for name in names})
+    for start in range(0, len(names), BACKFILL_BATCH_SIZE):
+        bind.execute(
+            tags.insert(),
+            [{'name': name} for name in names[start:start + BACKFILL_BATCH_SIZE]],
+        )
+    tag_ids = dict(bind.execute(sa.select(tags.c.name, tags.c.id)).all())
+
+    rows = [
+        {'script_id': script_id, 'tag_id': tag_ids[name], 'position': position}
+        for script_id, names in parsed.items()
+        for position, name in enumerate(names)
+    ]
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        bind.execute(script_tags.insert(), rows[start:start + BACKFILL_BATCH_SIZE])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_script_tags_tag_id_script_id', table_name='script_tags')
+    op.drop_table('script_tags')
+    op.drop_index('ix_tags_name', table_name='tags')
+    op.drop_table('tags')
@@ -0,0 +1,49 @@
+"""Add archived_scripts table
+
+Revision ID: f0a6c2d9e351
+Revises: e5b93a7c4d18
+Create Date: 2026-10-19 18:05:37.640218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0a6c2d9e351'
+down_revision: Union[str, Sequence[str], None] = 'e5b93a7c4d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'archived_scripts',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('tags', sa.Text(), nullable=True),
+        sa.Column('thumbnail_text', sa.String(length=100), nullable=True),
+        sa.Column('imagefx_prompt', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('video_file_path', sa.String(length=500), nullable=True),
+        sa.Column('youtube_video_id', sa.String(length=50), nullable=True),
+        sa.Column('scheduled_time', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_archived_scripts_archived_at', 'archived_scripts', ['archived_at'], unique=False)
+    op.create_index('ix_archived_scripts_youtube_video_id', 'archived_scripts', ['youtube_video_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_archived_scripts_youtube_video_id', table_name='archived_scripts')
+    op.drop_index('ix_archived_scripts_archived_at', table_name='archived_scripts')
+    op.drop_table('archived_scripts')
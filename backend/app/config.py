@@ -7,7 +7,7 @@ Pydantic Settings를 사용하여 타입 안전성과 검증을 제공합니다.
 
 import os
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -37,7 +37,11 @@ class Settings(BaseSettings):
     # ===========================================
     upload_dir: str = Field(default="uploads/videos", validation_alias="UPLOAD_DIR")
     credentials_path: str = Field(default="credentials.json", validation_alias="CREDENTIALS_PATH")
-    token_path: str = Field(default="token.pickle", validation_alias="TOKEN_PATH")
+    token_path: str = Field(default="token.json", validation_alias="TOKEN_PATH")
+    # 이전 버전의 pickle 토큰 (있으면 첫 인증 시 TOKEN_PATH의 JSON으로 이전)
+    legacy_token_path: str = Field(
+        default="token.pickle", validation_alias="LEGACY_TOKEN_PATH"
+    )
 
     # ===========================================
     # YouTube API Configuration
@@ -58,6 +62,24 @@ class Settings(BaseSettings):
         default=False, validation_alias="YOUTUBE_PROJECT_CREATED_AFTER_2020_07_28"
     )
 
+    # 액세스 토큰 사전 갱신 (만료 margin초 전에 백그라운드에서 갱신)
+    token_refresh_enabled: bool = Field(
+        default=True, validation_alias="TOKEN_REFRESH_ENABLED"
+    )
+    token_refresh_margin_seconds: float = Field(
+        default=600.0, validation_alias="TOKEN_REFRESH_MARGIN_SECONDS"
+    )
+    token_refresh_check_interval_seconds: float = Field(
+        default=60.0, validation_alias="TOKEN_REFRESH_CHECK_INTERVAL_SECONDS"
+    )
+    # 갱신 실패 시 지수 백오프 (base * 2^(실패 횟수-1), 최대 max)
+    token_refresh_backoff_base_seconds: float = Field(
+        default=5.0, validation_alias="TOKEN_REFRESH_BACKOFF_BASE_SECONDS"
+    )
+    token_refresh_backoff_max_seconds: float = Field(
+        default=900.0, validation_alias="TOKEN_REFRESH_BACKOFF_MAX_SECONDS"
+    )
+
     # ===========================================
     # Application Metadata
     # ===========================================
@@ -71,14 +93,136 @@ class Settings(BaseSettings):
     # Database Configuration
     # ===========================================
     database_url: str = Field(
-        default="sqlite:///./backend/youtube_automation.db", validation_alias="DATABASE_URL"
+        default="sqlite:///./youtube_automation.db", validation_alias="DATABASE_URL"
+    )
+    db_echo: bool = Field(default=False, validation_alias="DB_ECHO")
+
+    # 커넥션 풀 (PostgreSQL 등 서버형 데이터베이스)
+    db_pool_size: int = Field(default=10, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, validation_alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE")
+
+    # SQLite PRAGMA 튜닝
+    sqlite_journal_mode: str = Field(
+        default="WAL", validation_alias="SQLITE_JOURNAL_MODE"
+    )
+    sqlite_synchronous: str = Field(
+        default="NORMAL", validation_alias="SQLITE_SYNCHRONOUS"
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000, validation_alias="SQLITE_BUSY_TIMEOUT_MS"
+    )
+    sqlite_cache_size_kb: int = Field(
+        default=65536, validation_alias="SQLITE_CACHE_SIZE_KB"
+    )
+    sqlite_mmap_size_mb: int = Field(
+        default=256, validation_alias="SQLITE_MMAP_SIZE_MB"
+    )
+
+    # ===========================================
+    # Upload Worker Configuration
+    # ===========================================
+    # 업로드 작업 임대 시간 (만료되면 다른 작업자가 다시 가져갈 수 있음)
+    upload_lease_seconds: int = Field(
+        default=3600, validation_alias="UPLOAD_LEASE_SECONDS"
+    )
+
+    # ===========================================
+    # Upload Event Log Configuration
+    # ===========================================
+    # 업로드 이벤트를 모아서 기록할 배치 크기와 최대 대기 시간
+    upload_log_batch_size: int = Field(
+        default=100, validation_alias="UPLOAD_LOG_BATCH_SIZE"
+    )
+    upload_log_flush_interval_seconds: float = Field(
+        default=5.0, validation_alias="UPLOAD_LOG_FLUSH_INTERVAL_SECONDS"
+    )
+
+    # ===========================================
+    # Archive Configuration
+    # ===========================================
+    # 업로드 완료 후 이 기간이 지난 대본은 archived_scripts로 이동 (0이면 비활성화)
+    archive_after_days: int = Field(default=180, validation_alias="ARCHIVE_AFTER_DAYS")
+    archive_interval_seconds: float = Field(
+        default=3600.0, validation_alias="ARCHIVE_INTERVAL_SECONDS"
+    )
+    archive_batch_size: int = Field(default=500, validation_alias="ARCHIVE_BATCH_SIZE")
+
+    # ===========================================
+    # Catalog Import Configuration
+    # ===========================================
+    # 대량 가져오기 시 트랜잭션당 처리할 행 수
+    import_batch_size: int = Field(default=2000, validation_alias="IMPORT_BATCH_SIZE")
+
+    # ===========================================
+    # Cache Configuration
+    # ===========================================
+    stats_cache_ttl_seconds: float = Field(
+        default=5.0, validation_alias="STATS_CACHE_TTL_SECONDS"
+    )
+    # 대본 단건 조회 캐시 (상태 폴링용)
+    script_cache_maxsize: int = Field(
+        default=1024, validation_alias="SCRIPT_CACHE_MAXSIZE"
+    )
+    script_cache_ttl_seconds: float = Field(
+        default=30.0, validation_alias="SCRIPT_CACHE_TTL_SECONDS"
+    )
+
+    # ===========================================
+    # SQL Instrumentation
+    # ===========================================
+    sql_metrics_enabled: bool = Field(default=True, validation_alias="SQL_METRICS_ENABLED")
+    # 요청당 허용 쿼리 수 (초과 시 경고 로그, 0이면 비활성화)
+    query_budget_default: int = Field(default=25, validation_alias="QUERY_BUDGET_DEFAULT")
+    # 라우트별 쿼리 예산 (예: {"GET /api/scripts/": 5})
+    query_budgets: Dict[str, int] = Field(default={}, validation_alias="QUERY_BUDGETS")
+    sql_slowest_statements: int = Field(default=5, validation_alias="SQL_SLOWEST_STATEMENTS")
+
+    # ===========================================
+    # Metrics
+    # ===========================================
+    # /metrics 엔드포인트 (Prometheus text exposition 형식)
+    metrics_enabled: bool = Field(default=True, validation_alias="METRICS_ENABLED")
+    event_loop_lag_interval_seconds: float = Field(
+        default=0.5, validation_alias="EVENT_LOOP_LAG_INTERVAL_SECONDS"
+    )
+
+    # ===========================================
+    # Tracing
+    # ===========================================
+    # 요청 단위 span 기록 (응답 헤더 X-Trace-Id로 트레이스 ID 반환)
+    tracing_enabled: bool = Field(default=True, validation_alias="TRACING_ENABLED")
+    # jsonl: 로컬 파일, otlp: OTLP/HTTP(JSON) 수집기, none: 헤더만 반환
+    tracing_exporter: str = Field(default="jsonl", validation_alias="TRACING_EXPORTER")
+    tracing_export_path: str = Field(
+        default="logs/traces.jsonl", validation_alias="TRACING_EXPORT_PATH"
+    )
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318/v1/traces", validation_alias="TRACING_OTLP_ENDPOINT"
     )
+    # 새 트레이스 샘플링 비율 (traceparent로 이어받은 트레이스는 상위 결정을 따름)
+    tracing_sample_rate: float = Field(default=1.0, validation_alias="TRACING_SAMPLE_RATE")
+
+    # ===========================================
+    # Response Compression
+    # ===========================================
+    # 이 크기(바이트) 이상인 응답만 압축
+    compression_minimum_size: int = Field(
+        default=1024, validation_alias="COMPRESSION_MINIMUM_SIZE"
+    )
+    gzip_compression_level: int = Field(default=6, validation_alias="GZIP_COMPRESSION_LEVEL")
+    brotli_quality: int = Field(default=4, validation_alias="BROTLI_QUALITY")
 
     # ===========================================
     # Development Settings
     # ===========================================
     debug: bool = Field(default=True, validation_alias="DEBUG")
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
+    # 파일 로그 형식 (text: 사람이 읽는 한 줄, json: 구조화 JSON 한 줄)
+    log_format: str = Field(default="text", validation_alias="LOG_FORMAT")
+    # 로거별 샘플링 비율 (WARNING 미만만 적용, 예: {"uvicorn.access": 0.1})
+    log_sampling: Dict[str, float] = Field(default={}, validation_alias="LOG_SAMPLING")
 
     # ===========================================
     # File Upload Limits
@@ -128,6 +272,11 @@ class Settings(BaseSettings):
         """토큰 파일 Path 객체 반환"""
         return Path(self.token_path)
 
+    @property
+    def legacy_token_file_path(self) -> Path:
+        """이전 pickle 토큰 파일 Path 객체 반환"""
+        return Path(self.legacy_token_path)
+
     # ===========================================
     # Validators
     # ===========================================
@@ -151,6 +300,65 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level. Must be one of: {valid_levels}")
         return v.upper()
 
+    @field_validator("log_format")
+    @classmethod
+    def validate_log_format(cls, v):
+        """로그 형식 검증"""
+        valid_formats = ["text", "json"]
+        if v.lower() not in valid_formats:
+            raise ValueError(f"Invalid log format. Must be one of: {valid_formats}")
+        return v.lower()
+
+    @field_validator("tracing_exporter")
+    @classmethod
+    def validate_tracing_exporter(cls, v):
+        """트레이스 내보내기 대상 검증"""
+        valid_exporters = ["jsonl", "otlp", "none"]
+        if v.lower() not in valid_exporters:
+            raise ValueError(
+                f"Invalid tracing exporter. Must be one of: {valid_exporters}"
+            )
+        return v.lower()
+
+    @field_validator("tracing_sample_rate")
+    @classmethod
+    def validate_tracing_sample_rate(cls, v):
+        """트레이스 샘플링 비율 검증"""
+        if not 0.0 <= v <= 1.0:
+            raise ValueError("Tracing sample rate must be between 0.0 and 1.0")
+        return v
+
+    @field_validator("log_sampling")
+    @classmethod
+    def validate_log_sampling(cls, v):
+        """로그 샘플링 비율 검증"""
+        for name, rate in v.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Log sampling rate must be between 0 and 1: {name}")
+        return v
+
+    @field_validator("sqlite_journal_mode")
+    @classmethod
+    def validate_sqlite_journal_mode(cls, v):
+        """SQLite 저널 모드 검증"""
+        valid_modes = ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+        if v.upper() not in valid_modes:
+            raise ValueError(
+                f"Invalid SQLite journal mode. Must be one of: {valid_modes}"
+            )
+        return v.upper()
+
+    @field_validator("sqlite_synchronous")
+    @classmethod
+    def validate_sqlite_synchronous(cls, v):
+        """SQLite synchronous 설정 검증"""
+        valid_values = ["OFF", "NORMAL", "FULL", "EXTRA"]
+        if v.upper() not in valid_values:
+            raise ValueError(
+                f"Invalid SQLite synchronous. Must be one of: {valid_values}"
+            )
+        return v.upper()
+
     @field_validator("backend_port")
     @classmethod
     def validate_port(cls, v):
@@ -215,6 +423,3 @@ def validate_required_files():
             f"Please check your configuration and ensure these files exist."
         )
 
-
-# 애플리케이션 시작 시 디렉토리 생성
-create_directories()
@@ -0,0 +1,70 @@
+"""
+인메모리 캐시 모듈
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """스레드 안전한 TTL + LRU 인메모리 캐시
+
+    항목은 ttl초가 지나면 만료되며, maxsize를 넘으면 가장 오래 사용되지 않은
+    항목부터 제거됩니다. 프로세스 단위 캐시이므로 여러 워커 간에는 TTL이
+    최종 일관성을 보장합니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """캐시 조회 (만료되었거나 없으면 default 반환)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 항목 무효화"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 항목 무효화"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """캐시 적중 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
@@ -0,0 +1,34 @@
+"""
+조건부 요청(ETag / If-None-Match) 모듈
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response
+
+
+def weak_etag(*parts: Any) -> str:
+    """구성 요소를 해시하여 약한 ETag 생성 (W/"...")"""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """본문 없는 304 응답"""
+    return Response(status_code=304, headers={"ETag": etag})
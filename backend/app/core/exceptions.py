@@ -48,6 +48,24 @@ class InvalidScriptStatusError(BaseAppException):
         super().__init__(message, 400)
 
 
+class UploadLeaseConflictError(BaseAppException):
+    """다른 작업자가 이미 업로드 작업을 점유한 경우 발생하는 예외"""
+
+    def __init__(self, script_id: int):
+        super().__init__(
+            f"다른 작업자가 이미 업로드 중인 대본입니다. ID: {script_id}", 409
+        )
+
+
+class ScriptRestoreConflictError(BaseAppException):
+    """보관된 대본과 같은 ID의 대본이 이미 있어 복원할 수 없는 경우 발생하는 예외"""
+
+    def __init__(self, script_id: int):
+        super().__init__(
+            f"같은 ID의 대본이 이미 존재하여 복원할 수 없습니다. ID: {script_id}", 409
+        )
+
+
 class YouTubeAuthenticationError(BaseAppException):
     """YouTube API 인증 실패시 발생하는 예외"""
 
@@ -2,18 +2,171 @@
 로깅 설정 모듈
 """
 
+import atexit
+import json
 import logging
-import logging.config
+import logging.handlers
+import queue
+import random
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, List, Optional
 
 from ..config import get_settings
 
+# LogRecord 기본 속성 (그 외 속성은 extra로 간주하여 JSON에 포함)
+_RECORD_ATTRIBUTES = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# 실행 중인 QueueListener (재설정/종료 시 정리)
+_listeners: List[logging.handlers.QueueListener] = []
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 구조화 포매터
+
+    메시지의 따옴표/줄바꿈도 올바르게 이스케이프되며,
+    logger.info(..., extra={...})로 전달한 필드가 함께 기록됩니다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = record.stack_info
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """로거별 샘플링 필터
+
+    rates의 로거 이름 접두사(가장 긴 일치)에 해당하는 기록 중
+    min_level 미만은 비율만큼만 통과시킵니다. WARNING 이상은 항상 통과합니다.
+    """
+
+    def __init__(self, rates: Dict[str, float], min_level: int = logging.WARNING):
+        super().__init__()
+        self.rates = sorted(rates.items(), key=lambda item: -len(item[0]))
+        self.min_level = min_level
+
+    def _rate(self, name: str) -> float:
+        for prefix, rate in self.rates:
+            if name == prefix or name.startswith(prefix + "."):
+                return rate
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.min_level:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """프로세스 내 큐 전용 QueueHandler
+
+    메시지 인자만 미리 병합하고 포매팅(예외 traceback 포함)은
+    QueueListener 스레드의 핸들러에 맡깁니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            # traceback 객체가 프레임을 붙잡지 않도록 문자열로 고정
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _build_handlers(settings, log_dir: Path, today: str) -> Dict[str, logging.Handler]:
+    """실제 출력 핸들러 생성 (QueueListener 스레드에서만 호출됨)"""
+    detailed = logging.Formatter(
+        "[%(asctime)s] %(levelname)s in %(name)s (%(filename)s:%(lineno)d): %(message)s",
+        "%Y-%m-%d %H:%M:%S",
+    )
+    default = logging.Formatter(
+        "[%(asctime)s] %(levelname)s in %(module)s: %(message)s",
+        "%Y-%m-%d %H:%M:%S",
+    )
+    file_formatter = JsonFormatter() if settings.log_format == "json" else detailed
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(settings.log_level)
+    console.setFormatter(detailed if settings.debug else default)
+
+    handlers = {"console": console}
+    for name, level, filename in (
+        ("file", logging.INFO, f"app-{today}.log"),
+        ("error_file", logging.ERROR, f"error-{today}.log"),
+    ):
+        handler = logging.handlers.RotatingFileHandler(
+            log_dir / filename,
+            maxBytes=10485760,  # 10MB
+            backupCount=5,
+            encoding="utf8",
+        )
+        handler.setLevel(level)
+        handler.setFormatter(file_formatter)
+        handlers[name] = handler
+    return handlers
+
+
+def _queue_handler(
+    handlers: List[logging.Handler], sampling: Optional[SamplingFilter]
+) -> logging.Handler:
+    """핸들러 묶음을 QueueHandler/QueueListener 쌍으로 감쌈"""
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = LocalQueueHandler(log_queue)
+    if sampling is not None:
+        queue_handler.addFilter(sampling)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    _listeners.append(listener)
+    return queue_handler
+
+
+def shutdown_logging() -> None:
+    """QueueListener를 멈추고 큐에 남은 기록을 모두 출력"""
+    while _listeners:
+        listener = _listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
 
 def setup_logging():
-    """로깅 시스템 설정"""
+    """로깅 시스템 설정
+
+    요청 스레드/이벤트 루프는 QueueHandler로 큐에 넣기만 하고,
+    콘솔/파일 출력은 QueueListener 스레드에서 처리합니다.
+    """
     settings = get_settings()
+    shutdown_logging()
 
     # 로그 디렉토리 생성
     log_dir = Path("logs")
@@ -22,95 +175,38 @@ def setup_logging():
     # 현재 날짜로 로그 파일명 생성
     today = datetime.now().strftime("%Y-%m-%d")
 
-    logging_config = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "default": {
-                "format": "[%(asctime)s] %(levelname)s in %(module)s: %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S",
-            },
-            "detailed": {
-                "format": "[%(asctime)s] %(levelname)s in %(name)s (%(filename)s:%(lineno)d): %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S",
-            },
-            "json": {
-                "format": '{"time": "%(asctime)s", "level": "%(levelname)s", "module": "%(module)s", "message": "%(message)s"}',
-                "datefmt": "%Y-%m-%d %H:%M:%S",
-            },
-        },
-        "handlers": {
-            "console": {
-                "class": "logging.StreamHandler",
-                "level": settings.log_level,
-                "formatter": "default",
-                "stream": sys.stdout,
-            },
-            "file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "INFO",
-                "formatter": "detailed",
-                "filename": f"logs/app-{today}.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
-                "encoding": "utf8",
-            },
-            "error_file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "ERROR",
-                "formatter": "detailed",
-                "filename": f"logs/error-{today}.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
-                "encoding": "utf8",
-            },
-        },
-        "loggers": {
-            "": {  # root logger
-                "level": settings.log_level,
-                "handlers": ["console", "file", "error_file"],
-            },
-            "uvicorn": {
-                "level": "INFO",
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            "uvicorn.error": {
-                "level": "INFO",
-                "handlers": ["console", "file", "error_file"],
-                "propagate": False,
-            },
-            "uvicorn.access": {
-                "level": "INFO",
-                "handlers": ["file"],
-                "propagate": False,
-            },
-            "app": {
-                "level": settings.log_level,
-                "handlers": ["console", "file", "error_file"],
-                "propagate": False,
-            },
-            "app.services": {
-                "level": settings.log_level,
-                "handlers": ["console", "file", "error_file"],
-                "propagate": False,
-            },
-            "app.repositories": {
-                "level": settings.log_level,
-                "handlers": ["file"],
-                "propagate": False,
-            },
-        },
+    handlers = _build_handlers(settings, log_dir, today)
+    sampling = SamplingFilter(settings.log_sampling) if settings.log_sampling else None
+
+    # 로거마다 출력 대상이 달라 출력 조합별로 큐를 하나씩 사용
+    queues = {
+        "all": _queue_handler(
+            [handlers["console"], handlers["file"], handlers["error_file"]], sampling
+        ),
+        "server": _queue_handler([handlers["console"], handlers["file"]], sampling),
+        "file": _queue_handler([handlers["file"]], sampling),
+    }
+
+    loggers = {
+        "": (settings.log_level, "all"),
+        "uvicorn": ("INFO", "server"),
+        "uvicorn.error": ("INFO", "all"),
+        "uvicorn.access": ("INFO", "file"),
+        "app": (settings.log_level, "all"),
+        "app.services": (settings.log_level, "all"),
+        "app.repositories": (settings.log_level, "file"),
     }
+    for name, (level, target) in loggers.items():
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.setLevel(level)
+        logger.addHandler(queues[target])
+        if name:
+            logger.propagate = False
 
-    # 개발 모드에서는 더 자세한 로그
-    if settings.debug:
-        logging_config["loggers"][""]["level"] = "DEBUG"
-        logging_config["loggers"]["app"]["level"] = "DEBUG"
-        logging_config["loggers"]["app.services"]["level"] = "DEBUG"
-        logging_config["handlers"]["console"]["formatter"] = "detailed"
 
-    logging.config.dictConfig(logging_config)
+atexit.register(shutdown_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
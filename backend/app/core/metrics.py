@@ -0,0 +1,337 @@
+"""
+Prometheus 텍스트 형식 메트릭 모듈
+
+외부 의존성 없이 프로세스 내 Counter/Gauge/Histogram을 제공하고
+/metrics 엔드포인트에서 text exposition 형식으로 내보냅니다.
+"""
+
+import asyncio
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# 요청 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 전송 속도 버킷 (bytes/s, 128KB/s ~ 512MB/s)
+THROUGHPUT_BUCKETS = tuple(float(2**exp) for exp in range(17, 30, 2))
+# 이벤트 루프 지연 버킷 (초)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    """메트릭 공통 기반 (레이블별 값 보관)"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """text exposition 형식의 샘플 줄"""
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """모든 레이블 값 초기화"""
+        pass
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """현재 값 게이지 (collect 콜백으로 수집 시점에 값을 채울 수 있음)"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self, *args, collect: Optional[Callable[["Gauge"], None]] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.collect = collect
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> Iterable[str]:
+        if self.collect is not None:
+            self.collect(self)
+        return super().samples()
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = LATENCY_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블별 [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), []))
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = [
+                (key, list(counts), self._sums[key])
+                for key, counts in self._counts.items()
+            ]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.labelnames + ("le",), key + (_format_value(bound),)
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 text exposition 렌더링"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect=None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, collect=collect))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(
+            Histogram(name, documentation, labelnames, buckets=buckets)
+        )
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed"
+)
+video_ingest_bytes = registry.counter(
+    "video_ingest_bytes_total", "Bytes of video files received and stored"
+)
+video_ingest_seconds = registry.counter(
+    "video_ingest_seconds_total", "Time spent receiving and storing video files"
+)
+video_ingest_throughput = registry.histogram(
+    "video_ingest_throughput_bytes_per_second",
+    "Per-file video ingest throughput",
+    buckets=THROUGHPUT_BUCKETS,
+)
+youtube_upload_bytes = registry.counter(
+    "youtube_upload_bytes_total", "Bytes successfully uploaded to YouTube"
+)
+youtube_upload_seconds = registry.counter(
+    "youtube_upload_seconds_total", "Time spent on successful YouTube uploads"
+)
+youtube_upload_throughput = registry.histogram(
+    "youtube_upload_throughput_bytes_per_second",
+    "Per-video YouTube upload throughput",
+    buckets=THROUGHPUT_BUCKETS,
+)
+youtube_uploads = registry.counter(
+    "youtube_uploads_total",
+    "YouTube upload attempts by result and error class",
+    ("result", "error_class"),
+)
+event_loop_lag = registry.histogram(
+    "event_loop_lag_seconds", "Event loop scheduling delay", buckets=LAG_BUCKETS
+)
+event_loop_lag_current = registry.gauge(
+    "event_loop_lag_current_seconds", "Most recent event loop scheduling delay"
+)
+
+
+def observe_transfer(
+    total_bytes: Optional[int],
+    seconds: float,
+    bytes_counter: Counter,
+    seconds_counter: Counter,
+    throughput: Histogram,
+) -> None:
+    """전송 바이트/시간 누적 및 처리량(bytes/s) 기록"""
+    if not total_bytes or seconds <= 0:
+        return
+    bytes_counter.inc(total_bytes)
+    seconds_counter.inc(seconds)
+    throughput.observe(total_bytes / seconds)
+
+
+def register_pool_metrics(engine) -> Gauge:
+    """DB 커넥션 풀 사용량 게이지 등록 (스크레이프 시점에 수집)"""
+
+    def collect(gauge: Gauge) -> None:
+        pool = engine.pool
+        for state, method in (
+            ("size", "size"),
+            ("checked_out", "checkedout"),
+            ("checked_in", "checkedin"),
+            ("overflow", "overflow"),
+        ):
+            reader = getattr(pool, method, None)
+            if reader is not None:
+                gauge.set(reader(), state=state)
+
+    return registry.gauge(
+        "db_pool_connections",
+        "Database connection pool usage by state",
+        ("state",),
+        collect=collect,
+    )
+
+
+class EventLoopLagMonitor:
+    """이벤트 루프 지연 측정기
+
+    interval마다 sleep하고 예정 시각보다 늦게 깨어난 시간을 지연으로 기록합니다.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            event_loop_lag.observe(lag)
+            event_loop_lag_current.set(lag)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+event_loop_lag_monitor = EventLoopLagMonitor()
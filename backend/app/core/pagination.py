@@ -0,0 +1,44 @@
+"""
+커서(keyset) 페이지네이션 모듈
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from .exceptions import ValidationError
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+
+class KeysetPage(NamedTuple):
+    """커서 페이지 조회 결과"""
+
+    items: List[Any]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+def encode_cursor(direction: str, created_at: datetime, entity_id: int) -> str:
+    """(created_at, id) 정렬 키를 불투명한 커서 문자열로 인코딩"""
+    payload = json.dumps(
+        {"d": direction, "c": created_at.isoformat(), "i": entity_id},
+        separators=(",", ":"),
+    )
+    encoded = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+    return encoded.rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, datetime, int]:
+    """커서 문자열을 (방향, created_at, id)로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        direction = payload["d"]
+        if direction not in (CURSOR_NEXT, CURSOR_PREV):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValidationError(f"잘못된 페이지 커서입니다: {e}")
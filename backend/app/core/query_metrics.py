@@ -0,0 +1,169 @@
+"""
+요청 단위 SQL 계측 모듈
+
+SQLAlchemy 엔진 이벤트로 실행된 쿼리 수와 DB 시간을 현재 요청의
+QueryStats(ContextVar)에 기록하고, 라우트별로 집계합니다.
+"""
+
+import heapq
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 통계에 저장할 SQL 문 최대 길이
+MAX_STATEMENT_LENGTH = 300
+
+
+class QueryStats:
+    """한 요청 동안 실행된 쿼리 통계"""
+
+    def __init__(self, slowest_limit: int = 5):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_limit = slowest_limit
+        self._slowest: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """쿼리 1건 기록 (가장 느린 slowest_limit개만 유지)"""
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            item = (elapsed_ms, " ".join(statement.split())[:MAX_STATEMENT_LENGTH])
+            if len(self._slowest) < self.slowest_limit:
+                heapq.heappush(self._slowest, item)
+            elif item > self._slowest[0]:
+                heapq.heapreplace(self._slowest, item)
+
+    @property
+    def slowest(self) -> List[dict]:
+        """가장 느린 쿼리 목록 (느린 순)"""
+        with self._lock:
+            items = sorted(self._slowest, reverse=True)
+        return [
+            {"duration_ms": round(elapsed_ms, 2), "statement": statement}
+            for elapsed_ms, statement in items
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def start_request_stats(slowest_limit: int = 5) -> Tuple[QueryStats, object]:
+    """현재 컨텍스트에 새 QueryStats 설정
+
+    threadpool에서 실행되는 동기 라우트에도 컨텍스트가 복사되므로
+    같은 QueryStats 객체에 기록됩니다.
+
+    Returns:
+        (QueryStats, reset_request_stats에 전달할 토큰)
+    """
+    stats = QueryStats(slowest_limit)
+    return stats, _current_stats.set(stats)
+
+
+def reset_request_stats(token) -> None:
+    """start_request_stats 이전 상태로 복원"""
+    _current_stats.reset(token)
+
+
+def get_request_stats() -> Optional[QueryStats]:
+    """현재 요청의 QueryStats (요청 밖이면 None)"""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_times"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시간 정리
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_times"):
+        connection.info["query_start_times"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에 쿼리 시간 측정 이벤트 등록 (비동기 엔진은 sync_engine 전달)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class RouteQueryMetrics:
+    """라우트별 쿼리 통계 집계 (프로세스 단위)"""
+
+    def __init__(self, slowest_limit: int = 5):
+        self.slowest_limit = slowest_limit
+        self._routes: Dict[str, dict] = {}
+        self._slowest: List[Tuple[float, str, str]] = []
+        self._lock = threading.Lock()
+
+    def observe(self, route: str, stats: QueryStats, budget: int = 0) -> None:
+        """요청 1건의 QueryStats 반영"""
+        with self._lock:
+            entry = self._routes.setdefault(
+                route,
+                {
+                    "requests": 0,
+                    "queries": 0,
+                    "db_time_ms": 0.0,
+                    "max_queries": 0,
+                    "over_budget": 0,
+                },
+            )
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["db_time_ms"] += stats.total_ms
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            if budget and stats.count > budget:
+                entry["over_budget"] += 1
+
+            for slow in stats.slowest:
+                item = (slow["duration_ms"], route, slow["statement"])
+                if len(self._slowest) < self.slowest_limit:
+                    heapq.heappush(self._slowest, item)
+                elif item > self._slowest[0]:
+                    heapq.heapreplace(self._slowest, item)
+
+    def snapshot(self) -> dict:
+        """집계 결과 (라우트별 평균 포함)"""
+        with self._lock:
+            routes = {
+                route: {
+                    **entry,
+                    "db_time_ms": round(entry["db_time_ms"], 2),
+                    "avg_queries": round(entry["queries"] / entry["requests"], 2),
+                    "avg_db_time_ms": round(entry["db_time_ms"] / entry["requests"], 2),
+                }
+                for route, entry in self._routes.items()
+            }
+            slowest = [
+                {"duration_ms": elapsed_ms, "route": route, "statement": statement}
+                for elapsed_ms, route, statement in sorted(self._slowest, reverse=True)
+            ]
+        return {"routes": routes, "slowest": slowest}
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        with self._lock:
+            self._routes.clear()
+            self._slowest.clear()
+
+
+route_query_metrics = RouteQueryMetrics()
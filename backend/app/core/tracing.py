@@ -0,0 +1,452 @@
+"""
+요청 단위 경량 트레이싱 모듈
+
+ContextVar로 현재 span을 추적하여 라우터 → 서비스 → 리포지토리 →
+YouTube 매니저 호출 구간별 소요 시간을 기록합니다. 각 span에는 구간 동안
+실행된 SQL 쿼리 수/DB 시간이 함께 기록되므로 느린 업로드가 DB, 인증,
+discovery build, 전송 중 어디에서 시간을 썼는지 확인할 수 있습니다.
+
+트레이스는 루트 span이 끝날 때 백그라운드 스레드로 넘겨 JSONL 파일 또는
+OTLP/HTTP(JSON) 수집기로 내보냅니다.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .query_metrics import get_request_stats
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """트레이스의 한 구간"""
+
+    __slots__ = (
+        "name",
+        "trace",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_time",
+        "duration_ms",
+        "status",
+        "error",
+        "_started",
+        "_db_start",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace: "Trace",
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ):
+        self.name = name
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_time = time.time()
+        self.duration_ms = 0.0
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        stats = get_request_stats()
+        self._db_start = (stats.count, stats.total_ms) if stats else None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"[:500]
+
+    def finish(self) -> None:
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        stats = get_request_stats()
+        if stats is not None and self._db_start is not None:
+            count, total_ms = self._db_start
+            self.attributes["db.query_count"] = stats.count - count
+            self.attributes["db.time_ms"] = round(stats.total_ms - total_ms, 2)
+        self.trace.add(self)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": datetime.fromtimestamp(self.start_time, timezone.utc).isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class Trace:
+    """한 트레이스에서 끝난 span 모음
+
+    스레드풀에서 실행되는 동기 코드도 같은 Trace에 span을 추가하므로
+    잠금으로 보호합니다.
+    """
+
+    def __init__(self, trace_id: str, sampled: bool):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """현재 컨텍스트의 span (트레이스 밖이면 None)"""
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """현재 컨텍스트의 트레이스 ID"""
+    active = _current_span.get()
+    return active.trace_id if active is not None else None
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """W3C traceparent 헤더에서 (trace_id, parent_span_id, sampled) 추출"""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, parent_id = parts[1].lower(), parts[2].lower()
+    try:
+        int(trace_id, 16), int(parent_id, 16)
+        flags = int(parts[3], 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(flags & 0x01)
+
+
+class SpanExporter(ABC):
+    """끝난 트레이스를 외부로 내보내는 기본 클래스"""
+
+    @abstractmethod
+    def export(self, spans: List[dict]) -> None:
+        """끝난 트레이스의 span 목록 내보내기"""
+        pass
+
+    def close(self) -> None:
+        """내보내기 자원 정리"""
+        pass
+
+
+class JsonlSpanExporter(SpanExporter):
+    """span을 한 줄에 하나씩 JSON으로 파일에 추가"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def export(self, spans: List[dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = "".join(
+            json.dumps(span, ensure_ascii=False, default=str) + "\n" for span in spans
+        )
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """OTLP/HTTP JSON 형식으로 수집기에 전송 (예: http://localhost:4318/v1/traces)"""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: List[dict]) -> None:
+        body = json.dumps(self.to_otlp(spans), default=str).encode("utf-8")
+        request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def to_otlp(self, spans: List[dict]) -> dict:
+        """JSONL span 목록을 OTLP ExportTraceServiceRequest 형식으로 변환"""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            _otlp_attribute("service.name", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app.core.tracing"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: dict) -> dict:
+    start_ns = int(datetime.fromisoformat(span["start"]).timestamp() * 1e9)
+    otlp = {
+        "traceId": span["trace_id"],
+        "spanId": span["span_id"],
+        "name": span["name"],
+        # SPAN_KIND_INTERNAL
+        "kind": 1,
+        "startTimeUnixNano": str(start_ns),
+        "endTimeUnixNano": str(start_ns + int(span["duration_ms"] * 1e6)),
+        "attributes": [
+            _otlp_attribute(key, value) for key, value in span["attributes"].items()
+        ],
+        # STATUS_CODE_OK / STATUS_CODE_ERROR
+        "status": (
+            {"code": 2, "message": span["error"] or ""}
+            if span["status"] == "error"
+            else {"code": 1}
+        ),
+    }
+    if span["parent_id"]:
+        otlp["parentSpanId"] = span["parent_id"]
+    return otlp
+
+
+class Tracer:
+    """트레이스 생성, 샘플링, 백그라운드 내보내기 관리
+
+    span 기록은 메모리에만 쌓고, 루트 span이 끝나면 트레이스 전체를 큐에
+    넣습니다. 파일/네트워크 쓰기는 백그라운드 스레드가 처리하므로 요청
+    경로(이벤트 루프 포함)를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_rate: float = 1.0,
+        max_queue: int = 1000,
+    ):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.exported = 0
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[List[dict]]]" = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(
+        self, exporter: Optional[SpanExporter], sample_rate: float = 1.0
+    ) -> None:
+        """내보내기 대상과 샘플링 비율 교체 (기존 큐는 먼저 비움)"""
+        self.shutdown()
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @contextmanager
+    def start_trace(
+        self, name: str, traceparent: Optional[str] = None, **attributes
+    ) -> Iterator[Span]:
+        """루트 span을 열고 끝나면 트레이스를 내보내기 큐에 추가
+
+        traceparent가 유효하면 상위 서비스의 트레이스를 이어받으며, 이 경우
+        샘플링 여부도 상위 결정을 따릅니다.
+        """
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = os.urandom(16).hex(), None
+            sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+
+        trace = Trace(trace_id, sampled=sampled and self.enabled)
+        root = Span(name, trace, parent_id, attributes)
+        token = _current_span.set(root)
+        try:
+            yield root
+        except BaseException as e:
+            root.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            root.finish()
+            if trace.sampled:
+                self._enqueue([span.to_dict() for span in trace.spans])
+
+    def _enqueue(self, spans: List[dict]) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="trace-exporter", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            # 쌓인 트레이스를 모아서 한 번에 내보냄
+            batch = list(spans)
+            stop = False
+            while True:
+                try:
+                    more = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    stop = True
+                    break
+                batch.extend(more)
+            self._export(batch)
+            if stop:
+                return
+
+    def _export(self, spans: List[dict]) -> None:
+        exporter = self.exporter
+        if exporter is None:
+            return
+        try:
+            exporter.export(spans)
+            self.exported += len(spans)
+        except Exception as e:
+            self.dropped += len(spans)
+            logger.warning(f"트레이스 내보내기 실패 ({len(spans)} spans): {e}")
+
+    def shutdown(self) -> None:
+        """큐에 남은 트레이스를 내보내고 백그라운드 스레드 종료"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=10)
+        if self.exporter is not None:
+            self.exporter.close()
+
+
+tracer = Tracer()
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """현재 트레이스 아래에 하위 span 기록
+
+    활성 트레이스가 없거나 샘플링되지 않았으면 아무것도 기록하지 않으므로
+    백그라운드 작업이나 CLI에서 호출해도 비용이 거의 없습니다.
+    """
+    parent = _current_span.get()
+    if parent is None or not parent.trace.sampled:
+        yield None
+        return
+
+    child = Span(name, parent.trace, parent.span_id, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.finish()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 실행 구간을 span으로 기록하는 데코레이터 (동기/비동기 모두 지원)
+
+    functools.wraps로 시그니처를 유지하므로 FastAPI 엔드포인트에도 사용할 수
+    있습니다.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def build_exporter(settings) -> Optional[SpanExporter]:
+    """설정(TRACING_EXPORTER)에 맞는 내보내기 생성"""
+    if not settings.tracing_enabled or settings.tracing_exporter == "none":
+        return None
+    if settings.tracing_exporter == "otlp":
+        return OtlpHttpSpanExporter(
+            settings.tracing_otlp_endpoint, service_name=settings.app_name
+        )
+    return JsonlSpanExporter(settings.tracing_export_path)
+
+
+def configure_tracing(settings) -> None:
+    """전역 tracer를 설정값으로 초기화"""
+    tracer.configure(build_exporter(settings), settings.tracing_sample_rate)
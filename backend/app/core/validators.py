@@ -72,9 +72,13 @@ class ScriptDataValidator:
     """대본 데이터 검증기"""
 
     @staticmethod
-    def validate_parsed_script_data(parsed_data: dict) -> None:
-        """파싱된 대본 데이터 검증"""
-        required_fields = ["content", "title"]
+    def validate_parsed_script_data(parsed_data: dict, required: bool = True) -> None:
+        """파싱된 대본 데이터 검증
+
+        required=False이면 필수 필드 누락은 허용하고 값이 있는 필드만
+        검증합니다 (기존 대본의 일부 컬럼 갱신용).
+        """
+        required_fields = ["content", "title"] if required else []
 
         for field in required_fields:
             if not parsed_data.get(field):
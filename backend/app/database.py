@@ -1,11 +1,152 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./youtube_automation.db"
+from .config import Settings, get_settings
+from .core.query_metrics import instrument_engine
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# 동기 드라이버 -> 비동기 드라이버 매핑
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return _is_sqlite(url) and (":memory:" in url or url.rstrip("/") == "sqlite:")
+
+
+def _engine_kwargs(url: str, settings: Settings) -> dict:
+    """데이터베이스 종류별 엔진 옵션"""
+    if _is_sqlite(url):
+        engine_kwargs = {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": settings.sqlite_busy_timeout_ms / 1000,
+            }
+        }
+        if _is_sqlite_memory(url):
+            # 인메모리 DB는 커넥션마다 별도 DB가 생성되므로 단일 커넥션 공유
+            engine_kwargs["poolclass"] = StaticPool
+        return engine_kwargs
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+def create_db_engine(settings: Settings) -> Engine:
+    """설정 기반 데이터베이스 엔진 생성
+
+    SQLite는 WAL 저널과 PRAGMA 튜닝을 적용하고,
+    그 외 데이터베이스(PostgreSQL 등)는 커넥션 풀 크기를 설정합니다.
+    """
+    url = settings.database_url
+    engine = create_engine(url, echo=settings.db_echo, **_engine_kwargs(url, settings))
+
+    if _is_sqlite(url):
+        _configure_sqlite_pragmas(engine, settings)
+
+    if settings.sql_metrics_enabled:
+        instrument_engine(engine)
+
+    return engine
+
+
+def to_async_url(url: str) -> str:
+    """동기 DATABASE_URL을 비동기 드라이버 URL로 변환"""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(settings: Settings):
+    """설정 기반 비동기 데이터베이스 엔진 생성 (aiosqlite / asyncpg)"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = settings.database_url
+    engine = create_async_engine(
+        to_async_url(url), echo=settings.db_echo, **_engine_kwargs(url, settings)
+    )
+
+    if _is_sqlite(url):
+        _configure_sqlite_pragmas(engine.sync_engine, settings)
+
+    if settings.sql_metrics_enabled:
+        instrument_engine(engine.sync_engine)
+
+    return engine
+
+
+def _configure_sqlite_pragmas(engine: Engine, settings: Settings) -> None:
+    """커넥션 생성 시 SQLite PRAGMA 적용"""
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            # WAL: 읽기와 쓰기가 서로를 막지 않음 (database is locked 방지)
+            cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+            cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+            cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
+            # 음수 cache_size는 KiB 단위
+            cursor.execute(f"PRAGMA cache_size=-{settings.sqlite_cache_size_kb}")
+            cursor.execute(
+                f"PRAGMA mmap_size={settings.sqlite_mmap_size_mb * 1024 * 1024}"
+            )
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA foreign_keys=ON")
+        finally:
+            cursor.close()
+
+
+def get_engine_stats(engine: Engine) -> dict:
+    """엔진 및 커넥션 풀 상태 조회"""
+    pool = engine.pool
+    stats = {
+        "dialect": engine.dialect.name,
+        "driver": engine.dialect.driver,
+        "url": engine.url.render_as_string(hide_password=True),
+        "pool": {"class": type(pool).__name__, "status": pool.status()},
+    }
+
+    if isinstance(pool, QueuePool):
+        stats["pool"].update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+
+    if engine.dialect.name == "sqlite":
+        pragmas = {}
+        with engine.connect() as connection:
+            for name in (
+                "journal_mode",
+                "synchronous",
+                "busy_timeout",
+                "cache_size",
+                "mmap_size",
+            ):
+                pragmas[name] = connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+        stats["sqlite_pragmas"] = pragmas
+
+    return stats
+
+
+engine = create_db_engine(get_settings())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -18,3 +159,43 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_session_factory() -> sessionmaker:
+    """세션 팩토리 의존성
+
+    StreamingResponse처럼 응답 전송 중에 DB를 읽어야 하는 경우,
+    요청 의존성 세션은 응답 전에 닫히므로 스트림이 직접 세션을 엽니다.
+    """
+    return SessionLocal
+
+
+# 비동기 엔진은 async 라우트가 처음 사용할 때 생성합니다.
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine():
+    """비동기 엔진 반환 (최초 호출 시 생성)"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(get_settings())
+    return _async_engine
+
+
+def get_async_session_factory():
+    """비동기 세션 팩토리 반환"""
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def get_async_db():
+    """비동기 데이터베이스 세션 의존성 (async def 라우트용)"""
+    async with get_async_session_factory()() as db:
+        yield db
@@ -1,33 +1,101 @@
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from sqlalchemy.orm import Session
 
-from .config import get_settings
-from .core.logging import configure_logging, get_logger
-from .database import SessionLocal, engine, get_db
+from .config import create_directories, get_settings
+from .core.logging import configure_logging, get_logger, shutdown_logging
+from .core.metrics import event_loop_lag_monitor, register_pool_metrics, registry
+from .core.query_metrics import route_query_metrics
+from .core.tracing import configure_tracing, tracer
+from .database import SessionLocal, engine, get_db, get_engine_stats
+from .middleware.compression import CompressionMiddleware
 from .middleware.error_handler import ErrorHandlerMiddleware
-from .models import script
+from .middleware.metrics import MetricsMiddleware
+from .middleware.query_metrics import QueryMetricsMiddleware
+from .middleware.tracing import TracingMiddleware
+from .models import archived_script, script, tag, upload_log
+from .repositories.script_repository import script_cache, statistics_cache
 from .routers import scripts
+from .services.script_archiver import script_archiver
+from .services.upload_event_log import upload_event_log
+from .services.youtube.token_refresher import token_refresher
 
-# 로깅 시스템 초기화
-configure_logging()
 logger = get_logger("main")
 
 # 설정 로드
 settings = get_settings()
 
-# 데이터베이스 테이블 생성
-script.Base.metadata.create_all(bind=engine)
+
+def initialize_application() -> None:
+    """로깅, 디렉토리, 데이터베이스 테이블 초기화
+
+    import 시점이 아니라 lifespan 시작 시 실행하여 워커/CLI/테스트의
+    import 비용을 줄입니다.
+    """
+    configure_logging()
+    configure_tracing(settings)
+    create_directories()
+    script.Base.metadata.create_all(bind=engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 처리"""
+    initialize_application()
+    if settings.archive_after_days > 0:
+        script_archiver.start()
+    if settings.metrics_enabled:
+        event_loop_lag_monitor.interval = settings.event_loop_lag_interval_seconds
+        event_loop_lag_monitor.start()
+    if settings.token_refresh_enabled:
+        token_refresher.start()
+    yield
+    token_refresher.stop()
+    await event_loop_lag_monitor.stop()
+    script_archiver.stop()
+    # 버퍼에 남은 업로드 이벤트 기록
+    upload_event_log.close()
+    # 큐에 남은 트레이스 내보내기
+    tracer.shutdown()
+    # 큐에 남은 로그 출력
+    shutdown_logging()
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.app_name,
     version=settings.app_version,
     description=settings.app_description,
+    # 한글 본문이 많은 목록 응답을 빠르게 직렬화
+    default_response_class=ORJSONResponse,
 )
 
 # 에러 핸들링 미들웨어 추가
 app.add_middleware(ErrorHandlerMiddleware)
 
+# 요청 트레이싱 (에러 응답에도 X-Trace-Id를 붙이도록 에러 핸들러 바깥쪽에 위치)
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+
+# 요청별 SQL 계측 미들웨어 (에러 응답까지 집계하도록 바깥쪽에 위치)
+app.add_middleware(QueryMetricsMiddleware)
+
+# 응답 압축 (COMPRESSION_MINIMUM_SIZE 이상)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    compresslevel=settings.gzip_compression_level,
+    brotli_quality=settings.brotli_quality,
+)
+
+# 요청 지연 시간/처리 중 요청 수 메트릭
+if settings.metrics_enabled:
+    register_pool_metrics(engine)
+    app.add_middleware(MetricsMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +103,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # ETag: 프론트엔드 폴링의 조건부 요청(If-None-Match)에 사용
+    # X-Trace-Id: 느린 요청을 트레이스 파일에서 찾을 때 사용
+    expose_headers=["ETag", "X-Trace-Id"],
 )
 
 # 라우터 등록
@@ -66,7 +137,13 @@ def health_check(db: Session = Depends(get_db)):
         db.execute(text("SELECT 1"))
 
         logger.info("헬스체크 성공")
-        return {"status": "healthy", "database": "connected", "api": "operational"}
+        return {
+            "status": "healthy",
+            "database": "connected",
+            "api": "operational",
+            # 토큰 문제는 업로드만 막으므로 전체 상태(503)에는 반영하지 않음
+            "youtube_token": token_refresher.health(),
+        }
     except Exception as e:
         logger.error(f"헬스체크 실패: {str(e)}")
         raise HTTPException(
@@ -74,19 +151,46 @@ def health_check(db: Session = Depends(get_db)):
         )
 
 
-@app.get("/api/scripts")
-def get_scripts(db: Session = Depends(get_db)):
-    """등록된 대본 목록 조회 (레거시 엔드포인트)"""
+@app.get("/health/database")
+def database_stats():
+    """데이터베이스 엔진 및 커넥션 풀 상태 조회"""
     try:
-        from .models.script import Script
+        return get_engine_stats(engine)
+    except Exception as e:
+        logger.error(f"데이터베이스 상태 조회 실패: {str(e)}")
+        raise HTTPException(
+            status_code=503, detail=f"Database stats unavailable: {str(e)}"
+        )
 
-        scripts = db.query(Script).all()
-        logger.info(f"레거시 대본 목록 조회: {len(scripts)}개")
 
-        return {"scripts": scripts, "count": len(scripts)}
-    except Exception as e:
-        logger.error(f"레거시 대본 목록 조회 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
+@app.get("/health/cache")
+def cache_stats():
+    """인메모리 캐시 적중 통계 조회"""
+    return {
+        "scripts": script_cache.stats(),
+        "statistics": statistics_cache.stats(),
+    }
+
+
+@app.get("/health/queries")
+def query_stats():
+    """라우트별 SQL 쿼리 수/DB 시간 집계 조회"""
+    return {
+        "enabled": settings.sql_metrics_enabled,
+        "budget_default": settings.query_budget_default,
+        "budgets": settings.query_budgets,
+        **route_query_metrics.snapshot(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 메트릭 (text exposition 형식)"""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics disabled")
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
 
 
 if __name__ == "__main__":
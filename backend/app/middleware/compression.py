@@ -0,0 +1,58 @@
+"""
+응답 압축 미들웨어 (순수 ASGI)
+
+Accept-Encoding에 br이 있고 brotli 패키지가 설치되어 있으면 brotli로,
+그 외에는 gzip으로 압축합니다. minimum_size보다 작은 응답은 압축하지 않습니다.
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성
+    brotli = None
+
+
+class BrotliResponder(IdentityResponder):
+    """brotli 스트리밍 압축 응답기"""
+
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4):
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        if more_body:
+            # 스트리밍 응답은 청크마다 내보내야 클라이언트가 바로 받을 수 있음
+            return compressed + self.compressor.flush()
+        return compressed + self.compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """brotli 우선, gzip 대체 응답 압축 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compresslevel: int = 6,
+        brotli_quality: int = 4,
+    ):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and brotli is not None:
+            accept_encoding = Headers(scope=scope).get("Accept-Encoding", "")
+            if "br" in accept_encoding:
+                responder = BrotliResponder(
+                    self.app, self.minimum_size, quality=self.brotli_quality
+                )
+                await responder(scope, receive, send)
+                return
+
+        await super().__call__(scope, receive, send)
@@ -4,52 +4,80 @@
 
 import logging
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..core.exceptions import BaseAppException
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """전역 에러 핸들링 미들웨어"""
+class ErrorHandlerMiddleware:
+    """전역 에러 핸들링 미들웨어 (순수 ASGI)
+
+    응답 메시지를 그대로 전달하므로 스트리밍 응답과 파일 다운로드를
+    버퍼링하지 않습니다. 응답이 이미 시작된 뒤 발생한 예외는 에러 응답으로
+    바꿀 수 없으므로 로그만 남기고 서버로 전파합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next):
         try:
-            response = await call_next(request)
-            return response
-        except BaseAppException as e:
-            logger.warning(f"Application error: {e.message}")
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if response_started:
+                logger.error(f"Error after response started: {str(e)}", exc_info=True)
+                raise
+            response = self._error_response(e)
+            await response(scope, receive, send)
+
+    @staticmethod
+    def _error_response(exc: Exception) -> JSONResponse:
+        """예외를 표준 JSON 에러 응답으로 변환"""
+        if isinstance(exc, BaseAppException):
+            logger.warning(f"Application error: {exc.message}")
             return JSONResponse(
-                status_code=e.status_code,
+                status_code=exc.status_code,
                 content={
                     "error": "Application Error",
-                    "message": e.message,
-                    "status_code": e.status_code,
+                    "message": exc.message,
+                    "status_code": exc.status_code,
                 },
             )
-        except HTTPException as e:
-            logger.warning(f"HTTP error: {e.detail}")
+        if isinstance(exc, HTTPException):
+            logger.warning(f"HTTP error: {exc.detail}")
             return JSONResponse(
-                status_code=e.status_code,
+                status_code=exc.status_code,
                 content={
                     "error": "HTTP Error",
-                    "message": e.detail,
-                    "status_code": e.status_code,
-                },
-            )
-        except Exception as e:
-            logger.error(f"Unhandled error: {str(e)}", exc_info=True)
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "Internal Server Error",
-                    "message": "예기치 않은 오류가 발생했습니다.",
-                    "status_code": 500,
+                    "message": exc.detail,
+                    "status_code": exc.status_code,
                 },
             )
+        logger.error(f"Unhandled error: {str(exc)}", exc_info=True)
+        return JSONResponse(
+            status_code=500,
+            content={
+                "error": "Internal Server Error",
+                "message": "예기치 않은 오류가 발생했습니다.",
+                "status_code": 500,
+            },
+        )
 
 
 def create_error_response(message: str, status_code: int = 400) -> JSONResponse:
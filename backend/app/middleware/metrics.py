@@ -0,0 +1,46 @@
+"""
+HTTP 요청 메트릭 미들웨어 (순수 ASGI)
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.metrics import http_request_duration, http_requests_in_flight
+
+# 라우트에 매칭되지 않은 요청(404 등)은 경로별 레이블을 만들지 않음
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """라우트 템플릿별 지연 시간 히스토그램과 처리 중 요청 수 기록"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=route.path if route is not None else UNMATCHED_ROUTE,
+                status=str(status_code),
+            )
@@ -0,0 +1,68 @@
+"""
+요청 단위 SQL 계측 미들웨어 (순수 ASGI)
+"""
+
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import get_settings
+from ..core.query_metrics import (
+    reset_request_stats,
+    route_query_metrics,
+    start_request_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class QueryMetricsMiddleware:
+    """요청별 쿼리 수/DB 시간 집계 및 쿼리 예산 초과 경고
+
+    디버그 모드에서는 X-DB-Query-Count, X-DB-Time-Ms 헤더를 추가합니다.
+    헤더는 응답 시작 시점 기준이므로 스트리밍 본문 생성 중 실행된 쿼리는
+    헤더에는 빠지고 집계에는 포함됩니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.settings = get_settings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.settings.sql_metrics_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request_stats(self.settings.sql_slowest_statements)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.settings.debug:
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-time-ms", f"{stats.total_ms:.2f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            reset_request_stats(token)
+            self._observe(scope, stats)
+
+    def _observe(self, scope: Scope, stats) -> None:
+        route = scope.get("route")
+        # 라우트가 없는 요청(404 등)은 경로 수가 무한하므로 집계하지 않음
+        if route is None:
+            return
+
+        key = f"{scope['method']} {route.path}"
+        budget = self.settings.query_budgets.get(
+            key, self.settings.query_budget_default
+        )
+        route_query_metrics.observe(key, stats, budget)
+
+        if budget and stats.count > budget:
+            logger.warning(
+                f"쿼리 예산 초과: {key} queries={stats.count} (budget={budget}), "
+                f"db_time={stats.total_ms:.1f}ms, slowest={stats.slowest[:1]}"
+            )
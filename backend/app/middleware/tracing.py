@@ -0,0 +1,56 @@
+"""
+요청 트레이싱 미들웨어 (순수 ASGI)
+"""
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.tracing import Tracer
+from ..core.tracing import tracer as default_tracer
+
+TRACE_ID_HEADER = b"x-trace-id"
+
+
+class TracingMiddleware:
+    """요청마다 루트 span을 열고 응답 헤더에 X-Trace-Id 추가
+
+    요청의 traceparent 헤더가 유효하면 상위 트레이스를 이어받습니다.
+    루트 span 이름은 라우트 매칭 후 "GET /api/scripts/{script_id}"처럼
+    라우트 템플릿으로 바뀌므로 경로 수만큼 이름이 늘어나지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer = default_tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        traceparent = Headers(scope=scope).get("traceparent")
+
+        with self.tracer.start_trace(
+            f"{method} unmatched",
+            traceparent,
+            **{"http.method": method, "http.target": scope["path"]},
+        ) as root:
+
+            async def send_with_trace_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    root.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        root.status = "error"
+                    headers = list(message.get("headers", []))
+                    headers.append((TRACE_ID_HEADER, root.trace_id.encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    root.name = f"{method} {route.path}"
+                    root.set_attribute("http.route", route.path)
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from ..database import Base
+
+
+class ArchivedScript(Base):
+    """보관된 대본 (오래된 업로드 완료 대본)
+
+    scripts 테이블과 같은 ID를 유지하므로 복원 시 기존 링크가 그대로 유효합니다.
+    버전/임대 컬럼은 업로드 작업에만 필요하므로 보관하지 않습니다.
+    """
+
+    __tablename__ = "archived_scripts"
+    __table_args__ = (
+        Index("ix_archived_scripts_youtube_video_id", "youtube_video_id", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String(255), nullable=False)
+    content = Column(Text, nullable=False)
+    description = Column(Text)
+    tags = Column(Text)
+    thumbnail_text = Column(String(100))
+    imagefx_prompt = Column(Text)
+    status = Column(String(20))
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    video_file_path = Column(String(500))
+    youtube_video_id = Column(String(50))
+    scheduled_time = Column(DateTime)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<ArchivedScript(id={self.id}, title='{self.title}')>"
+
+
+# scripts <-> archived_scripts 사이에서 이동하는 컬럼
+ARCHIVED_COLUMNS = [
+    column.name
+    for column in ArchivedScript.__table__.columns
+    if column.name != "archived_at"
+]
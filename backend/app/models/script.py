@@ -1,12 +1,33 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
 
 from ..database import Base
 
 
 class Script(Base):
     __tablename__ = "scripts"
+    __table_args__ = (
+        # 상태 필터 + 시간순 정렬 조회용 복합 인덱스
+        Index("ix_scripts_status_created_at", "status", "created_at"),
+        Index("ix_scripts_status_updated_at", "status", "updated_at"),
+        # 목록 ETag의 MAX(updated_at) 조회용
+        Index("ix_scripts_updated_at", "updated_at"),
+        Index("ix_scripts_youtube_video_id", "youtube_video_id", unique=True),
+        # 보관(archived_scripts)으로 옮긴 대본의 ID를 새 대본이 재사용하지 않도록
+        # SQLite rowid 재사용을 막음 (마이그레이션 6d2f8b3e1a74)
+        {"sqlite_autoincrement": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -22,5 +43,64 @@ class Script(Base):
     youtube_video_id = Column(String(50))
     scheduled_time = Column(DateTime)
 
+    # 낙관적 잠금 버전 및 업로드 작업 임대(lease)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    lease_owner = Column(String(100))
+    lease_expires_at = Column(DateTime)
+
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self):
         return f"<Script(id={self.id}, title='{self.title}', status='{self.status}')>"
+
+
+# ===========================================
+# SQLite FTS5 전문 검색 인덱스
+# ===========================================
+# scripts 테이블을 외부 콘텐츠로 사용하는 FTS5 가상 테이블과 동기화 트리거.
+# Alembic 마이그레이션(7a4d2e9c1b05, 9c3e5f1a7b26)과 동일한 DDL을 유지해야 합니다.
+# 띄어쓰기 단위 토큰은 조사가 붙은 한국어("할머니의")를 단어 중간에서 찾지 못하므로
+# 3글자 단위 trigram 토크나이저(SQLite 3.34 이상)를 사용합니다.
+SCRIPT_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS scripts_fts USING fts5(
+        title, description, tags, content,
+        content='scripts', content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scripts_fts_ai AFTER INSERT ON scripts BEGIN
+        INSERT INTO scripts_fts(rowid, title, description, tags, content)
+        VALUES (new.id, new.title, new.description, new.tags, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scripts_fts_ad AFTER DELETE ON scripts BEGIN
+        INSERT INTO scripts_fts(scripts_fts, rowid, title, description, tags, content)
+        VALUES ('delete', old.id, old.title, old.description, old.tags, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scripts_fts_au
+    AFTER UPDATE OF title, description, tags, content ON scripts BEGIN
+        INSERT INTO scripts_fts(scripts_fts, rowid, title, description, tags, content)
+        VALUES ('delete', old.id, old.title, old.description, old.tags, old.content);
+        INSERT INTO scripts_fts(rowid, title, description, tags, content)
+        VALUES (new.id, new.title, new.description, new.tags, new.content);
+    END
+    """,
+]
+
+for statement in SCRIPT_FTS_DDL:
+    event.listen(
+        Script.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    Script.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS scripts_fts").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Table
+
+from ..database import Base
+
+
+class Tag(Base):
+    """정규화된 태그"""
+
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False, unique=True, index=True)
+
+    def __repr__(self):
+        return f"<Tag(id={self.id}, name='{self.name}')>"
+
+
+# 대본-태그 연결 테이블 (position은 원래 태그 순서)
+script_tags = Table(
+    "script_tags",
+    Base.metadata,
+    Column(
+        "script_id",
+        Integer,
+        ForeignKey("scripts.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
+    ),
+    Column("position", Integer, nullable=False, default=0),
+    # 태그 -> 대본 조회용 (기본 키는 대본 -> 태그 방향)
+    Index("ix_script_tags_tag_id_script_id", "tag_id", "script_id"),
+)
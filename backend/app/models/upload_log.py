@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, Index, Integer, String, Text
+
+from ..database import Base
+
+# 업로드 이벤트 종류
+EVENT_VIDEO_ATTACHED = "video_attached"
+EVENT_VIDEO_DELETED = "video_deleted"
+EVENT_YOUTUBE_UPLOADED = "youtube_uploaded"
+EVENT_YOUTUBE_FAILED = "youtube_failed"
+
+
+class UploadLog(Base):
+    """업로드 이벤트 로그 (추가 전용)
+
+    대본 삭제 후에도 이력이 남도록 scripts에 외래 키를 두지 않습니다.
+    """
+
+    __tablename__ = "upload_logs"
+    __table_args__ = (
+        # 일자별 집계 조회용 인덱스
+        Index("ix_upload_logs_created_at_event", "created_at", "event"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    script_id = Column(Integer, nullable=False, index=True)
+    event = Column(String(30), nullable=False)
+    from_status = Column(String(20))
+    to_status = Column(String(20))
+    duration_ms = Column(Float)
+    bytes = Column(BigInteger)
+    youtube_video_id = Column(String(50))
+    lease_owner = Column(String(100))
+    error_type = Column(String(100))
+    error_message = Column(Text)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<UploadLog(id={self.id}, script_id={self.script_id}, event='{self.event}')>"
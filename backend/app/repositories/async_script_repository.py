@@ -0,0 +1,213 @@
+"""
+Script 엔티티에 대한 비동기 Repository 구현체
+
+async def 라우트에서 이벤트 루프를 막지 않도록 AsyncSession을 사용합니다.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, func
+from sqlalchemy import inspect as inspect_entity
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.tracing import traced
+from ..models.script import Script
+from .script_repository import (
+    claimable_condition,
+    invalidate_script_caches,
+    lease_values,
+    script_cache,
+    snapshot_script,
+)
+from .tag_repository import TagRepository
+
+
+class AsyncScriptRepository:
+    """Script 비동기 Repository
+
+    ScriptRepository의 주요 메서드에 대한 비동기 버전입니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.model = Script
+
+    def _invalidate_caches(self, *script_ids: int) -> None:
+        """쓰기 작업 후 파생 캐시 무효화"""
+        invalidate_script_caches(*script_ids)
+
+    async def _replace_tags(self, entity: Script) -> None:
+        """태그 연결 교체 (동기 TagRepository를 같은 트랜잭션에서 실행)"""
+        tags_by_script = {entity.id: entity.tags}
+        await self.db.run_sync(
+            lambda session: TagRepository(session).replace_script_tags(tags_by_script)
+        )
+
+    @traced()
+    async def create(self, entity: Script) -> Script:
+        """대본 생성 (태그 연결 포함 단일 트랜잭션)"""
+        self.db.add(entity)
+        await self.db.flush()
+        await self._replace_tags(entity)
+        await self.db.commit()
+        await self.db.refresh(entity)
+        self._invalidate_caches()
+        return entity
+
+    @traced()
+    async def get_by_id(
+        self, entity_id: int, use_cache: bool = False
+    ) -> Optional[Script]:
+        """ID로 대본 조회 (캐시 사용 기준은 ScriptRepository.get_by_id와 동일)"""
+        if use_cache:
+            snapshot = script_cache.get(entity_id)
+            if snapshot is not None:
+                return await self.db.merge(snapshot, load=False)
+
+        script = await self.db.get(self.model, entity_id)
+        if script is not None:
+            script_cache.set(entity_id, snapshot_script(script))
+        return script
+
+    @traced()
+    async def update(self, entity: Script) -> Script:
+        """대본 수정 (태그가 바뀐 경우 태그 연결도 교체)"""
+        self._invalidate_caches(entity.id)
+        if inspect_entity(entity).attrs.tags.history.has_changes():
+            await self._replace_tags(entity)
+        await self.db.commit()
+        await self.db.refresh(entity)
+        self._invalidate_caches(entity.id)
+        return entity
+
+    @traced()
+    async def delete(self, entity_id: int) -> bool:
+        """대본 삭제"""
+        entity = await self.get_by_id(entity_id)
+        if entity:
+            await self.db.run_sync(
+                lambda session: TagRepository(session).delete_script_tags([entity_id])
+            )
+            await self.db.delete(entity)
+            await self.db.commit()
+            self._invalidate_caches(entity_id)
+            return True
+        return False
+
+    async def get_by_status(
+        self, status: str, skip: int = 0, limit: int = 100
+    ) -> List[Script]:
+        """상태별 대본 조회"""
+        result = await self.db.execute(
+            select(self.model)
+            .where(self.model.status == status)
+            .order_by(self.model.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_youtube_id(self, youtube_video_id: str) -> Optional[Script]:
+        """YouTube 비디오 ID로 대본 조회"""
+        result = await self.db.execute(
+            select(self.model).where(self.model.youtube_video_id == youtube_video_id)
+        )
+        return result.scalars().first()
+
+    @traced()
+    async def get_tag_names(self, script_id: int) -> List[str]:
+        """대본의 태그 목록 (원래 순서)"""
+        return await self.db.run_sync(
+            lambda session: TagRepository(session).get_tag_names(script_id)
+        )
+
+    async def count_by_status(self, status: str) -> int:
+        """상태별 대본 개수"""
+        result = await self.db.execute(
+            select(func.count(self.model.id)).where(self.model.status == status)
+        )
+        return result.scalar_one()
+
+    @traced()
+    async def update_status(self, script_id: int, new_status: str) -> Optional[Script]:
+        """대본 상태 업데이트"""
+        script = await self.get_by_id(script_id)
+        if script:
+            script.status = new_status
+            return await self.update(script)
+        return None
+
+    async def _execute_returning_ids(self, statement, condition) -> List[int]:
+        """UPDATE 실행 후 영향받은 ID 반환
+
+        BaseSQLAlchemyRepository._execute_returning_ids와 같이 RETURNING을
+        지원하지 않는 DB에서는 대상 ID를 먼저 잠금 조회합니다.
+        """
+        options = {"synchronize_session": False}
+        if self.db.get_bind().dialect.update_returning:
+            result = await self.db.execute(
+                statement.returning(self.model.id), execution_options=options
+            )
+            return [row[0] for row in result]
+
+        entity_ids = list(
+            await self.db.scalars(
+                select(self.model.id).where(condition).with_for_update()
+            )
+        )
+        if entity_ids:
+            await self.db.execute(
+                statement.where(self.model.id.in_(entity_ids)),
+                execution_options=options,
+            )
+        return entity_ids
+
+    @traced()
+    async def claim_script(
+        self, script_id: int, lease_owner: str, lease_seconds: int
+    ) -> Optional[Script]:
+        """단일 대본 업로드 작업 점유 (compare-and-set)"""
+        now = datetime.utcnow()
+        condition = and_(
+            self.model.id == script_id, claimable_condition(now, lease_owner)
+        )
+        statement = (
+            update(self.model)
+            .where(condition)
+            .values(**lease_values(lease_owner, lease_seconds, now))
+        )
+        claimed_ids = await self._execute_returning_ids(statement, condition)
+        await self.db.commit()
+
+        if not claimed_ids:
+            return None
+        self._invalidate_caches(script_id)
+        return await self.db.get(self.model, script_id, populate_existing=True)
+
+    @traced()
+    async def finish_upload(
+        self, script_id: int, lease_owner: str, values: dict
+    ) -> Optional[Script]:
+        """점유한 업로드 작업의 결과 기록 및 임대 해제 (임대 소유자 확인)"""
+        condition = and_(
+            self.model.id == script_id, self.model.lease_owner == lease_owner
+        )
+        statement = (
+            update(self.model)
+            .where(condition)
+            .values(
+                **values,
+                lease_owner=None,
+                lease_expires_at=None,
+                version=self.model.version + 1,
+            )
+        )
+        finished = await self._execute_returning_ids(statement, condition)
+        await self.db.commit()
+
+        if not finished:
+            return None
+        self._invalidate_caches(script_id)
+        return await self.db.get(self.model, script_id, populate_existing=True)
@@ -5,7 +5,16 @@
 from abc import ABC, abstractmethod
 from typing import Generic, List, Optional, TypeVar
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Query, Session
+
+from ..core.pagination import (
+    CURSOR_NEXT,
+    CURSOR_PREV,
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+)
 
 T = TypeVar("T")
 
@@ -56,6 +65,22 @@ class BaseSQLAlchemyRepository(BaseRepository[T]):
         self.db.refresh(entity)
         return entity
 
+    def bulk_create(self, entities: List[T]) -> List[int]:
+        """엔티티 일괄 생성 (단일 트랜잭션)
+
+        INSERT는 드라이버가 지원하는 경우 다중 VALUES 문으로 묶여 실행됩니다.
+
+        Returns:
+            생성된 엔티티 ID 목록
+        """
+        if not entities:
+            return []
+        self.db.add_all(entities)
+        self.db.flush()
+        entity_ids = [entity.id for entity in entities]
+        self.db.commit()
+        return entity_ids
+
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """ID로 엔티티 조회"""
         return self.db.query(self.model).filter(self.model.id == entity_id).first()
@@ -64,6 +89,62 @@ class BaseSQLAlchemyRepository(BaseRepository[T]):
         """모든 엔티티 조회"""
         return self.db.query(self.model).offset(skip).limit(limit).all()
 
+    def paginate(
+        self,
+        query: Query,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+    ) -> KeysetPage:
+        """(created_at, id) 기준 최신순 커서 페이지네이션
+
+        cursor가 주어지면 keyset 조건으로 조회하여 건너뛴 행을 읽지 않습니다.
+        cursor가 없으면 호환성을 위해 skip(offset)을 사용합니다.
+        모델에 created_at, id 컬럼이 있어야 합니다.
+        """
+        created_at, entity_id = self.model.created_at, self.model.id
+        direction = CURSOR_NEXT
+
+        if cursor:
+            direction, key_created_at, key_id = decode_cursor(cursor)
+            if direction == CURSOR_PREV:
+                query = query.filter(
+                    or_(
+                        created_at > key_created_at,
+                        and_(created_at == key_created_at, entity_id > key_id),
+                    )
+                ).order_by(created_at.asc(), entity_id.asc())
+            else:
+                query = query.filter(
+                    or_(
+                        created_at < key_created_at,
+                        and_(created_at == key_created_at, entity_id < key_id),
+                    )
+                ).order_by(created_at.desc(), entity_id.desc())
+        else:
+            query = query.order_by(created_at.desc(), entity_id.desc()).offset(skip)
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        rows = query.limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if direction == CURSOR_PREV:
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, bool(cursor) or skip > 0
+
+        next_cursor = prev_cursor = None
+        if rows and has_next:
+            last = rows[-1]
+            next_cursor = encode_cursor(CURSOR_NEXT, last.created_at, last.id)
+        if rows and has_prev:
+            first = rows[0]
+            prev_cursor = encode_cursor(CURSOR_PREV, first.created_at, first.id)
+
+        return KeysetPage(rows, next_cursor, prev_cursor)
+
     def update(self, entity: T) -> T:
         """엔티티 수정"""
         self.db.commit()
@@ -79,6 +160,55 @@ class BaseSQLAlchemyRepository(BaseRepository[T]):
             return True
         return False
 
+    def bulk_delete(self, entity_ids: List[int], *criteria) -> List[int]:
+        """엔티티 일괄 삭제 (단일 DELETE 문)
+
+        Args:
+            entity_ids: 삭제할 ID 목록
+            criteria: 추가 WHERE 조건 (조건에 맞지 않는 행은 삭제되지 않음)
+
+        Returns:
+            실제로 삭제된 ID 목록
+        """
+        if not entity_ids:
+            return []
+        condition = and_(self.model.id.in_(entity_ids), *criteria)
+        deleted_ids = self._execute_returning_ids(
+            delete(self.model).where(condition), condition
+        )
+        self.db.commit()
+        return deleted_ids
+
+    def _execute_returning_ids(self, statement, condition) -> List[int]:
+        """UPDATE/DELETE 실행 후 영향받은 ID 반환
+
+        RETURNING을 지원하는 DB(SQLite 3.35+, PostgreSQL)에서는 단일 문으로
+        처리하고, 그 외에는 대상 ID를 먼저 잠금 조회합니다.
+        """
+        dialect = self.db.get_bind().dialect
+        supports_returning = (
+            dialect.delete_returning
+            if statement.is_delete
+            else dialect.update_returning
+        )
+        options = {"synchronize_session": False}
+
+        if supports_returning:
+            result = self.db.execute(
+                statement.returning(self.model.id), execution_options=options
+            )
+            return [row[0] for row in result]
+
+        entity_ids = list(
+            self.db.scalars(select(self.model.id).where(condition).with_for_update())
+        )
+        if entity_ids:
+            self.db.execute(
+                statement.where(self.model.id.in_(entity_ids)),
+                execution_options=options,
+            )
+        return entity_ids
+
     def count(self) -> int:
         """전체 엔티티 개수"""
         return self.db.query(self.model).count()
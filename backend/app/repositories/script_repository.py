@@ -2,12 +2,143 @@
 Script 엔티티에 대한 Repository 구현체
 """
 
-from typing import List, Optional
+import html
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    DateTime,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+)
+from sqlalchemy import inspect as inspect_entity
+from sqlalchemy import literal, or_, select, text, update
+from sqlalchemy.orm import Query, Session, defer, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
+from ..config import get_settings
+from ..core.cache import TTLCache
+from ..core.pagination import KeysetPage
+from ..core.tracing import traced
+from ..core.validators import ScriptStatusValidator
+from ..models.archived_script import ARCHIVED_COLUMNS, ArchivedScript
 from ..models.script import Script
 from .base import BaseSQLAlchemyRepository
+from .tag_repository import TagRepository, tagged_script_ids
+
+# 목록 조회 시 로드하지 않는 대용량 텍스트 컬럼
+HEAVY_COLUMNS = ("content", "description", "imagefx_prompt")
+
+# 전문 검색 BM25 컬럼 가중치 (제목 > 설명, 태그 > 본문)
+FTS_COLUMN_WEIGHTS = {
+    "w_title": 10.0,
+    "w_description": 4.0,
+    "w_tags": 4.0,
+    "w_content": 1.0,
+}
+
+# trigram 토크나이저가 색인하는 최소 글자 수 (더 짧은 단어는 LIKE로 검색)
+TRIGRAM_LENGTH = 3
+
+# snippet() 강조 구분자 (본문에 나오지 않는 제어 문자, HTML 이스케이프 후 <mark>로 치환)
+SNIPPET_MARK_OPEN = "\x02"
+SNIPPET_MARK_CLOSE = "\x03"
+
+# 대본 통계 캐시 (대시보드 폴링용)
+STATISTICS_CACHE_KEY = "statistics"
+statistics_cache = TTLCache(maxsize=1, ttl=get_settings().stats_cache_ttl_seconds)
+
+# 대본 단건 조회 캐시 (ID -> 분리된 스냅샷)
+script_cache = TTLCache(
+    maxsize=get_settings().script_cache_maxsize,
+    ttl=get_settings().script_cache_ttl_seconds,
+)
+
+
+def snapshot_script(script: Script) -> Script:
+    """세션에 속하지 않는 대본 스냅샷 생성
+
+    모든 컬럼 값을 변경 이력 없이 복사하므로, 다른 세션에서
+    merge(load=False)로 쿼리 없이 연결할 수 있습니다.
+    """
+    snapshot = Script()
+    for column in Script.__mapper__.column_attrs:
+        set_committed_value(snapshot, column.key, getattr(script, column.key))
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def escape_like(term: str) -> str:
+    """LIKE 패턴 특수 문자(%, _) 이스케이프 (ESCAPE '\\')"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def render_snippet(snippet: Optional[str]) -> Optional[str]:
+    """snippet()의 본문을 HTML 이스케이프하고 일치 구간만 <mark>로 감쌈
+
+    snippet()은 원문을 그대로 반환하므로 대본에 포함된 태그가 그대로
+    렌더링되지 않도록 이스케이프한 뒤 구분자를 <mark>로 바꿉니다.
+    """
+    if snippet is None:
+        return None
+    escaped = html.escape(
+        snippet.replace(SNIPPET_MARK_OPEN, "\x00").replace(SNIPPET_MARK_CLOSE, "\x01")
+    )
+    return escaped.replace("\x00", "<mark>").replace("\x01", "</mark>")
+
+
+def invalidate_script_caches(*script_ids: int) -> None:
+    """쓰기 작업 후 통계 캐시와 해당 대본 캐시 무효화"""
+    statistics_cache.invalidate(STATISTICS_CACHE_KEY)
+    for script_id in script_ids:
+        script_cache.invalidate(script_id)
+
+
+def claimable_condition(now: datetime, lease_owner: Optional[str] = None):
+    """업로드 작업으로 점유 가능한 대본 조건
+
+    video_ready 상태이면서 임대가 없거나 만료된 대본입니다.
+    lease_owner가 주어지면 해당 작업자가 이미 점유한 대본도 포함합니다.
+    """
+    lease_available = [
+        Script.lease_expires_at.is_(None),
+        Script.lease_expires_at < now,
+    ]
+    if lease_owner:
+        lease_available.append(Script.lease_owner == lease_owner)
+    return and_(Script.status == "video_ready", or_(*lease_available))
+
+
+def status_requirements(new_status: str):
+    """상태별로 함께 있어야 하는 컬럼 조건 (일괄 상태 변경용)
+
+    단건 경로는 상태와 함께 비디오 파일 경로/YouTube ID를 기록하므로,
+    일괄 변경도 그 값이 이미 있는 대본만 해당 상태로 옮깁니다.
+    """
+    if new_status == "video_ready":
+        return Script.video_file_path.is_not(None)
+    if new_status == "uploaded":
+        return Script.youtube_video_id.is_not(None)
+    if new_status == "scheduled":
+        return and_(
+            Script.youtube_video_id.is_not(None), Script.scheduled_time.is_not(None)
+        )
+    if new_status == "script_ready":
+        return Script.video_file_path.is_(None)
+    return None
+
+
+def lease_values(lease_owner: str, lease_seconds: int, now: datetime) -> dict:
+    """임대 설정 UPDATE 값"""
+    return {
+        "lease_owner": lease_owner,
+        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+        "version": Script.version + 1,
+    }
 
 
 class ScriptRepository(BaseSQLAlchemyRepository[Script]):
@@ -16,6 +147,340 @@ class ScriptRepository(BaseSQLAlchemyRepository[Script]):
     def __init__(self, db: Session):
         super().__init__(db, Script)
 
+    def _invalidate_caches(self, *script_ids: int) -> None:
+        """쓰기 작업 후 파생 캐시 무효화"""
+        invalidate_script_caches(*script_ids)
+
+    @traced()
+    def get_by_id(self, entity_id: int, use_cache: bool = False) -> Optional[Script]:
+        """ID로 대본 조회
+
+        기본은 DB에서 읽으며, 읽은 값으로 단건 캐시를 갱신합니다.
+        use_cache=True는 읽기 전용 경로(상세 조회, 상태 폴링)에서만 사용합니다.
+        캐시 스냅샷은 다른 작업자의 변경보다 오래되었을 수 있어 수정 후
+        update()하면 version 검사에 걸려 StaleDataError가 발생합니다.
+        """
+        if use_cache:
+            snapshot = script_cache.get(entity_id)
+            if snapshot is not None:
+                return self.db.merge(snapshot, load=False)
+
+        script = super().get_by_id(entity_id)
+        if script is not None:
+            script_cache.set(entity_id, snapshot_script(script))
+        return script
+
+    @traced()
+    def create(self, entity: Script) -> Script:
+        """대본 생성 (태그 연결 포함 단일 트랜잭션)"""
+        self.db.add(entity)
+        self.db.flush()
+        TagRepository(self.db).replace_script_tags({entity.id: entity.tags})
+        self.db.commit()
+        self.db.refresh(entity)
+        self._invalidate_caches()
+        return entity
+
+    @traced()
+    def update(self, entity: Script) -> Script:
+        """대본 수정 (태그가 바뀐 경우 태그 연결도 교체)"""
+        # 커밋 실패 시에도 오래된 스냅샷이 남지 않도록 먼저 무효화
+        self._invalidate_caches(entity.id)
+        if inspect_entity(entity).attrs.tags.history.has_changes():
+            TagRepository(self.db).replace_script_tags({entity.id: entity.tags})
+        updated = super().update(entity)
+        self._invalidate_caches(entity.id)
+        return updated
+
+    @traced()
+    def delete(self, entity_id: int) -> bool:
+        """대본 삭제"""
+        entity = self.get_by_id(entity_id)
+        if not entity:
+            return False
+        TagRepository(self.db).delete_script_tags([entity_id])
+        self.db.delete(entity)
+        self.db.commit()
+        self._invalidate_caches(entity_id)
+        return True
+
+    @traced()
+    def bulk_create(self, entities: List[Script]) -> List[int]:
+        """대본 일괄 생성 (태그 연결 포함 단일 트랜잭션)"""
+        if not entities:
+            return []
+        self.db.add_all(entities)
+        self.db.flush()
+        TagRepository(self.db).replace_script_tags(
+            {entity.id: entity.tags for entity in entities}
+        )
+        created_ids = [entity.id for entity in entities]
+        self.db.commit()
+        self._invalidate_caches()
+        return created_ids
+
+    @traced()
+    def bulk_delete(self, entity_ids: List[int], *criteria) -> List[int]:
+        """대본 일괄 삭제"""
+        deleted_ids = super().bulk_delete(entity_ids, *criteria)
+        if deleted_ids:
+            # 외래 키 CASCADE가 꺼진 환경에서도 연결이 남지 않도록 정리
+            TagRepository(self.db).delete_script_tags(deleted_ids)
+            self.db.commit()
+            self._invalidate_caches(*deleted_ids)
+        return deleted_ids
+
+    @traced()
+    def match_import_rows(self, rows: List[dict]) -> List[Optional[int]]:
+        """가져오기 행마다 갱신할 기존 대본 ID 조회 (커밋하지 않음)
+
+        id가 있으면 id로, 없거나 존재하지 않으면 youtube_video_id로 찾습니다.
+        보관된 대본과 일치하면 먼저 scripts로 복원하여 일반 갱신 경로로
+        처리합니다.
+
+        Returns:
+            rows와 같은 순서의 기존 대본 ID (새로 생성할 행은 None)
+        """
+        ids = {row["id"] for row in rows if row.get("id")}
+        youtube_ids = {
+            row["youtube_video_id"] for row in rows if row.get("youtube_video_id")
+        }
+        if not ids and not youtube_ids:
+            return [None] * len(rows)
+
+        archived_ids = list(
+            self.db.scalars(
+                select(ArchivedScript.id).where(
+                    or_(
+                        ArchivedScript.id.in_(ids),
+                        ArchivedScript.youtube_video_id.in_(youtube_ids),
+                    )
+                )
+            )
+        )
+        self._move_from_archive(archived_ids)
+
+        existing_ids = set(
+            self.db.scalars(select(self.model.id).where(self.model.id.in_(ids)))
+        )
+        by_youtube_id = dict(
+            self.db.execute(
+                select(self.model.youtube_video_id, self.model.id).where(
+                    self.model.youtube_video_id.in_(youtube_ids)
+                )
+            ).all()
+        )
+        return [
+            (
+                row["id"]
+                if row.get("id") in existing_ids
+                else by_youtube_id.get(row.get("youtube_video_id"))
+            )
+            for row in rows
+        ]
+
+    @traced()
+    def upsert_rows(self, inserts: List[dict], updates: Dict[int, dict]) -> None:
+        """가져오기 행 일괄 생성/갱신 (커밋하지 않음)
+
+        INSERT/UPDATE는 같은 컬럼 구성의 행끼리 묶어 executemany로 실행합니다.
+        updates는 기존 대본 ID -> 변경할 컬럼 값이며, 행에 없는 컬럼은
+        유지됩니다. 호출자가 배치 단위로 커밋(또는 SAVEPOINT 롤백)합니다.
+        """
+        table = self.model.__table__
+        tags_by_script = {}
+        for keys, group in groupby(
+            sorted(inserts, key=lambda row: sorted(row)), key=lambda row: sorted(row)
+        ):
+            # executemany + RETURNING (insertmanyvalues)으로 새 ID와 태그 수집
+            result = self.db.execute(
+                insert(table).returning(table.c.id, table.c.tags), list(group)
+            )
+            tags_by_script.update(result.tuples().all())
+
+        update_rows = [
+            {f"p_{key}": value for key, value in row.items() if key != "id"}
+            | {"p_id": script_id}
+            for script_id, row in updates.items()
+        ]
+        for keys, group in groupby(
+            sorted(update_rows, key=lambda row: sorted(row)),
+            key=lambda row: sorted(row),
+        ):
+            columns = [key[2:] for key in keys if key != "p_id"]
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("p_id"))
+                .values(
+                    {column: bindparam(f"p_{column}") for column in columns}
+                    | {"version": table.c.version + 1}
+                )
+            )
+            self.db.execute(statement, list(group))
+
+        tags_by_script.update(
+            (script_id, row["tags"])
+            for script_id, row in updates.items()
+            if "tags" in row
+        )
+        TagRepository(self.db).replace_script_tags(tags_by_script)
+        # 호출자도 커밋 후 다시 무효화
+        self._invalidate_caches(*updates)
+
+    @traced()
+    def archive_uploaded_before(self, cutoff: datetime, limit: int = 500) -> List[int]:
+        """cutoff 이전에 업로드 완료된 대본을 archived_scripts로 이동 (단일 트랜잭션)
+
+        INSERT ... SELECT 후 DELETE로 옮깁니다. scripts는 AUTOINCREMENT이므로
+        보관한 ID가 새 대본에 다시 할당되지 않습니다.
+
+        Returns:
+            보관된 대본 ID 목록
+        """
+        table = self.model.__table__
+        condition = and_(
+            self.model.status == "uploaded",
+            self.model.updated_at < cutoff,
+        )
+        script_ids = list(
+            self.db.scalars(
+                select(self.model.id)
+                .where(condition)
+                .order_by(self.model.id)
+                .limit(limit)
+            )
+        )
+        if not script_ids:
+            return []
+
+        moving = and_(table.c.id.in_(script_ids), table.c.status == "uploaded")
+        self.db.execute(
+            insert(ArchivedScript.__table__).from_select(
+                ARCHIVED_COLUMNS + ["archived_at"],
+                select(
+                    *(table.c[column] for column in ARCHIVED_COLUMNS),
+                    literal(datetime.utcnow(), DateTime),
+                ).where(moving),
+            )
+        )
+        TagRepository(self.db).delete_script_tags(script_ids)
+        self.db.execute(delete(table).where(moving))
+        self.db.commit()
+
+        # 대본 캐시와 보관 개수가 포함된 통계 캐시 무효화
+        self._invalidate_caches(*script_ids)
+        return script_ids
+
+    def _move_from_archive(self, script_ids: List[int]) -> List[int]:
+        """보관된 대본을 scripts로 되돌림 (커밋하지 않음)
+
+        이미 scripts에 같은 ID가 있으면 복원하지 않습니다.
+        """
+        if not script_ids:
+            return []
+        archived = ArchivedScript.__table__
+        restorable = and_(
+            archived.c.id.in_(script_ids),
+            archived.c.id.not_in(select(self.model.id)),
+        )
+        rows = self.db.execute(
+            select(archived.c.id, archived.c.tags).where(restorable)
+        ).all()
+        if not rows:
+            return []
+
+        restored_ids = [row.id for row in rows]
+        self.db.execute(
+            insert(self.model.__table__).from_select(
+                ARCHIVED_COLUMNS,
+                select(*(archived.c[column] for column in ARCHIVED_COLUMNS)).where(
+                    archived.c.id.in_(restored_ids)
+                ),
+            )
+        )
+        TagRepository(self.db).replace_script_tags(dict(rows))
+        self.db.execute(delete(archived).where(archived.c.id.in_(restored_ids)))
+        # 통계의 보관 개수가 바뀜 (호출자도 커밋 후 다시 무효화)
+        self._invalidate_caches(*restored_ids)
+        return restored_ids
+
+    @traced()
+    def restore_archived(self, script_ids: List[int]) -> List[int]:
+        """보관된 대본 복원
+
+        Returns:
+            복원된 대본 ID 목록
+        """
+        restored_ids = self._move_from_archive(script_ids)
+        self.db.commit()
+        if restored_ids:
+            self._invalidate_caches(*restored_ids)
+        return restored_ids
+
+    def get_archived(self, script_id: int) -> Optional[ArchivedScript]:
+        """보관된 대본 조회"""
+        return self.db.get(ArchivedScript, script_id)
+
+    @traced()
+    def find_by_id(self, script_id: int) -> Optional[Union[Script, ArchivedScript]]:
+        """ID로 대본 조회 (scripts에 없으면 보관 대본에서 조회, 읽기 전용)
+
+        수정하지 않는 경로이므로 단건 캐시를 사용합니다.
+        """
+        return self.get_by_id(script_id, use_cache=True) or self.get_archived(script_id)
+
+    def find_by_youtube_id(
+        self, youtube_video_id: str
+    ) -> Optional[Union[Script, ArchivedScript]]:
+        """YouTube 비디오 ID로 대본 조회 (보관 대본 포함, 읽기 전용)"""
+        return (
+            self.get_by_youtube_id(youtube_video_id)
+            or self.db.query(ArchivedScript)
+            .filter(ArchivedScript.youtube_video_id == youtube_video_id)
+            .first()
+        )
+
+    def count_archived(self) -> int:
+        """보관된 대본 개수"""
+        return self.db.query(func.count(ArchivedScript.id)).scalar()
+
+    def _summary_query(self) -> Query:
+        """대용량 컬럼을 제외한 요약 조회 쿼리
+
+        제외된 컬럼에 접근하면 지연 로딩 대신 예외가 발생하므로
+        목록 응답에서 의도치 않은 추가 쿼리가 생기지 않습니다.
+        """
+        return self.db.query(self.model).options(
+            *(
+                defer(getattr(self.model, column), raiseload=True)
+                for column in HEAVY_COLUMNS
+            )
+        )
+
+    @traced()
+    def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        status: Optional[str] = None,
+        summary: bool = True,
+        tag: Optional[str] = None,
+    ) -> KeysetPage:
+        """대본 목록 페이지 조회 (최신순)
+
+        Args:
+            cursor: 이전 응답의 next_cursor/prev_cursor (없으면 skip 사용)
+            summary: True면 본문 등 대용량 컬럼을 제외하고 조회
+            tag: 태그 필터 (script_tags 인덱스 조회)
+        """
+        query = self._summary_query() if summary else self.db.query(self.model)
+        if status:
+            query = query.filter(self.model.status == status)
+        if tag:
+            query = query.filter(self.model.id.in_(tagged_script_ids(tag)))
+        return self.paginate(query, limit, cursor, skip)
+
     def get_by_status(
         self, status: str, skip: int = 0, limit: int = 100
     ) -> List[Script]:
@@ -89,36 +554,80 @@ class ScriptRepository(BaseSQLAlchemyRepository[Script]):
         """상태별 대본 개수"""
         return self.db.query(self.model).filter(self.model.status == status).count()
 
+    @traced()
+    def get_tag_names(self, script_id: int) -> List[str]:
+        """대본의 태그 목록 (원래 순서)"""
+        return TagRepository(self.db).get_tag_names(script_id)
+
+    def count_by_tag(self, tag: str, status: Optional[str] = None) -> int:
+        """태그별 대본 개수 (상태 필터 선택)"""
+        query = self.db.query(func.count(self.model.id)).filter(
+            self.model.id.in_(tagged_script_ids(tag))
+        )
+        if status:
+            query = query.filter(self.model.status == status)
+        return query.scalar()
+
+    @traced()
+    def get_collection_version(self) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """목록 ETag용 컬렉션 버전 (행 수, 최근 수정 시각, 최대 ID)
+
+        생성/수정/삭제/보관 중 하나라도 일어나면 값이 바뀝니다.
+        """
+        row = self.db.query(
+            func.count(self.model.id),
+            func.max(self.model.updated_at),
+            func.max(self.model.id),
+        ).one()
+        return tuple(row)
+
+    def get_status_histogram(self) -> Dict[str, int]:
+        """상태별 대본 개수를 단일 GROUP BY 쿼리로 조회"""
+        rows = (
+            self.db.query(self.model.status, func.count(self.model.id))
+            .group_by(self.model.status)
+            .all()
+        )
+        return {status: count for status, count in rows}
+
+    @traced()
     def get_statistics(self) -> dict:
-        """대본 통계 조회"""
-        total = self.count()
-
-        stats = {
-            "total": total,
-            "script_ready": self.count_by_status("script_ready"),
-            "video_ready": self.count_by_status("video_ready"),
-            "uploaded": self.count_by_status("uploaded"),
-            "scheduled": self.count_by_status("scheduled"),
-            "error": self.count_by_status("error"),
-        }
+        """대본 통계 조회 (보관된 대본 수 포함)
+
+        결과는 프로세스 내에 캐시되며, 이 Repository를 통한 쓰기 작업 시
+        무효화되고 STATS_CACHE_TTL_SECONDS 후에도 만료됩니다.
+        """
+        cached = statistics_cache.get(STATISTICS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        histogram = self.get_status_histogram()
+        stats = {"total": sum(histogram.values())}
+        for status in ScriptStatusValidator.VALID_STATUSES:
+            stats[status] = histogram.get(status, 0)
 
         # 최근 생성된 대본
         recent_script = (
-            self.db.query(self.model).order_by(self.model.created_at.desc()).first()
+            self.db.query(self.model.id, self.model.title, self.model.created_at)
+            .order_by(self.model.created_at.desc())
+            .first()
         )
 
-        return {
+        result = {
             "statistics": stats,
             "recent_script": (
                 {
-                    "id": recent_script.id if recent_script else None,
-                    "title": recent_script.title if recent_script else None,
-                    "created_at": recent_script.created_at if recent_script else None,
+                    "id": recent_script.id,
+                    "title": recent_script.title,
+                    "created_at": recent_script.created_at,
                 }
                 if recent_script
                 else None
             ),
+            "archived": self.count_archived(),
         }
+        statistics_cache.set(STATISTICS_CACHE_KEY, result)
+        return result
 
     def search_by_title(
         self, title_query: str, skip: int = 0, limit: int = 100
@@ -133,11 +642,292 @@ class ScriptRepository(BaseSQLAlchemyRepository[Script]):
             .all()
         )
 
+    @traced()
+    def full_text_search(
+        self, query: str, skip: int = 0, limit: int = 20
+    ) -> List[dict]:
+        """제목, 설명, 태그, 본문 전문 검색 (BM25 순위)
+
+        SQLite에서는 trigram FTS5 인덱스로 단어 중간까지 부분 일치 검색합니다.
+        trigram으로 찾을 수 없는 3글자 미만 단어(예: "건강")는 LIKE 조건으로
+        함께 거르며, 모든 단어가 짧거나 SQLite가 아니면 LIKE 검색으로
+        대체합니다.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+
+        fts_terms = [term for term in terms if len(term) >= TRIGRAM_LENGTH]
+        if self.db.get_bind().dialect.name != "sqlite" or not fts_terms:
+            return self._like_search(terms, skip, limit)
+
+        short_terms = [term for term in terms if len(term) < TRIGRAM_LENGTH]
+        like_columns = ("s.title", "s.description", "s.tags", "s.content")
+        like_filters = "".join(
+            " AND ("
+            + " OR ".join(
+                f"{column} LIKE :like_{index} ESCAPE '\\'" for column in like_columns
+            )
+            + ")"
+            for index in range(len(short_terms))
+        )
+        like_params = {
+            f"like_{index}": f"%{escape_like(term)}%"
+            for index, term in enumerate(short_terms)
+        }
+
+        # 각 단어를 구문으로 감싸 부분 문자열로 검색 (예: "할머니" -> "외할머니의")
+        match = " ".join('"{}"'.format(term.replace('"', '""')) for term in fts_terms)
+        rows = self.db.execute(
+            text(f"""
+                SELECT s.id, s.title, s.status, s.tags, s.created_at,
+                       bm25(scripts_fts, :w_title, :w_description, :w_tags, :w_content)
+                           AS rank,
+                       snippet(scripts_fts, -1, :mark_open, :mark_close, '…', 48)
+                           AS snippet
+                FROM scripts_fts
+                JOIN scripts s ON s.id = scripts_fts.rowid
+                WHERE scripts_fts MATCH :match{like_filters}
+                ORDER BY rank
+                LIMIT :limit OFFSET :skip
+                """),
+            {
+                "match": match,
+                "limit": limit,
+                "skip": skip,
+                "mark_open": SNIPPET_MARK_OPEN,
+                "mark_close": SNIPPET_MARK_CLOSE,
+                **like_params,
+                **FTS_COLUMN_WEIGHTS,
+            },
+        )
+        return [dict(row._mapping, snippet=render_snippet(row.snippet)) for row in rows]
+
+    def _like_search(self, terms: List[str], skip: int, limit: int) -> List[dict]:
+        """FTS5를 사용할 수 없는 환경 또는 짧은 검색어의 LIKE 검색"""
+        query = self.db.query(
+            self.model.id,
+            self.model.title,
+            self.model.status,
+            self.model.tags,
+            self.model.created_at,
+        )
+        for term in terms:
+            query = query.filter(
+                or_(
+                    self.model.title.contains(term, autoescape=True),
+                    self.model.description.contains(term, autoescape=True),
+                    self.model.tags.contains(term, autoescape=True),
+                    self.model.content.contains(term, autoescape=True),
+                )
+            )
+        rows = (
+            query.order_by(self.model.created_at.desc()).offset(skip).limit(limit).all()
+        )
+        return [dict(row._mapping, rank=None, snippet=None) for row in rows]
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        status: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> Iterator[List[tuple]]:
+        """지정한 컬럼만 배치 단위로 순회 (내보내기용)
+
+        yield_per로 batch_size개씩만 메모리에 올리므로 전체 행 수와 무관하게
+        메모리 사용량이 일정합니다. PostgreSQL에서는 서버 측 커서를 사용합니다.
+        """
+        statement = select(*(getattr(self.model, column) for column in columns))
+        if status:
+            statement = statement.where(self.model.status == status)
+        statement = statement.order_by(self.model.id.asc()).execution_options(
+            stream_results=True, yield_per=batch_size
+        )
+
+        result = self.db.execute(statement)
+        for partition in result.partitions():
+            yield partition
+
     def has_video_file(self, script_id: int) -> bool:
         """비디오 파일 존재 여부 확인"""
         script = self.get_by_id(script_id)
         return script and script.video_file_path is not None
 
+    @traced()
+    def bulk_update_status(
+        self,
+        script_ids: List[int],
+        new_status: str,
+        expected_status: Optional[str] = None,
+    ) -> List[int]:
+        """대본 상태 일괄 변경 (compare-and-set)
+
+        UPDATE ... WHERE id IN (...) AND status = :expected 단일 문으로 실행되므로
+        그 사이 다른 요청이 상태를 바꾼 대본은 변경되지 않습니다.
+        새 상태에 필요한 값(비디오 파일, YouTube ID 등)이 없는 대본도
+        변경하지 않습니다 (status_requirements 참조).
+
+        Returns:
+            실제로 상태가 변경된 대본 ID 목록
+        """
+        if not script_ids:
+            return []
+
+        condition = self.model.id.in_(script_ids)
+        if expected_status is not None:
+            condition = and_(condition, self.model.status == expected_status)
+        requirement = status_requirements(new_status)
+        if requirement is not None:
+            condition = and_(condition, requirement)
+
+        statement = (
+            update(self.model)
+            .where(condition)
+            .values(
+                status=new_status,
+                updated_at=datetime.utcnow(),
+                version=self.model.version + 1,
+            )
+        )
+        updated_ids = self._execute_returning_ids(statement, condition)
+        self.db.commit()
+
+        if updated_ids:
+            self._invalidate_caches(*updated_ids)
+        return updated_ids
+
+    @traced()
+    def claim_script(
+        self, script_id: int, lease_owner: str, lease_seconds: int
+    ) -> Optional[Script]:
+        """단일 대본 업로드 작업 점유 (compare-and-set)
+
+        Returns:
+            점유에 성공하면 최신 상태의 대본, 다른 작업자가 점유 중이면 None
+        """
+        now = datetime.utcnow()
+        condition = and_(
+            self.model.id == script_id, claimable_condition(now, lease_owner)
+        )
+        statement = (
+            update(self.model)
+            .where(condition)
+            .values(**lease_values(lease_owner, lease_seconds, now))
+        )
+        claimed_ids = self._execute_returning_ids(statement, condition)
+        self.db.commit()
+
+        if not claimed_ids:
+            return None
+        self._invalidate_caches(script_id)
+        return self.db.get(self.model, script_id, populate_existing=True)
+
+    @traced()
+    def claim_next_for_upload(
+        self, lease_owner: str, limit: int = 1, lease_seconds: int = 3600
+    ) -> List[Script]:
+        """업로드 대기 중인 대본 N개를 원자적으로 점유
+
+        오래된 대본부터 점유하며, 임대가 만료된 대본은 다시 점유할 수 있습니다.
+        PostgreSQL에서는 FOR UPDATE SKIP LOCKED로 작업자 간 대기를 피합니다.
+        """
+        now = datetime.utcnow()
+        candidates = (
+            select(self.model.id)
+            .where(claimable_condition(now))
+            .order_by(self.model.created_at.asc(), self.model.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        condition = and_(self.model.id.in_(candidates), claimable_condition(now))
+        statement = (
+            update(self.model)
+            .where(condition)
+            .values(**lease_values(lease_owner, lease_seconds, now))
+        )
+        claimed_ids = self._execute_returning_ids(statement, condition)
+        self.db.commit()
+
+        if not claimed_ids:
+            return []
+        self._invalidate_caches(*claimed_ids)
+        return (
+            self.db.query(self.model)
+            .filter(self.model.id.in_(claimed_ids))
+            .order_by(self.model.created_at.asc(), self.model.id.asc())
+            .populate_existing()
+            .all()
+        )
+
+    @traced()
+    def finish_upload(
+        self, script_id: int, lease_owner: str, values: dict
+    ) -> Optional[Script]:
+        """점유한 업로드 작업의 결과 기록 및 임대 해제
+
+        UPDATE ... WHERE id = :id AND lease_owner = :owner로 version 대신
+        임대 소유자를 확인하므로, 업로드 중 다른 요청이 제목 등을 수정해
+        version이 바뀌어도 업로드 결과(YouTube ID, 상태)가 유실되지 않습니다.
+
+        Returns:
+            갱신된 대본, 임대를 잃어 기록하지 못했으면 None
+        """
+        condition = and_(
+            self.model.id == script_id, self.model.lease_owner == lease_owner
+        )
+        statement = (
+            update(self.model)
+            .where(condition)
+            .values(
+                **values,
+                lease_owner=None,
+                lease_expires_at=None,
+                version=self.model.version + 1,
+            )
+        )
+        finished = self._execute_returning_ids(statement, condition)
+        self.db.commit()
+
+        if not finished:
+            return None
+        self._invalidate_caches(script_id)
+        return self.db.get(self.model, script_id, populate_existing=True)
+
+    @traced()
+    def release_lease(self, script_id: int, lease_owner: str) -> bool:
+        """작업자가 점유한 임대 해제"""
+        condition = and_(
+            self.model.id == script_id, self.model.lease_owner == lease_owner
+        )
+        statement = (
+            update(self.model)
+            .where(condition)
+            .values(
+                lease_owner=None,
+                lease_expires_at=None,
+                version=self.model.version + 1,
+            )
+        )
+        released = self._execute_returning_ids(statement, condition)
+        self.db.commit()
+
+        if released:
+            self._invalidate_caches(script_id)
+        return bool(released)
+
+    def get_video_file_paths(self, script_ids: List[int]) -> Dict[int, str]:
+        """대본별 비디오 파일 경로 조회"""
+        rows = (
+            self.db.query(self.model.id, self.model.video_file_path)
+            .filter(
+                self.model.id.in_(script_ids),
+                self.model.video_file_path.isnot(None),
+            )
+            .all()
+        )
+        return {script_id: path for script_id, path in rows}
+
+    @traced()
     def update_status(self, script_id: int, new_status: str) -> Optional[Script]:
         """대본 상태 업데이트"""
         script = self.get_by_id(script_id)
@@ -0,0 +1,145 @@
+"""
+Tag 엔티티 및 대본-태그 연결에 대한 Repository 구현체
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.script import Script
+from ..models.tag import Tag, script_tags
+from .base import BaseSQLAlchemyRepository
+
+MAX_TAG_LENGTH = 100
+
+# INSERT ... ON CONFLICT DO NOTHING을 지원하는 방언별 insert 구성자
+ON_CONFLICT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def split_tags(raw: Optional[str]) -> List[str]:
+    """콤마로 구분된 태그 문자열을 순서를 유지한 중복 없는 목록으로 변환"""
+    if not raw:
+        return []
+    tags = []
+    for tag in raw.split(","):
+        tag = tag.strip()[:MAX_TAG_LENGTH]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def tagged_script_ids(tag: str):
+    """특정 태그가 붙은 대본 ID 서브쿼리 (ix_script_tags_tag_id_script_id 사용)"""
+    return (
+        select(script_tags.c.script_id)
+        .join(Tag, Tag.id == script_tags.c.tag_id)
+        .where(Tag.name == tag.strip())
+    )
+
+
+def insert_missing_tags(dialect_name: str, names: List[str]):
+    """이미 있는 태그 이름은 건너뛰는 INSERT 문
+
+    SQLite/PostgreSQL은 INSERT ... ON CONFLICT (name) DO NOTHING을 사용하여
+    동시에 같은 태그를 만드는 요청이 있어도 IntegrityError가 나지 않습니다.
+    """
+    values = [{"name": name} for name in dict.fromkeys(names)]
+    dialect_insert = ON_CONFLICT_INSERTS.get(dialect_name)
+    if dialect_insert is None:
+        return insert(Tag).values(values)
+    return (
+        dialect_insert(Tag)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+
+
+class TagRepository(BaseSQLAlchemyRepository[Tag]):
+    """Tag Repository
+
+    대본-태그 연결 변경은 호출자의 트랜잭션 안에서 실행되며 커밋하지 않습니다.
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(db, Tag)
+
+    def get_or_create_ids(self, names: List[str]) -> Dict[str, int]:
+        """태그 이름 -> ID 매핑 (없는 태그는 일괄 생성)"""
+        if not names:
+            return {}
+        statement = select(Tag.name, Tag.id).where(Tag.name.in_(names))
+        tag_ids = dict(self.db.execute(statement).all())
+
+        missing = [name for name in names if name not in tag_ids]
+        if missing:
+            dialect_name = self.db.get_bind().dialect.name
+            self.db.execute(insert_missing_tags(dialect_name, missing))
+            # 다른 요청이 먼저 만든 태그도 포함하여 다시 조회
+            tag_ids = dict(self.db.execute(statement).all())
+        return tag_ids
+
+    def replace_script_tags(self, tags_by_script: Dict[int, Optional[str]]) -> None:
+        """대본별 태그 연결을 태그 문자열 기준으로 교체
+
+        Args:
+            tags_by_script: 대본 ID -> 콤마로 구분된 태그 문자열
+        """
+        if not tags_by_script:
+            return
+
+        parsed = {
+            script_id: split_tags(raw) for script_id, raw in tags_by_script.items()
+        }
+        names = sorted({name for tags in parsed.values() for name in tags})
+        tag_ids = self.get_or_create_ids(names)
+
+        self.delete_script_tags(list(parsed))
+        rows = [
+            {"script_id": script_id, "tag_id": tag_ids[name], "position": position}
+            for script_id, tags in parsed.items()
+            for position, name in enumerate(tags)
+        ]
+        if rows:
+            self.db.execute(insert(script_tags), rows)
+
+    def delete_script_tags(self, script_ids: List[int]) -> None:
+        """대본들의 태그 연결 삭제"""
+        if script_ids:
+            self.db.execute(
+                delete(script_tags).where(script_tags.c.script_id.in_(script_ids))
+            )
+
+    def get_tag_names(self, script_id: int) -> List[str]:
+        """대본의 태그 목록 (원래 순서)"""
+        return list(
+            self.db.scalars(
+                select(Tag.name)
+                .join(script_tags, script_tags.c.tag_id == Tag.id)
+                .where(script_tags.c.script_id == script_id)
+                .order_by(script_tags.c.position)
+            )
+        )
+
+    def get_tag_frequencies(
+        self, limit: int = 50, status: Optional[str] = None
+    ) -> List[dict]:
+        """태그별 대본 수 (많은 순)"""
+        count = func.count(script_tags.c.script_id).label("count")
+        statement = (
+            select(Tag.name, count)
+            .join(script_tags, script_tags.c.tag_id == Tag.id)
+            .group_by(Tag.id, Tag.name)
+            .order_by(count.desc(), Tag.name.asc())
+            .limit(limit)
+        )
+        if status:
+            statement = statement.join(
+                Script, Script.id == script_tags.c.script_id
+            ).where(Script.status == status)
+
+        return [
+            {"tag": name, "count": count}
+            for name, count in self.db.execute(statement).all()
+        ]
@@ -0,0 +1,98 @@
+"""
+UploadLog 엔티티에 대한 Repository 구현체
+"""
+
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..models.upload_log import (
+    EVENT_YOUTUBE_FAILED,
+    EVENT_YOUTUBE_UPLOADED,
+    UploadLog,
+)
+from .base import BaseSQLAlchemyRepository
+
+
+class UploadLogRepository(BaseSQLAlchemyRepository[UploadLog]):
+    """UploadLog Repository"""
+
+    def __init__(self, db: Session):
+        super().__init__(db, UploadLog)
+
+    def insert_many(self, rows: List[dict]) -> int:
+        """이벤트 일괄 추가 (executemany 단일 트랜잭션)"""
+        if not rows:
+            return 0
+        self.db.execute(insert(self.model), rows)
+        self.db.commit()
+        return len(rows)
+
+    def get_by_script(self, script_id: int, limit: int = 100) -> List[UploadLog]:
+        """대본별 이벤트 이력 조회 (최신순)"""
+        return (
+            self.db.query(self.model)
+            .filter(self.model.script_id == script_id)
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_daily_upload_summary(self, since: datetime) -> List[dict]:
+        """일자별 YouTube 업로드 성공률 및 평균 전송 시간"""
+        day = func.date(self.model.created_at).label("day")
+        succeeded = self.model.event == EVENT_YOUTUBE_UPLOADED
+        rows = self.db.execute(
+            select(
+                day,
+                func.count().label("total"),
+                func.sum(case((succeeded, 1), else_=0)).label("succeeded"),
+                func.avg(case((succeeded, self.model.duration_ms))).label(
+                    "mean_transfer_ms"
+                ),
+                func.sum(case((succeeded, self.model.bytes))).label("bytes"),
+            )
+            .where(
+                self.model.created_at >= since,
+                self.model.event.in_([EVENT_YOUTUBE_UPLOADED, EVENT_YOUTUBE_FAILED]),
+            )
+            .group_by(day)
+            .order_by(day)
+        ).all()
+
+        return [
+            {
+                "day": str(row.day),
+                "total": row.total,
+                "succeeded": row.succeeded,
+                "failed": row.total - row.succeeded,
+                "success_rate": round(row.succeeded / row.total, 4),
+                "mean_transfer_ms": (
+                    round(row.mean_transfer_ms, 1)
+                    if row.mean_transfer_ms is not None
+                    else None
+                ),
+                "bytes": row.bytes or 0,
+            }
+            for row in rows
+        ]
+
+    def get_daily_error_breakdown(self, since: datetime) -> List[dict]:
+        """일자별 오류 유형 분포"""
+        day = func.date(self.model.created_at).label("day")
+        rows = self.db.execute(
+            select(day, self.model.error_type, func.count().label("count"))
+            .where(
+                self.model.created_at >= since,
+                self.model.error_type.isnot(None),
+            )
+            .group_by(day, self.model.error_type)
+            .order_by(day, func.count().desc())
+        ).all()
+
+        return [
+            {"day": str(row.day), "error_type": row.error_type, "count": row.count}
+            for row in rows
+        ]
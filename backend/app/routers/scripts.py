@@ -1,20 +1,57 @@
-from typing import Optional
-
-from fastapi import APIRouter, Depends, File, Form, UploadFile
-from sqlalchemy.orm import Session
-
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    Query,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..core.etag import etag_matches, not_modified
 from ..core.exceptions import BaseAppException
 from ..core.logging import get_router_logger
 from ..core.validators import file_validator
-from ..database import get_db
-from ..services.script_service import ScriptService
+from ..database import get_async_db, get_db, get_session_factory
+from ..schemas.script import (
+    ArchiveResponse,
+    BulkDeleteRequest,
+    BulkDeleteResponse,
+    BulkStatusUpdateRequest,
+    BulkStatusUpdateResponse,
+    BulkUploadResponse,
+    ScriptDeleteResponse,
+    ScriptImportResponse,
+    ScriptListResponse,
+    ScriptResponse,
+    ScriptSearchResponse,
+    ScriptStatisticsResponse,
+    ScriptUpdateResponse,
+    ScriptUploadResponse,
+    TagFrequencyResponse,
+)
+from ..services.script_service import (
+    AsyncScriptService,
+    ScriptService,
+    resolve_export_columns,
+    script_etag,
+)
 
 router = APIRouter(prefix="/api/scripts", tags=["scripts"])
 logger = get_router_logger("scripts")
 
 
-@router.post("/upload")
-async def upload_script(file: UploadFile = File(...), db: Session = Depends(get_db)):
+@router.post("/upload", response_model=ScriptUploadResponse)
+async def upload_script(
+    file: UploadFile = File(...), db: AsyncSession = Depends(get_async_db)
+):
     """대본 파일 업로드 및 파싱
 
     지원 파일 형식: .txt, .md
@@ -42,8 +79,10 @@ async def upload_script(file: UploadFile = File(...), db: Session = Depends(get_
         content_str = content.decode("utf-8")
 
         # 서비스를 통해 대본 생성
-        script_service = ScriptService(db)
-        script = script_service.create_script_from_file(content_str, file.filename)
+        script_service = AsyncScriptService(db)
+        script = await script_service.create_script_from_file(
+            content_str, file.filename
+        )
 
         logger.info(f"대본 업로드 성공: ID={script.id}, 제목={script.title}")
 
@@ -65,25 +104,125 @@ async def upload_script(file: UploadFile = File(...), db: Session = Depends(get_
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.get("/")
+@router.post("/bulk/upload", response_model=BulkUploadResponse)
+def bulk_upload_scripts(
+    files: List[UploadFile] = File(...), db: Session = Depends(get_db)
+):
+    """여러 대본 파일을 한 번에 업로드 (단일 트랜잭션)
+
+    파싱에 실패한 파일은 failed 목록으로 반환되고 나머지는 저장됩니다.
+    """
+    try:
+        logger.info(f"대본 일괄 업로드 시작: {len(files)}개 파일")
+
+        items = []
+        for file in files:
+            file_validator.validate_script_file(file)
+            try:
+                items.append((file.filename, file.file.read().decode("utf-8")))
+            except UnicodeDecodeError:
+                raise BaseAppException(
+                    f"파일 인코딩이 UTF-8이 아닙니다: {file.filename}", 400
+                )
+
+        script_service = ScriptService(db)
+        result = script_service.bulk_create_from_files(items)
+
+        logger.info(
+            f"대본 일괄 업로드 완료: 성공={len(result['created_ids'])}, "
+            f"실패={len(result['failed'])}"
+        )
+        return result
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"대본 일괄 업로드 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.post("/bulk/status", response_model=BulkStatusUpdateResponse)
+def bulk_update_status(request: BulkStatusUpdateRequest, db: Session = Depends(get_db)):
+    """대본 상태 일괄 변경
+
+    expected_status 상태인 대본만 new_status로 변경됩니다 (compare-and-set).
+    그 사이 상태가 바뀐 대본은 skipped_ids로 반환됩니다.
+    """
+    try:
+        script_service = ScriptService(db)
+        result = script_service.bulk_update_status(
+            request.script_ids, request.new_status, request.expected_status
+        )
+
+        logger.info(
+            f"대본 상태 일괄 변경: {request.expected_status} -> {request.new_status}, "
+            f"변경={len(result['updated_ids'])}, 건너뜀={len(result['skipped_ids'])}"
+        )
+        return result
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"대본 상태 일괄 변경 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.post("/bulk/delete", response_model=BulkDeleteResponse)
+def bulk_delete_scripts(request: BulkDeleteRequest, db: Session = Depends(get_db)):
+    """대본 일괄 삭제 (업로드 완료된 대본은 건너뜀)"""
+    try:
+        script_service = ScriptService(db)
+        result = script_service.bulk_delete_scripts(request.script_ids)
+
+        logger.info(
+            f"대본 일괄 삭제: 삭제={len(result['deleted_ids'])}, "
+            f"건너뜀={len(result['skipped_ids'])}"
+        )
+        return result
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"대본 일괄 삭제 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.get("/", response_model=ScriptListResponse)
 def get_scripts(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
+    fields: str = Query("summary", pattern="^(summary|full)$"),
+    cursor: Optional[str] = None,
+    tag: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
-    """등록된 대본 목록 조회
+    """등록된 대본 목록 조회 (최신순)
+
+    If-None-Match가 현재 컬렉션 ETag와 같으면 목록을 조회하지 않고 304를 반환합니다.
 
     Args:
-        skip: 건너뛸 개수 (페이지네이션)
+        skip: 건너뛸 개수 (오프셋 페이지네이션, 하위 호환용)
         limit: 조회할 최대 개수 (기본: 100)
         status: 상태 필터 (script_ready, video_ready, uploaded, error, scheduled)
+        fields: 응답 필드 범위 (summary: 본문 제외, full: 본문 포함)
+        cursor: 응답의 next_cursor/prev_cursor 값 (지정 시 skip 무시)
+        tag: 태그 필터 (정확히 일치하는 태그)
     """
     try:
         script_service = ScriptService(db)
-        result = script_service.get_scripts(skip, limit, status)
+        etag = script_service.get_scripts_etag(skip, limit, status, fields, cursor, tag)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
 
-        logger.info(f"대본 목록 조회: total={result['total']}, status_filter={status}")
+        result = script_service.get_scripts(skip, limit, status, fields, cursor, tag)
+        response.headers["ETag"] = etag
+
+        logger.info(
+            f"대본 목록 조회: total={result['total']}, status_filter={status}, tag={tag}"
+        )
         return result
 
     except BaseAppException:
@@ -93,12 +232,225 @@ def get_scripts(
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.get("/{script_id}")
-def get_script(script_id: int, db: Session = Depends(get_db)):
-    """특정 대본 상세 조회"""
+@router.get("/export")
+def export_scripts(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    columns: Optional[str] = None,
+    status: Optional[str] = None,
+    session_factory: sessionmaker = Depends(get_session_factory),
+):
+    """대본 카탈로그 스트리밍 내보내기
+
+    전체 목록을 한 번에 메모리에 올리지 않고 배치 단위로 전송합니다.
+
+    Args:
+        format: 출력 형식 (ndjson, csv)
+        columns: 쉼표로 구분된 컬럼 목록 (기본: 본문 제외 요약 컬럼)
+        status: 상태 필터
+    """
+    selected_columns = resolve_export_columns(columns)
+    media_type = (
+        "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    )
+    filename = f"scripts-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{format}"
+
+    def stream():
+        db = session_factory()
+        try:
+            yield from ScriptService(db).export_scripts(
+                format, selected_columns, status
+            )
+        except Exception as e:
+            logger.error(f"대본 내보내기 중 오류: {str(e)}")
+            raise
+        finally:
+            db.close()
+
+    logger.info(f"대본 내보내기 시작: format={format}, columns={selected_columns}")
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import", response_model=ScriptImportResponse)
+def import_scripts(
+    file: UploadFile = File(...),
+    format: Optional[str] = Form(None, pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+):
+    """NDJSON/CSV 카탈로그 일괄 가져오기
+
+    id 또는 youtube_video_id가 기존 대본과 일치하는 행은 포함된 컬럼만
+    갱신(upsert)되고, 새 행은 title과 content가 필요합니다. 검증에 실패한 행은
+    건너뜁니다. 내보내기(/export) 결과를 그대로 다시 가져올 수 있습니다.
+
+    Args:
+        file: .ndjson/.jsonl/.csv 파일
+        format: 파일 형식 (생략 시 확장자로 판단)
+    """
+    if not format:
+        extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+        format = {"ndjson": "ndjson", "jsonl": "ndjson", "csv": "csv"}.get(extension)
+        if not format:
+            raise BaseAppException(
+                "지원되지 않는 파일 형식입니다. 지원 형식: .ndjson, .jsonl, .csv", 400
+            )
+
+    try:
+        logger.info(f"대본 가져오기 시작: {file.filename} ({format})")
+
+        script_service = ScriptService(db)
+        result = script_service.import_scripts(file.file, format)
+
+        logger.info(
+            f"대본 가져오기 완료: 생성={result['inserted']}, 갱신={result['updated']}, "
+            f"중복={result['duplicates']}, 거부={result['rejected']}, "
+            f"실패={result['failed']}, 배치={result['batches']}"
+        )
+        return result
+
+    except BaseAppException:
+        raise
+    except UnicodeDecodeError:
+        raise BaseAppException("파일 인코딩이 UTF-8이 아닙니다.", 400)
+    except Exception as e:
+        logger.error(f"대본 가져오기 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.get("/tags", response_model=TagFrequencyResponse)
+def get_tag_frequencies(
+    limit: int = Query(50, ge=1, le=500),
+    status: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """태그별 대본 수 조회 (많은 순)
+
+    Args:
+        limit: 조회할 최대 태그 수
+        status: 상태 필터
+    """
+    try:
+        script_service = ScriptService(db)
+        return script_service.get_tag_frequencies(limit, status)
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"태그 통계 조회 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.get("/search", response_model=ScriptSearchResponse)
+def search_scripts(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """대본 전문 검색
+
+    제목, 설명, 태그, 대본 본문을 검색하여 관련도(BM25) 순으로 반환합니다.
+    snippet에는 일치한 부분이 <mark> 태그로 강조됩니다.
+
+    Args:
+        q: 검색어 (공백으로 구분된 단어는 모두 포함해야 일치)
+        skip: 건너뛸 개수
+        limit: 조회할 최대 개수 (기본: 20)
+    """
+    try:
+        script_service = ScriptService(db)
+        result = script_service.full_text_search(q, skip, limit)
+
+        logger.info(f"대본 검색: query={q}, results={len(result['results'])}")
+        return result
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"대본 검색 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.get("/youtube/{youtube_video_id}", response_model=ScriptResponse)
+def get_script_by_youtube_id(youtube_video_id: str, db: Session = Depends(get_db)):
+    """YouTube 비디오 ID로 대본 조회 (보관된 대본 포함)"""
+    try:
+        script_service = ScriptService(db)
+        script = script_service.find_script_by_youtube_id(youtube_video_id)
+
+        logger.info(f"YouTube ID로 대본 조회: {youtube_video_id}")
+        return script
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"YouTube ID로 대본 조회 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.post("/archive", response_model=ArchiveResponse)
+def archive_scripts(
+    older_than_days: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+):
+    """업로드 완료 후 오래된 대본 보관 (즉시 실행)
+
+    Args:
+        older_than_days: 보관 기준 일수 (기본: ARCHIVE_AFTER_DAYS)
+    """
     try:
         script_service = ScriptService(db)
-        script = script_service.get_script_by_id(script_id)
+        result = script_service.archive_uploaded_scripts(older_than_days)
+
+        logger.info(f"대본 보관: {result['archived']}건")
+        return result
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"대본 보관 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.post("/{script_id}/restore", response_model=ScriptResponse)
+def restore_script(script_id: int, db: Session = Depends(get_db)):
+    """보관된 대본 복원"""
+    try:
+        script_service = ScriptService(db)
+        script = script_service.restore_script(script_id)
+
+        logger.info(f"대본 복원: ID={script_id}")
+        return script
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"대본 복원 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.get("/{script_id}", response_model=ScriptResponse)
+def get_script(
+    script_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """특정 대본 상세 조회 (보관된 대본 포함)
+
+    If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
+    """
+    try:
+        script_service = ScriptService(db)
+        script = script_service.find_script(script_id)
+        etag = script_etag(script)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        response.headers["ETag"] = etag
 
         logger.info(f"대본 상세 조회: ID={script_id}")
         return script
@@ -110,7 +462,7 @@ def get_script(script_id: int, db: Session = Depends(get_db)):
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.put("/{script_id}")
+@router.put("/{script_id}", response_model=ScriptUpdateResponse)
 def update_script(
     script_id: int,
     title: Optional[str] = Form(None),
@@ -147,7 +499,7 @@ def update_script(
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.delete("/{script_id}")
+@router.delete("/{script_id}", response_model=ScriptDeleteResponse)
 def delete_script(script_id: int, db: Session = Depends(get_db)):
     """대본 삭제"""
     try:
@@ -164,7 +516,7 @@ def delete_script(script_id: int, db: Session = Depends(get_db)):
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.get("/stats/summary")
+@router.get("/stats/summary", response_model=ScriptStatisticsResponse)
 def get_scripts_stats(db: Session = Depends(get_db)):
     """대본 통계 정보 조회"""
     try:
@@ -1,20 +1,34 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Header, Query, Response, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..core.etag import etag_matches, not_modified
 from ..core.exceptions import BaseAppException
 from ..core.logging import get_router_logger
-from ..database import get_db
-from ..services.upload_service import UploadService
+from ..core.tracing import traced
+from ..database import get_async_db, get_db
+from ..schemas.upload import (
+    ClaimResponse,
+    UploadStatisticsResponse,
+    UploadStatusResponse,
+    VideoDeleteResponse,
+    VideoUploadResponse,
+    YouTubeUploadResponse,
+)
+from ..services.upload_service import AsyncUploadService, UploadService
 
 router = APIRouter(prefix="/api/upload", tags=["upload"])
 logger = get_router_logger("upload")
 
 
-@router.post("/video/{script_id}")
+@router.post("/video/{script_id}", response_model=VideoUploadResponse)
+@traced("router.upload.upload_video_file")
 async def upload_video_file(
-    script_id: int, video_file: UploadFile = File(...), db: Session = Depends(get_db)
+    script_id: int,
+    video_file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """영상 파일 업로드 및 대본과 매칭
 
@@ -27,8 +41,8 @@ async def upload_video_file(
             f"비디오 파일 업로드 시작: script_id={script_id}, 파일명={video_file.filename}"
         )
 
-        upload_service = UploadService(db)
-        result = upload_service.upload_video_file(script_id, video_file)
+        upload_service = AsyncUploadService(db)
+        result = await upload_service.upload_video_file(script_id, video_file)
 
         logger.info(
             f"비디오 파일 업로드 성공: script_id={script_id}, 파일크기={result['file_size']}"
@@ -42,13 +56,15 @@ async def upload_video_file(
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.post("/youtube/{script_id}")
+@router.post("/youtube/{script_id}", response_model=YouTubeUploadResponse)
+@traced("router.upload.upload_to_youtube")
 async def upload_to_youtube(
     script_id: int,
     scheduled_time: Optional[str] = Form(None),
     privacy_status: Optional[str] = Form(None),
     category_id: Optional[int] = Form(None),
-    db: Session = Depends(get_db),
+    lease_owner: Optional[str] = Form(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """YouTube에 비디오 업로드
 
@@ -57,16 +73,18 @@ async def upload_to_youtube(
         scheduled_time: 예약 발행 시간 (ISO 8601 형식, 선택사항)
         privacy_status: 공개 설정 (private, unlisted, public)
         category_id: YouTube 카테고리 ID (기본: 22 - People & Blogs)
+        lease_owner: /api/upload/claim으로 점유한 작업자 ID (선택사항)
     """
     try:
         logger.info(f"YouTube 업로드 시작: script_id={script_id}")
 
-        upload_service = UploadService(db)
-        result = upload_service.upload_to_youtube(
+        upload_service = AsyncUploadService(db)
+        result = await upload_service.upload_to_youtube(
             script_id=script_id,
             scheduled_time=scheduled_time,
             privacy_status=privacy_status,
             category_id=category_id,
+            lease_owner=lease_owner,
         )
 
         logger.info(
@@ -81,10 +99,51 @@ async def upload_to_youtube(
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.get("/status/{script_id}")
-def get_upload_status(script_id: int, db: Session = Depends(get_db)):
+@router.post("/claim", response_model=ClaimResponse)
+@traced("router.upload.claim_upload_jobs")
+def claim_upload_jobs(
+    worker_id: Optional[str] = Form(None),
+    limit: int = Form(1, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """업로드 대기 대본을 작업자에게 원자적으로 할당
+
+    Args:
+        worker_id: 작업자 식별자 (없으면 자동 생성)
+        limit: 할당받을 최대 대본 수
+
+    Note:
+        임대(lease)가 만료된 대본은 다른 작업자가 다시 할당받을 수 있습니다.
+    """
+    try:
+        upload_service = UploadService(db)
+        result = upload_service.claim_upload_jobs(worker_id, limit)
+
+        logger.info(
+            f"업로드 작업 할당: owner={result['lease_owner']}, "
+            f"jobs={len(result['jobs'])}"
+        )
+        return result
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"업로드 작업 할당 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.get("/status/{script_id}", response_model=UploadStatusResponse)
+@traced("router.upload.get_upload_status")
+def get_upload_status(
+    script_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """업로드 상태 조회
 
+    If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
+
     Args:
         script_id: 대본 ID
 
@@ -93,7 +152,12 @@ def get_upload_status(script_id: int, db: Session = Depends(get_db)):
     """
     try:
         upload_service = UploadService(db)
+        etag = upload_service.get_upload_status_etag(script_id)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
         result = upload_service.get_upload_status(script_id)
+        response.headers["ETag"] = etag
 
         logger.info(
             f"업로드 상태 조회: script_id={script_id}, status={result['status']}"
@@ -107,7 +171,32 @@ def get_upload_status(script_id: int, db: Session = Depends(get_db)):
         raise BaseAppException(f"서버 오류: {str(e)}", 500)
 
 
-@router.delete("/video/{script_id}")
+@router.get("/stats", response_model=UploadStatisticsResponse)
+@traced("router.upload.get_upload_statistics")
+def get_upload_statistics(
+    days: int = Query(7, ge=1, le=90), db: Session = Depends(get_db)
+):
+    """일자별 업로드 통계 조회
+
+    Args:
+        days: 조회할 기간 (오늘 포함 일수)
+
+    Returns:
+        일자별 성공률/평균 전송 시간/전송 바이트와 오류 유형 분포
+    """
+    try:
+        upload_service = UploadService(db)
+        return upload_service.get_upload_statistics(days)
+
+    except BaseAppException:
+        raise
+    except Exception as e:
+        logger.error(f"업로드 통계 조회 중 오류: {str(e)}")
+        raise BaseAppException(f"서버 오류: {str(e)}", 500)
+
+
+@router.delete("/video/{script_id}", response_model=VideoDeleteResponse)
+@traced("router.upload.delete_video_file")
 def delete_video_file(script_id: int, db: Session = Depends(get_db)):
     """업로드된 비디오 파일 삭제
 
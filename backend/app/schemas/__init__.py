@@ -0,0 +1 @@
+# Pydantic 응답 스키마
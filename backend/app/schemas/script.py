@@ -0,0 +1,208 @@
+"""
+Script 응답 스키마
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ScriptSummary(BaseModel):
+    """대본 목록용 경량 스키마
+
+    content, description, imagefx_prompt 같은 대용량 텍스트 컬럼은 제외합니다.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    status: Optional[str] = None
+    tags: Optional[str] = None
+    thumbnail_text: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    video_file_path: Optional[str] = None
+    youtube_video_id: Optional[str] = None
+    scheduled_time: Optional[datetime] = None
+
+
+class ScriptDetail(ScriptSummary):
+    """대본 전체 스키마 (본문 포함)"""
+
+    content: str
+    description: Optional[str] = None
+    imagefx_prompt: Optional[str] = None
+
+
+class ScriptResponse(ScriptDetail):
+    """대본 단건 응답 (보관된 대본 포함)"""
+
+    version: Optional[int] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    archived_at: Optional[datetime] = None
+
+
+class ScriptListResponse(BaseModel):
+    """대본 목록 응답"""
+
+    scripts: List[Union[ScriptDetail, ScriptSummary]]
+    total: int
+    skip: int
+    limit: int
+    status_filter: Optional[str] = None
+    tag_filter: Optional[str] = None
+    fields: str = "summary"
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class TagFrequency(BaseModel):
+    """태그별 대본 수"""
+
+    tag: str
+    count: int
+
+
+class TagFrequencyResponse(BaseModel):
+    """태그 빈도 응답"""
+
+    tags: List[TagFrequency]
+    status_filter: Optional[str] = None
+
+
+class ScriptSearchHit(BaseModel):
+    """전문 검색 결과 항목"""
+
+    id: int
+    title: str
+    status: Optional[str] = None
+    tags: Optional[str] = None
+    created_at: Optional[datetime] = None
+    rank: Optional[float] = None
+    snippet: Optional[str] = None
+
+
+class ScriptSearchResponse(BaseModel):
+    """전문 검색 응답"""
+
+    query: str
+    results: List[ScriptSearchHit]
+    skip: int
+    limit: int
+
+
+class BulkStatusUpdateRequest(BaseModel):
+    """대본 상태 일괄 변경 요청"""
+
+    script_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    expected_status: str
+    new_status: str
+
+
+class BulkDeleteRequest(BaseModel):
+    """대본 일괄 삭제 요청"""
+
+    script_ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+
+class ScriptUploadResponse(BaseModel):
+    """대본 파일 업로드 응답"""
+
+    id: int
+    title: str
+    status: Optional[str] = None
+    message: str
+    filename: Optional[str] = None
+
+
+class ScriptUpdateResponse(BaseModel):
+    """대본 수정 응답"""
+
+    id: int
+    message: str
+    updated_at: Optional[datetime] = None
+
+
+class ScriptDeleteResponse(BaseModel):
+    """대본 삭제 응답"""
+
+    id: int
+    title: str
+    message: str
+
+
+class FailedFile(BaseModel):
+    """일괄 업로드 실패 파일"""
+
+    filename: Optional[str] = None
+    error: str
+
+
+class BulkUploadResponse(BaseModel):
+    """대본 일괄 업로드 응답"""
+
+    created_ids: List[int]
+    failed: List[FailedFile]
+
+
+class BulkStatusUpdateResponse(BaseModel):
+    """대본 상태 일괄 변경 응답"""
+
+    updated_ids: List[int]
+    skipped_ids: List[int]
+    expected_status: str
+    new_status: str
+
+
+class BulkDeleteResponse(BaseModel):
+    """대본 일괄 삭제 응답"""
+
+    deleted_ids: List[int]
+    skipped_ids: List[int]
+
+
+class ImportRowError(BaseModel):
+    """가져오기 거부 행"""
+
+    line: int
+    error: str
+
+
+class ScriptImportResponse(BaseModel):
+    """카탈로그 가져오기 응답"""
+
+    inserted: int
+    updated: int
+    # 같은 배치에서 같은 대본을 가리켜 마지막 행으로 대체된 행 수
+    duplicates: int
+    rejected: int
+    # 저장에 실패해 되돌린 배치의 행 수
+    failed: int
+    batches: int
+    errors: List[ImportRowError]
+
+
+class ArchiveResponse(BaseModel):
+    """대본 보관 응답"""
+
+    archived: int
+    cutoff: datetime
+
+
+class RecentScript(BaseModel):
+    """최근 생성된 대본"""
+
+    id: int
+    title: str
+    created_at: Optional[datetime] = None
+
+
+class ScriptStatisticsResponse(BaseModel):
+    """대본 통계 응답"""
+
+    statistics: Dict[str, int]
+    recent_script: Optional[RecentScript] = None
+    archived: int = 0
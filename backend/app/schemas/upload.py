@@ -0,0 +1,117 @@
+"""
+Upload 응답 스키마
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class VideoUploadResponse(BaseModel):
+    """비디오 파일 업로드 응답"""
+
+    id: int
+    title: str
+    status: Optional[str] = None
+    video_file_path: str
+    file_size: int
+    message: str
+    uploaded_filename: Optional[str] = None
+    saved_filename: str
+
+
+class YouTubeUploadResponse(BaseModel):
+    """YouTube 업로드 응답"""
+
+    id: int
+    title: str
+    status: Optional[str] = None
+    youtube_video_id: str
+    youtube_url: str
+    privacy_status: str
+    scheduled_time: Optional[datetime] = None
+    message: str
+    upload_timestamp: Optional[datetime] = None
+
+
+class ClaimedJob(BaseModel):
+    """작업자에게 할당된 업로드 작업"""
+
+    id: int
+    title: str
+    video_file_path: Optional[str] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+
+
+class ClaimResponse(BaseModel):
+    """업로드 작업 할당 응답"""
+
+    lease_owner: str
+    jobs: List[ClaimedJob]
+
+
+class VideoFileInfo(BaseModel):
+    """연결된 비디오 파일 정보"""
+
+    file_path: str
+    file_size: int
+    filename: str
+
+
+class UploadStatusResponse(BaseModel):
+    """업로드 상태 응답"""
+
+    id: int
+    archived: bool = False
+    title: str
+    status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    has_video_file: bool
+    youtube_video_id: Optional[str] = None
+    scheduled_time: Optional[datetime] = None
+    video_file_info: Optional[VideoFileInfo] = None
+    youtube_url: Optional[str] = None
+
+
+class DailyUploadSummary(BaseModel):
+    """일자별 업로드 요약"""
+
+    day: str
+    total: int
+    succeeded: int
+    failed: int
+    success_rate: float
+    mean_transfer_ms: Optional[float] = None
+    bytes: int
+
+
+class DailyErrorCount(BaseModel):
+    """일자별 오류 유형 건수"""
+
+    day: str
+    error_type: Optional[str] = None
+    count: int
+
+
+class UploadStatisticsResponse(BaseModel):
+    """업로드 통계 응답"""
+
+    since: str
+    daily: List[DailyUploadSummary]
+    errors: List[DailyErrorCount]
+
+
+class VideoDeleteResponse(BaseModel):
+    """비디오 파일 삭제 응답"""
+
+    id: int
+    title: str
+    previous_status: Optional[str] = None
+    current_status: Optional[str] = None
+    file_path: str
+    file_existed: bool
+    message: str
+    note: Optional[str] = None
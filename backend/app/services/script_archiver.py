@@ -0,0 +1,83 @@
+"""
+오래된 업로드 완료 대본 백그라운드 보관기
+
+ARCHIVE_INTERVAL_SECONDS마다 ARCHIVE_AFTER_DAYS가 지난 uploaded 대본을
+archived_scripts로 옮겨 scripts 테이블의 작업 집합을 작게 유지합니다.
+"""
+
+import threading
+from typing import Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from ..config import get_settings
+from ..core.logging import get_service_logger
+from .script_service import ScriptService
+
+logger = get_service_logger("script_archiver")
+
+
+class ScriptArchiver:
+    """주기적으로 대본을 보관하는 백그라운드 스레드"""
+
+    def __init__(
+        self, session_factory: Optional[sessionmaker] = None, interval: float = 3600.0
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        """보관 작업 1회 실행
+
+        Returns:
+            보관된 대본 수
+        """
+        db = self._session_factory()()
+        try:
+            result = ScriptService(db).archive_uploaded_scripts()
+        except Exception as e:
+            logger.error(f"대본 보관 실패: {str(e)}")
+            return 0
+        finally:
+            db.close()
+
+        if result["archived"]:
+            logger.info(
+                f"대본 보관 완료: {result['archived']}건 (기준: {result['cutoff']})"
+            )
+        return result["archived"]
+
+    def start(self) -> None:
+        """백그라운드 보관 시작"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="script-archiver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 보관 중지"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _session_factory(self) -> sessionmaker:
+        if self.session_factory is not None:
+            return self.session_factory
+        from ..database import SessionLocal
+
+        return SessionLocal
+
+    def _run(self) -> None:
+        # 시작 직후 한 번 실행한 뒤 interval마다 반복
+        while not self._stopped.is_set():
+            self.run_once()
+            self._stopped.wait(self.interval)
+
+
+script_archiver = ScriptArchiver(interval=get_settings().archive_interval_seconds)
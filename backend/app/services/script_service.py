@@ -2,23 +2,197 @@
 대본 관련 비즈니스 로직을 처리하는 Service
 """
 
+import csv
+import io
+import json
 import os
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..config import get_settings
+from ..core.etag import weak_etag
 from ..core.exceptions import (
+    BaseAppException,
     DatabaseError,
     FileUploadError,
     InvalidScriptStatusError,
     ScriptNotFoundError,
+    ScriptRestoreConflictError,
+    ValidationError,
 )
+from ..core.validators import ScriptDataValidator, ScriptStatusValidator
+from ..models.archived_script import ArchivedScript
 from ..models.script import Script
-from ..repositories.script_repository import ScriptRepository
+from ..repositories.async_script_repository import AsyncScriptRepository
+from ..repositories.script_repository import (
+    ScriptRepository,
+    invalidate_script_caches,
+)
+from ..repositories.tag_repository import TagRepository
+from ..schemas.script import ScriptDetail, ScriptSummary
 from .script_parser import ScriptParser, ScriptParsingError
 
 
+def script_etag(script: Union[Script, ArchivedScript]) -> str:
+    """대본 단건 ETag (보관 여부, ID, 버전, 수정 시각)"""
+    if isinstance(script, ArchivedScript):
+        return weak_etag("archived", script.id, script.archived_at)
+    return weak_etag("script", script.id, script.version, script.updated_at)
+
+
+# 내보내기 가능한 컬럼 (임대 관련 내부 컬럼 제외)
+EXPORT_COLUMNS = [
+    "id",
+    "title",
+    "content",
+    "description",
+    "tags",
+    "thumbnail_text",
+    "imagefx_prompt",
+    "status",
+    "created_at",
+    "updated_at",
+    "video_file_path",
+    "youtube_video_id",
+    "scheduled_time",
+]
+DEFAULT_EXPORT_COLUMNS = [
+    "id",
+    "title",
+    "status",
+    "tags",
+    "created_at",
+    "updated_at",
+    "youtube_video_id",
+    "scheduled_time",
+]
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# 가져오기 가능한 컬럼 (id는 갱신 대상 식별용, updated_at은 DB가 관리)
+IMPORT_COLUMNS = [column for column in EXPORT_COLUMNS if column != "updated_at"]
+IMPORT_DATETIME_COLUMNS = ("created_at", "scheduled_time")
+# 응답에 포함할 거부 행 상세 최대 개수
+MAX_IMPORT_ERRORS = 100
+
+
+def resolve_export_columns(columns: Optional[str]) -> List[str]:
+    """쉼표로 구분된 컬럼 목록 검증 (없으면 기본 컬럼)"""
+    if not columns:
+        return list(DEFAULT_EXPORT_COLUMNS)
+
+    selected = [column.strip() for column in columns.split(",") if column.strip()]
+    invalid = [column for column in selected if column not in EXPORT_COLUMNS]
+    if invalid or not selected:
+        raise ValidationError(
+            f"내보낼 수 없는 컬럼입니다: {', '.join(invalid)}. "
+            f"가능한 컬럼: {', '.join(EXPORT_COLUMNS)}"
+        )
+    return selected
+
+
+def _export_value(value):
+    """내보내기용 값 변환"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _parse_import_datetime(value: str) -> datetime:
+    """ISO 8601 문자열을 naive UTC datetime으로 변환"""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValidationError(f"날짜 형식이 올바르지 않습니다: {value}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_import_id(value) -> int:
+    """가져오기 id 값을 양의 정수로 변환"""
+    try:
+        script_id = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"id 형식이 올바르지 않습니다: {value}")
+    if script_id <= 0:
+        raise ValidationError(f"id 형식이 올바르지 않습니다: {value}")
+    return script_id
+
+
+def build_import_row(record: dict) -> dict:
+    """가져오기 레코드 하나를 검증하여 INSERT/UPDATE용 행으로 변환
+
+    알 수 없는 컬럼은 무시하며, 빈 값은 누락된 것으로 취급합니다.
+    기존 대본 갱신 시에는 일부 컬럼만 있어도 되므로 여기서는 값이 있는
+    컬럼만 검증하고, 필수 컬럼과 기본 상태는 prepare_insert_row에서
+    처리합니다.
+    """
+    if not isinstance(record, dict):
+        raise ValidationError("레코드는 JSON 객체여야 합니다.")
+
+    row = {}
+    for column in IMPORT_COLUMNS:
+        value = record.get(column)
+        if value is None or value == "":
+            continue
+        if column == "id":
+            row[column] = _parse_import_id(value)
+        elif column in IMPORT_DATETIME_COLUMNS:
+            row[column] = _parse_import_datetime(str(value))
+        else:
+            row[column] = str(value)
+
+    ScriptDataValidator.validate_parsed_script_data(row, required=False)
+    if "status" in row:
+        ScriptStatusValidator.validate_status(row["status"])
+    return row
+
+
+def prepare_insert_row(row: dict) -> dict:
+    """새로 생성할 가져오기 행의 필수 컬럼 검증 및 기본 상태 설정"""
+    ScriptDataValidator.validate_parsed_script_data(row)
+
+    # 상태 미지정 시 YouTube ID 유무로 결정
+    return {
+        "status": "uploaded" if row.get("youtube_video_id") else "script_ready",
+        **row,
+    }
+
+
+def import_row_key(row: dict) -> Optional[tuple]:
+    """새로 생성할 행의 배치 내 중복 판단 키 (id, 없으면 youtube_video_id)"""
+    if row.get("id"):
+        return ("id", row["id"])
+    if row.get("youtube_video_id"):
+        return ("youtube_video_id", row["youtube_video_id"])
+    return None
+
+
+def build_script_from_content(parser: ScriptParser, content: str) -> Script:
+    """대본 파일 내용을 파싱하여 저장 전 Script 엔티티 생성"""
+    # 대본 파싱
+    parsed_data = parser.parse_script_file(content)
+
+    # 데이터 유효성 검증
+    if not parser.validate_parsed_data(parsed_data):
+        raise ScriptParsingError("파싱된 데이터가 유효하지 않습니다.")
+
+    # Script 엔티티 생성
+    return Script(
+        title=parsed_data["title"],
+        content=parsed_data["content"],
+        description=parsed_data.get("description", ""),
+        tags=parsed_data.get("tags", ""),
+        thumbnail_text=parsed_data.get("thumbnail_text", ""),
+        imagefx_prompt=parsed_data.get("imagefx_prompt", ""),
+        status="script_ready",
+        created_at=datetime.utcnow(),
+    )
+
+
 class ScriptService:
     """대본 관리 서비스"""
 
@@ -30,25 +204,7 @@ class ScriptService:
     def create_script_from_file(self, content: str, filename: str) -> Script:
         """파일에서 대본 생성"""
         try:
-            # 대본 파싱
-            parsed_data = self.parser.parse_script_file(content)
-
-            # 데이터 유효성 검증
-            if not self.parser.validate_parsed_data(parsed_data):
-                raise ScriptParsingError("파싱된 데이터가 유효하지 않습니다.")
-
-            # Script 엔티티 생성
-            script = Script(
-                title=parsed_data["title"],
-                content=parsed_data["content"],
-                description=parsed_data.get("description", ""),
-                tags=parsed_data.get("tags", ""),
-                thumbnail_text=parsed_data.get("thumbnail_text", ""),
-                imagefx_prompt=parsed_data.get("imagefx_prompt", ""),
-                status="script_ready",
-                created_at=datetime.utcnow(),
-            )
-
+            script = build_script_from_content(self.parser, content)
             return self.repository.create(script)
 
         except ScriptParsingError:
@@ -63,25 +219,118 @@ class ScriptService:
             raise ScriptNotFoundError(script_id)
         return script
 
+    def find_script(self, script_id: int) -> Union[Script, ArchivedScript]:
+        """대본 ID로 조회 (보관된 대본 포함, 읽기 전용)"""
+        script = self.repository.find_by_id(script_id)
+        if not script:
+            raise ScriptNotFoundError(script_id)
+        return script
+
+    def get_scripts_etag(self, *params) -> str:
+        """목록 조회 ETag (컬렉션 버전 + 조회 파라미터)"""
+        try:
+            version = self.repository.get_collection_version()
+        except Exception as e:
+            raise DatabaseError(f"대본 목록 버전 조회 중 오류 발생: {str(e)}")
+        return weak_etag("scripts", *version, *params)
+
+    def find_script_by_youtube_id(
+        self, youtube_video_id: str
+    ) -> Union[Script, ArchivedScript]:
+        """YouTube 비디오 ID로 조회 (보관된 대본 포함, 읽기 전용)"""
+        script = self.repository.find_by_youtube_id(youtube_video_id)
+        if not script:
+            raise BaseAppException(
+                f"YouTube 비디오 ID에 해당하는 대본을 찾을 수 없습니다: {youtube_video_id}",
+                404,
+            )
+        return script
+
+    def archive_uploaded_scripts(
+        self, older_than_days: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> dict:
+        """업로드 완료 후 older_than_days가 지난 대본을 batch_size씩 보관"""
+        settings = get_settings()
+        older_than_days = older_than_days or settings.archive_after_days
+        batch_size = batch_size or settings.archive_batch_size
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+
+        archived = 0
+        try:
+            while True:
+                script_ids = self.repository.archive_uploaded_before(cutoff, batch_size)
+                archived += len(script_ids)
+                if len(script_ids) < batch_size:
+                    break
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseError(f"대본 보관 중 오류 발생: {str(e)}")
+
+        return {"archived": archived, "cutoff": cutoff}
+
+    def restore_script(self, script_id: int) -> Script:
+        """보관된 대본 복원"""
+        if not self.repository.get_archived(script_id):
+            raise ScriptNotFoundError(script_id)
+
+        try:
+            restored = self.repository.restore_archived([script_id])
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseError(f"대본 복원 중 오류 발생: {str(e)}")
+
+        if not restored:
+            raise ScriptRestoreConflictError(script_id)
+        return self.repository.get_by_id(script_id)
+
     def get_scripts(
-        self, skip: int = 0, limit: int = 100, status: Optional[str] = None
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        fields: str = "summary",
+        cursor: Optional[str] = None,
+        tag: Optional[str] = None,
     ) -> dict:
-        """대본 목록 조회"""
+        """대본 목록 조회
+
+        Args:
+            fields: "summary"면 대용량 텍스트 컬럼을 제외하고,
+                "full"이면 본문까지 포함하여 조회합니다.
+            cursor: 커서 페이지네이션 위치 (주어지면 skip은 무시됩니다)
+        """
         try:
-            if status:
-                scripts = self.repository.get_by_status(status, skip, limit)
+            page = self.repository.get_page(
+                limit=limit,
+                cursor=cursor,
+                skip=skip,
+                status=status,
+                summary=fields != "full",
+                tag=tag,
+            )
+            schema = ScriptDetail if fields == "full" else ScriptSummary
+            items = [schema.model_validate(script) for script in page.items]
+
+            if tag:
+                total = self.repository.count_by_tag(tag, status)
+            elif status:
                 total = self.repository.count_by_status(status)
             else:
-                scripts = self.repository.get_all(skip, limit)
                 total = self.repository.count()
 
             return {
-                "scripts": scripts,
+                "scripts": items,
                 "total": total,
                 "skip": skip,
                 "limit": limit,
                 "status_filter": status,
+                "tag_filter": tag,
+                "fields": fields,
+                "next_cursor": page.next_cursor,
+                "prev_cursor": page.prev_cursor,
             }
+        except ValidationError:
+            raise
         except Exception as e:
             raise DatabaseError(f"대본 목록 조회 중 오류 발생: {str(e)}")
 
@@ -139,8 +388,255 @@ class ScriptService:
         except Exception as e:
             raise DatabaseError(f"대본 삭제 중 오류 발생: {str(e)}")
 
+    def bulk_create_from_files(self, files: List[Tuple[str, str]]) -> dict:
+        """여러 대본 파일을 파싱하여 단일 트랜잭션으로 일괄 생성
+
+        Args:
+            files: (파일명, 파일 내용) 목록
+
+        Returns:
+            생성된 ID 목록과 파싱 실패 파일 목록
+        """
+        scripts, failed = [], []
+        for filename, content in files:
+            try:
+                scripts.append(build_script_from_content(self.parser, content))
+            except ScriptParsingError as e:
+                failed.append({"filename": filename, "error": str(e)})
+
+        try:
+            created_ids = self.repository.bulk_create(scripts)
+        except Exception as e:
+            raise DatabaseError(f"대본 일괄 생성 중 오류 발생: {str(e)}")
+
+        return {"created_ids": created_ids, "failed": failed}
+
+    def bulk_update_status(
+        self, script_ids: List[int], new_status: str, expected_status: str
+    ) -> dict:
+        """대본 상태 일괄 변경
+
+        expected_status 상태이면서 새 상태에 필요한 값(비디오 파일, YouTube ID)을
+        가진 대본만 변경되며, 나머지는 skipped_ids로 반환됩니다.
+        """
+        ScriptStatusValidator.validate_status_transition(expected_status, new_status)
+
+        try:
+            updated_ids = self.repository.bulk_update_status(
+                script_ids, new_status, expected_status
+            )
+        except Exception as e:
+            raise DatabaseError(f"대본 상태 일괄 변경 중 오류 발생: {str(e)}")
+
+        updated = set(updated_ids)
+        return {
+            "updated_ids": updated_ids,
+            "skipped_ids": [i for i in script_ids if i not in updated],
+            "expected_status": expected_status,
+            "new_status": new_status,
+        }
+
+    def bulk_delete_scripts(self, script_ids: List[int]) -> dict:
+        """대본 일괄 삭제 (업로드 완료된 대본은 제외)"""
+        try:
+            video_paths = self.repository.get_video_file_paths(script_ids)
+            deleted_ids = self.repository.bulk_delete(
+                script_ids, Script.status != "uploaded"
+            )
+        except Exception as e:
+            raise DatabaseError(f"대본 일괄 삭제 중 오류 발생: {str(e)}")
+
+        # 연관된 비디오 파일 삭제
+        for script_id in deleted_ids:
+            path = video_paths.get(script_id)
+            if path and os.path.exists(path):
+                os.remove(path)
+
+        deleted = set(deleted_ids)
+        return {
+            "deleted_ids": deleted_ids,
+            "skipped_ids": [i for i in script_ids if i not in deleted],
+        }
+
+    def export_scripts(
+        self,
+        export_format: str,
+        columns: List[str],
+        status: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> Iterator[str]:
+        """대본 카탈로그를 NDJSON 또는 CSV 청크로 스트리밍
+
+        batch_size개의 행마다 하나의 문자열 청크를 생성합니다.
+        """
+        batches = self.repository.iter_columns(columns, status, batch_size)
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            # Excel에서 한글이 깨지지 않도록 UTF-8 BOM 포함
+            buffer.write("\ufeff")
+            writer.writerow(columns)
+            yield buffer.getvalue()
+
+            for rows in batches:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(
+                    [[_export_value(value) for value in row] for row in rows]
+                )
+                yield buffer.getvalue()
+        else:
+            for rows in batches:
+                yield "".join(
+                    json.dumps(
+                        {
+                            column: _export_value(value)
+                            for column, value in zip(columns, row)
+                        },
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                    for row in rows
+                )
+
+    def import_scripts(
+        self,
+        stream: BinaryIO,
+        import_format: str,
+        batch_size: Optional[int] = None,
+    ) -> dict:
+        """NDJSON/CSV 카탈로그를 batch_size 행 단위 트랜잭션으로 가져오기
+
+        id 또는 youtube_video_id가 기존 대본과 일치하면 행에 있는 컬럼만
+        갱신하고, 그렇지 않으면 새로 생성합니다(title, content 필수).
+        따라서 내보내기 결과를 컬럼 선택과 관계없이 다시 가져올 수 있습니다.
+        같은 배치에서 같은 대본을 가리키는 행은 마지막 행만 반영하고
+        duplicates로 집계합니다. 검증에 실패한 행은 건너뛰고 줄 번호와 함께
+        errors에 기록합니다. 저장에 실패한 배치는 해당 배치만 되돌리고
+        그 행들을 failed로 집계한 뒤 다음 배치를 계속 가져옵니다.
+        """
+        batch_size = batch_size or get_settings().import_batch_size
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+        if import_format == "csv":
+            # 헤더가 1번째 줄이므로 데이터는 2번째 줄부터
+            records = enumerate(csv.DictReader(text_stream), start=2)
+        else:
+            records = (
+                (line_number, line)
+                for line_number, line in enumerate(text_stream, start=1)
+                if line.strip()
+            )
+
+        summary = {
+            "inserted": 0,
+            "updated": 0,
+            "duplicates": 0,
+            "rejected": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+        errors = []
+        batch = []
+
+        def reject(line_number: int, error: ValidationError) -> None:
+            summary["rejected"] += 1
+            if len(errors) < MAX_IMPORT_ERRORS:
+                errors.append({"line": line_number, "error": error.message})
+
+        def flush():
+            # 배치마다 SAVEPOINT를 두어 실패한 배치만 되돌리고 다음 배치로 진행
+            rejected_rows = []
+            inserts: Dict[tuple, dict] = {}
+            keyless_inserts = []
+            updates: Dict[int, dict] = {}
+            duplicates = 0
+            try:
+                with self.db.begin_nested():
+                    targets = self.repository.match_import_rows(
+                        [row for _, row in batch]
+                    )
+                    for (line_number, row), script_id in zip(batch, targets):
+                        if script_id is not None:
+                            # 같은 대본을 가리키는 행은 마지막 행 기준
+                            if script_id in updates:
+                                duplicates += 1
+                            updates[script_id] = row
+                            continue
+                        try:
+                            row = prepare_insert_row(row)
+                        except ValidationError as e:
+                            rejected_rows.append((line_number, e))
+                            continue
+                        key = import_row_key(row)
+                        if key is None:
+                            keyless_inserts.append(row)
+                        else:
+                            if key in inserts:
+                                duplicates += 1
+                            inserts[key] = row
+
+                    self.repository.upsert_rows(
+                        list(inserts.values()) + keyless_inserts, updates
+                    )
+                self.db.commit()
+                invalidate_script_caches(*updates)
+            except Exception as e:
+                self.db.rollback()
+                rejected_lines = {line_number for line_number, _ in rejected_rows}
+                for line_number, _ in batch:
+                    if line_number in rejected_lines:
+                        continue
+                    summary["failed"] += 1
+                    if len(errors) < MAX_IMPORT_ERRORS:
+                        errors.append(
+                            {"line": line_number, "error": f"배치 저장 실패: {str(e)}"}
+                        )
+            else:
+                summary["inserted"] += len(inserts) + len(keyless_inserts)
+                summary["updated"] += len(updates)
+                summary["duplicates"] += duplicates
+                summary["batches"] += 1
+            finally:
+                for line_number, error in rejected_rows:
+                    reject(line_number, error)
+                batch.clear()
+
+        for line_number, record in records:
+            try:
+                if import_format != "csv":
+                    try:
+                        record = json.loads(record)
+                    except json.JSONDecodeError as e:
+                        raise ValidationError(f"JSON 파싱 실패: {e.msg}")
+                batch.append((line_number, build_import_row(record)))
+            except ValidationError as e:
+                reject(line_number, e)
+                continue
+
+            if len(batch) >= batch_size:
+                flush()
+
+        if batch:
+            flush()
+
+        # 생성 행의 필수 컬럼 오류는 배치 처리 시점에 기록되므로 줄 순서로 정렬
+        errors.sort(key=lambda error: error["line"])
+        return {**summary, "errors": errors}
+
+    def get_tag_frequencies(
+        self, limit: int = 50, status: Optional[str] = None
+    ) -> dict:
+        """태그별 대본 수 조회 (많은 순)"""
+        try:
+            tags = TagRepository(self.db).get_tag_frequencies(limit, status)
+        except Exception as e:
+            raise DatabaseError(f"태그 통계 조회 중 오류 발생: {str(e)}")
+        return {"tags": tags, "status_filter": status}
+
     def get_statistics(self) -> dict:
-        """대본 통계 조회"""
+        """대본 통계 조회 (보관된 대본 수 포함)"""
         try:
             return self.repository.get_statistics()
         except Exception as e:
@@ -155,6 +651,15 @@ class ScriptService:
         except Exception as e:
             raise DatabaseError(f"대본 검색 중 오류 발생: {str(e)}")
 
+    def full_text_search(self, query: str, skip: int = 0, limit: int = 20) -> dict:
+        """제목, 설명, 태그, 본문 전문 검색"""
+        try:
+            results = self.repository.full_text_search(query, skip, limit)
+        except Exception as e:
+            raise DatabaseError(f"전문 검색 중 오류 발생: {str(e)}")
+
+        return {"query": query, "results": results, "skip": skip, "limit": limit}
+
     def update_script_status(self, script_id: int, new_status: str) -> Script:
         """대본 상태 업데이트"""
         try:
@@ -182,3 +687,26 @@ class ScriptService:
             return self.repository.get_ready_for_youtube_upload(skip, limit)
         except Exception as e:
             raise DatabaseError(f"YouTube 준비 대본 조회 중 오류 발생: {str(e)}")
+
+
+class AsyncScriptService:
+    """대본 관리 서비스 (비동기 세션용)
+
+    async def 라우트에서 사용하며 DB 호출을 await 합니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = AsyncScriptRepository(db)
+        self.parser = ScriptParser()
+
+    async def create_script_from_file(self, content: str, filename: str) -> Script:
+        """파일에서 대본 생성"""
+        try:
+            script = build_script_from_content(self.parser, content)
+            return await self.repository.create(script)
+
+        except ScriptParsingError:
+            raise
+        except Exception as e:
+            raise DatabaseError(f"대본 생성 중 오류 발생: {str(e)}")
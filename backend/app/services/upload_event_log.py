@@ -0,0 +1,153 @@
+"""
+업로드 이벤트 로그 버퍼 기록기
+
+업로드 단계마다 커밋하지 않도록 이벤트를 메모리에 모았다가 백그라운드
+스레드에서 배치 단위로 upload_logs 테이블에 기록합니다.
+"""
+
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from ..config import get_settings
+from ..core.logging import get_service_logger
+from ..repositories.upload_log_repository import UploadLogRepository
+
+logger = get_service_logger("upload_event_log")
+
+# executemany가 한 문장으로 실행되도록 모든 행이 같은 키를 가져야 함
+EVENT_FIELDS = (
+    "from_status",
+    "to_status",
+    "duration_ms",
+    "bytes",
+    "youtube_video_id",
+    "lease_owner",
+    "error_type",
+    "error_message",
+)
+
+
+class UploadEventLog:
+    """업로드 이벤트 버퍼 기록기
+
+    record()는 버퍼에 추가만 하므로 요청 경로(이벤트 루프 포함)를 막지 않습니다.
+    버퍼가 batch_size에 도달하거나 flush_interval초가 지나면 백그라운드
+    스레드가 별도 세션으로 한 번에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[sessionmaker] = None,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_buffer: int = 10000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.written = 0
+        self.dropped = 0
+        self._buffer: List[dict] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, script_id: int, event: str, **fields) -> None:
+        """이벤트를 버퍼에 추가"""
+        row = {field: fields.get(field) for field in EVENT_FIELDS}
+        if row["error_message"]:
+            row["error_message"] = row["error_message"][:2000]
+        row.update(script_id=script_id, event=event, created_at=datetime.utcnow())
+
+        with self._lock:
+            if len(self._buffer) >= self.max_buffer:
+                self.dropped += 1
+                return
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+
+        self._ensure_started()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """버퍼의 이벤트를 단일 트랜잭션으로 기록
+
+        Returns:
+            기록된 이벤트 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+
+            db = self._session_factory()()
+            try:
+                UploadLogRepository(db).insert_many(rows)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"업로드 이벤트 기록 실패 ({len(rows)}건): {str(e)}")
+                # 다음 주기에 재시도 (버퍼 상한을 넘는 이벤트는 버림)
+                with self._lock:
+                    room = max(self.max_buffer - len(self._buffer), 0)
+                    self._buffer[:0] = rows[:room]
+                    self.dropped += len(rows) - min(room, len(rows))
+                return 0
+            finally:
+                db.close()
+
+            self.written += len(rows)
+            return len(rows)
+
+    def pending(self) -> int:
+        """기록 대기 중인 이벤트 수"""
+        with self._lock:
+            return len(self._buffer)
+
+    def close(self) -> None:
+        """백그라운드 스레드 종료 및 남은 이벤트 기록"""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        self.flush()
+        # 이후 기록되는 이벤트를 위해 다시 시작 가능한 상태로 복귀
+        self._stopped.clear()
+        self._wake.clear()
+
+    def _session_factory(self) -> sessionmaker:
+        if self.session_factory is not None:
+            return self.session_factory
+        from ..database import SessionLocal
+
+        return SessionLocal
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="upload-event-log", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+upload_event_log = UploadEventLog(
+    batch_size=get_settings().upload_log_batch_size,
+    flush_interval=get_settings().upload_log_flush_interval_seconds,
+)
@@ -4,10 +4,15 @@
 
 import os
 import shutil
-from datetime import datetime
-from typing import Optional
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..config import get_settings
@@ -17,56 +22,349 @@ from ..core.exceptions import (
     FileValidationError,
     InvalidScriptStatusError,
     ScriptNotFoundError,
+    UploadLeaseConflictError,
     VideoFileNotFoundError,
     YouTubeUploadError,
 )
+from ..core.metrics import (
+    observe_transfer,
+    video_ingest_bytes,
+    video_ingest_seconds,
+    video_ingest_throughput,
+    youtube_upload_bytes,
+    youtube_upload_seconds,
+    youtube_upload_throughput,
+    youtube_uploads,
+)
+from ..core.tracing import traced
+from ..models.archived_script import ArchivedScript
 from ..models.script import Script
+from ..models.upload_log import (
+    EVENT_VIDEO_ATTACHED,
+    EVENT_VIDEO_DELETED,
+    EVENT_YOUTUBE_FAILED,
+    EVENT_YOUTUBE_UPLOADED,
+)
+from ..repositories.async_script_repository import AsyncScriptRepository
 from ..repositories.script_repository import ScriptRepository
+from ..repositories.upload_log_repository import UploadLogRepository
+from .script_service import script_etag
+from .upload_event_log import upload_event_log
 from .youtube_client import YouTubeClient
 
 
-class UploadService:
+def _elapsed_ms(started: float) -> float:
+    """perf_counter 기준 경과 시간 (밀리초)"""
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class BaseUploadService:
+    """업로드 서비스 공통 로직 (동기/비동기 서비스에서 공유)"""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.event_log = upload_event_log
+
+    def _check_ready_for_video(self, script: Optional[Script], script_id: int) -> None:
+        """비디오 파일 업로드 가능 여부 확인"""
+        if not script:
+            raise ScriptNotFoundError(script_id)
+
+        if script.status != "script_ready":
+            raise InvalidScriptStatusError(script.status, "script_ready")
+
+    def _check_ready_for_youtube(
+        self, script: Optional[Script], script_id: int
+    ) -> None:
+        """YouTube 업로드 가능 여부 확인"""
+        if not script:
+            raise ScriptNotFoundError(script_id)
+
+        if script.status != "video_ready":
+            raise InvalidScriptStatusError(script.status, "video_ready")
+
+        if not script.video_file_path or not os.path.exists(script.video_file_path):
+            raise VideoFileNotFoundError(script.video_file_path or "Unknown")
+
+    def _apply_video_file(self, script: Script, file_path: str) -> None:
+        """대본에 비디오 파일 연결"""
+        script.video_file_path = file_path
+        script.status = "video_ready"
+        script.updated_at = datetime.utcnow()
+
+    def _record_video_attached(
+        self, script: Script, file_path: str, started: float
+    ) -> None:
+        """비디오 파일 연결 이벤트 기록"""
+        file_size = os.path.getsize(file_path)
+        observe_transfer(
+            file_size,
+            time.perf_counter() - started,
+            video_ingest_bytes,
+            video_ingest_seconds,
+            video_ingest_throughput,
+        )
+        self.event_log.record(
+            script.id,
+            EVENT_VIDEO_ATTACHED,
+            from_status="script_ready",
+            to_status=script.status,
+            duration_ms=_elapsed_ms(started),
+            bytes=file_size,
+        )
+
+    def _record_youtube_event(
+        self,
+        script_id: int,
+        video_file_path: str,
+        started: float,
+        lease_owner: Optional[str],
+        to_status: Optional[str] = None,
+        video_id: Optional[str] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """YouTube 업로드 성공/실패 이벤트 기록"""
+        file_size = (
+            os.path.getsize(video_file_path)
+            if os.path.exists(video_file_path)
+            else None
+        )
+        youtube_uploads.inc(
+            result="failure" if error else "success",
+            error_class=type(error).__name__ if error else "",
+        )
+        if not error:
+            observe_transfer(
+                file_size,
+                time.perf_counter() - started,
+                youtube_upload_bytes,
+                youtube_upload_seconds,
+                youtube_upload_throughput,
+            )
+        self.event_log.record(
+            script_id,
+            EVENT_YOUTUBE_FAILED if error else EVENT_YOUTUBE_UPLOADED,
+            from_status="video_ready",
+            to_status="error" if error else to_status,
+            duration_ms=_elapsed_ms(started),
+            bytes=file_size,
+            youtube_video_id=video_id,
+            lease_owner=lease_owner,
+            error_type=type(error).__name__ if error else None,
+            error_message=getattr(error, "message", str(error)) if error else None,
+        )
+
+    def _video_upload_result(
+        self, script: Script, file_path: str, video_file: UploadFile
+    ) -> dict:
+        """비디오 파일 업로드 응답 구성"""
+        return {
+            "id": script.id,
+            "title": script.title,
+            "status": script.status,
+            "video_file_path": file_path,
+            "file_size": os.path.getsize(file_path),
+            "message": "비디오 파일 업로드 및 대본 연결 완료",
+            "uploaded_filename": video_file.filename,
+            "saved_filename": os.path.basename(file_path),
+        }
+
+    def _resolve_upload_options(
+        self, privacy_status: Optional[str], category_id: Optional[int]
+    ) -> tuple:
+        """공개 설정/카테고리 기본값 적용 및 검증"""
+        if privacy_status is None:
+            privacy_status = self.settings.default_privacy_status
+        if category_id is None:
+            category_id = self.settings.default_category_id
+
+        self._validate_privacy_status(privacy_status)
+        return privacy_status, category_id
+
+    def _new_lease_owner(self) -> str:
+        """업로드 작업 임대 소유자 식별자 생성 (호스트:PID:임의값)"""
+        return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def _claimed_job(self, script: Script) -> dict:
+        """점유한 업로드 작업 정보"""
+        return {
+            "id": script.id,
+            "title": script.title,
+            "video_file_path": script.video_file_path,
+            "lease_owner": script.lease_owner,
+            "lease_expires_at": script.lease_expires_at,
+        }
+
+    @traced("upload.youtube")
+    def _upload_via_youtube(self, video_file_path: str, metadata: dict) -> str:
+        """YouTube 인증 및 업로드 실행 (블로킹 I/O)"""
+        youtube_client = YouTubeClient()
+
+        if not youtube_client.authenticate():
+            raise YouTubeUploadError("YouTube API 인증에 실패했습니다.")
+
+        video_id = youtube_client.upload_video(video_file_path, metadata)
+
+        if not video_id:
+            raise YouTubeUploadError("업로드 실패: 비디오 ID를 받을 수 없습니다.")
+
+        return video_id
+
+    def _youtube_result_values(
+        self, video_id: str, scheduled_time: Optional[str]
+    ) -> dict:
+        """YouTube 업로드 결과로 기록할 컬럼 값"""
+        values = {
+            "youtube_video_id": video_id,
+            "status": "scheduled" if scheduled_time else "uploaded",
+            "updated_at": datetime.utcnow(),
+        }
+        if scheduled_time:
+            values["scheduled_time"] = datetime.fromisoformat(
+                scheduled_time.replace("Z", "+00:00")
+            )
+        return values
+
+    def _error_values(self) -> dict:
+        """업로드 실패 시 기록할 컬럼 값"""
+        return {"status": "error", "updated_at": datetime.utcnow()}
+
+    def _result_not_saved(
+        self, script_id: int, video_id: str, reason: str
+    ) -> DatabaseError:
+        """업로드는 완료되었지만 결과를 저장하지 못한 경우의 예외
+
+        업로드 이벤트 로그에 video_id가 남으므로 메시지에도 함께 기록합니다.
+        """
+        return DatabaseError(
+            f"YouTube 업로드는 완료되었지만 결과를 저장하지 못했습니다 "
+            f"(ID: {script_id}, video_id: {video_id}): {reason}"
+        )
+
+    def _youtube_upload_result(
+        self, script: Script, video_id: str, metadata: dict
+    ) -> dict:
+        """YouTube 업로드 응답 구성"""
+        return {
+            "id": script.id,
+            "title": script.title,
+            "status": script.status,
+            "youtube_video_id": video_id,
+            "youtube_url": f"https://www.youtube.com/watch?v={video_id}",
+            "privacy_status": metadata["privacy_status"],
+            "scheduled_time": script.scheduled_time,
+            "message": "YouTube 업로드 성공",
+            "upload_timestamp": script.updated_at,
+        }
+
+    def _validate_video_file(self, video_file: UploadFile) -> None:
+        """비디오 파일 검증"""
+        if not video_file.filename:
+            raise FileValidationError("파일명이 없습니다.")
+
+        # 파일 확장자 검증
+        file_extension = (
+            "." + video_file.filename.split(".")[-1].lower()
+            if "." in video_file.filename
+            else ""
+        )
+
+        if file_extension not in self.settings.allowed_video_extensions:
+            raise FileValidationError(
+                f"지원되지 않는 비디오 형식입니다. 지원 형식: {', '.join(self.settings.allowed_video_extensions)}"
+            )
+
+    @traced("upload.save_video_file")
+    def _save_video_file(self, script_id: int, video_file: UploadFile) -> str:
+        """비디오 파일 저장"""
+        upload_dir = self.settings.upload_dir
+        os.makedirs(upload_dir, exist_ok=True)
+
+        # 안전한 파일명 생성
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_filename = f"script_{script_id}_{timestamp}_{video_file.filename}"
+        file_path = os.path.join(upload_dir, safe_filename)
+
+        try:
+            with open(file_path, "wb") as buffer:
+                shutil.copyfileobj(video_file.file, buffer)
+            return file_path
+        except Exception as e:
+            raise FileUploadError(f"파일 저장 실패: {str(e)}")
+
+    def _validate_privacy_status(self, privacy_status: str) -> None:
+        """공개 설정 검증"""
+        valid_privacy_statuses = ["private", "unlisted", "public"]
+        if privacy_status not in valid_privacy_statuses:
+            raise FileValidationError(
+                f"잘못된 공개 설정입니다. 가능한 값: {', '.join(valid_privacy_statuses)}"
+            )
+
+    def _build_upload_metadata(
+        self,
+        script: Script,
+        privacy_status: str,
+        category_id: int,
+        scheduled_time: Optional[str],
+        tags: List[str],
+    ) -> dict:
+        """업로드 메타데이터 구성
+
+        tags는 script_tags에서 조회한 정규화된 목록이므로 다시 분리하지 않습니다.
+        """
+        metadata = {
+            "title": script.title,
+            "description": script.description or "",
+            "tags": tags,
+            "category_id": category_id,
+            "privacy_status": privacy_status,
+        }
+
+        # 예약 발행 시간 설정
+        if scheduled_time:
+            try:
+                scheduled_datetime = datetime.fromisoformat(
+                    scheduled_time.replace("Z", "+00:00")
+                )
+                metadata["scheduled_time"] = scheduled_datetime.isoformat()
+                metadata["privacy_status"] = "private"  # 예약 발행시 일단 private
+            except ValueError:
+                raise FileValidationError(
+                    "잘못된 날짜 형식입니다. ISO 8601 형식을 사용하세요 (예: 2025-01-20T14:00:00)"
+                )
+
+        return metadata
+
+
+class UploadService(BaseUploadService):
     """업로드 관리 서비스"""
 
     def __init__(self, db: Session):
+        super().__init__()
         self.db = db
         self.repository = ScriptRepository(db)
-        self.settings = get_settings()
 
+    @traced()
     def upload_video_file(self, script_id: int, video_file: UploadFile) -> dict:
         """영상 파일 업로드 및 대본과 매칭"""
         # 대본 존재 확인
         script = self.repository.get_by_id(script_id)
-        if not script:
-            raise ScriptNotFoundError(script_id)
-
-        if script.status != "script_ready":
-            raise InvalidScriptStatusError(script.status, "script_ready")
+        self._check_ready_for_video(script, script_id)
 
         # 파일 검증
         self._validate_video_file(video_file)
 
         # 파일 저장
+        started = time.perf_counter()
         file_path = self._save_video_file(script_id, video_file)
 
         try:
             # DB 업데이트
-            script.video_file_path = file_path
-            script.status = "video_ready"
-            script.updated_at = datetime.utcnow()
-
+            self._apply_video_file(script, file_path)
             updated_script = self.repository.update(script)
+            self._record_video_attached(updated_script, file_path, started)
 
-            return {
-                "id": updated_script.id,
-                "title": updated_script.title,
-                "status": updated_script.status,
-                "video_file_path": file_path,
-                "file_size": os.path.getsize(file_path),
-                "message": "비디오 파일 업로드 및 대본 연결 완료",
-                "uploaded_filename": video_file.filename,
-                "saved_filename": os.path.basename(file_path),
-            }
+            return self._video_upload_result(updated_script, file_path, video_file)
 
         except Exception as e:
             # 실패 시 업로드된 파일 정리
@@ -74,96 +372,130 @@ class UploadService:
                 os.remove(file_path)
             raise DatabaseError(f"데이터베이스 업데이트 실패: {str(e)}")
 
+    @traced()
     def upload_to_youtube(
         self,
         script_id: int,
         scheduled_time: Optional[str] = None,
         privacy_status: Optional[str] = None,
         category_id: Optional[int] = None,
+        lease_owner: Optional[str] = None,
     ) -> dict:
-        """YouTube에 비디오 업로드"""
+        """YouTube에 비디오 업로드
+
+        업로드 전에 대본을 원자적으로 점유(lease)하므로 여러 작업자가 같은
+        대본을 중복 업로드하지 않습니다. claim_upload_jobs로 미리 점유한
+        작업자는 같은 lease_owner를 전달하면 됩니다.
+        """
         # 대본 및 비디오 파일 확인
         script = self.repository.get_by_id(script_id)
-        if not script:
-            raise ScriptNotFoundError(script_id)
-
-        if script.status != "video_ready":
-            raise InvalidScriptStatusError(script.status, "video_ready")
+        self._check_ready_for_youtube(script, script_id)
 
-        if not script.video_file_path or not os.path.exists(script.video_file_path):
-            raise VideoFileNotFoundError(script.video_file_path or "Unknown")
-
-        # 기본값 설정
-        if privacy_status is None:
-            privacy_status = self.settings.default_privacy_status
-        if category_id is None:
-            category_id = self.settings.default_category_id
+        # 기본값 설정 및 공개 설정 검증
+        privacy_status, category_id = self._resolve_upload_options(
+            privacy_status, category_id
+        )
 
-        # 공개 설정 검증
-        self._validate_privacy_status(privacy_status)
+        # 업로드 작업 점유
+        lease_owner = lease_owner or self._new_lease_owner()
+        script = self.repository.claim_script(
+            script_id, lease_owner, self.settings.upload_lease_seconds
+        )
+        if not script:
+            raise UploadLeaseConflictError(script_id)
 
+        video_file_path = script.video_file_path
+        started = time.perf_counter()
         try:
-            # YouTube 클라이언트 초기화 및 인증
-            youtube_client = YouTubeClient()
-
-            if not youtube_client.authenticate():
-                raise YouTubeUploadError("YouTube API 인증에 실패했습니다.")
-
             # 업로드 메타데이터 구성
             metadata = self._build_upload_metadata(
-                script, privacy_status, category_id, scheduled_time
+                script,
+                privacy_status,
+                category_id,
+                scheduled_time,
+                self.repository.get_tag_names(script_id),
             )
 
             # YouTube 업로드 실행
-            video_id = youtube_client.upload_video(script.video_file_path, metadata)
+            video_id = self._upload_via_youtube(video_file_path, metadata)
 
-            if not video_id:
-                raise YouTubeUploadError("업로드 실패: 비디오 ID를 받을 수 없습니다.")
+        except YouTubeUploadError as e:
+            # YouTube 업로드 실패 시 상태 업데이트
+            self._record_youtube_event(
+                script_id, video_file_path, started, lease_owner, error=e
+            )
+            self.repository.finish_upload(script_id, lease_owner, self._error_values())
+            raise
+        except Exception as e:
+            # 기타 예외 처리 (실패한 트랜잭션 정리 후 상태 업데이트)
+            self.db.rollback()
+            self._record_youtube_event(
+                script_id, video_file_path, started, lease_owner, error=e
+            )
+            self.repository.finish_upload(script_id, lease_owner, self._error_values())
+            raise YouTubeUploadError(str(e))
 
-            # DB 업데이트
-            script.youtube_video_id = video_id
-            script.status = "scheduled" if scheduled_time else "uploaded"
-            if scheduled_time:
-                script.scheduled_time = datetime.fromisoformat(
-                    scheduled_time.replace("Z", "+00:00")
-                )
-            script.updated_at = datetime.utcnow()
+        # DB 업데이트 (이미 게시된 영상이므로 에러 상태로 바꾸지 않음)
+        values = self._youtube_result_values(video_id, scheduled_time)
+        self._record_youtube_event(
+            script_id,
+            video_file_path,
+            started,
+            lease_owner,
+            to_status=values["status"],
+            video_id=video_id,
+        )
+        try:
+            updated_script = self.repository.finish_upload(
+                script_id, lease_owner, values
+            )
+        except Exception as e:
+            self.db.rollback()
+            raise self._result_not_saved(script_id, video_id, str(e))
+        if not updated_script:
+            raise self._result_not_saved(script_id, video_id, "작업 임대 만료")
 
-            updated_script = self.repository.update(script)
+        return self._youtube_upload_result(updated_script, video_id, metadata)
 
-            return {
-                "id": updated_script.id,
-                "title": updated_script.title,
-                "status": updated_script.status,
-                "youtube_video_id": video_id,
-                "youtube_url": f"https://www.youtube.com/watch?v={video_id}",
-                "privacy_status": metadata["privacy_status"],
-                "scheduled_time": updated_script.scheduled_time,
-                "message": "YouTube 업로드 성공",
-                "upload_timestamp": updated_script.updated_at,
-            }
+    @traced()
+    def claim_upload_jobs(
+        self, worker_id: Optional[str] = None, limit: int = 1
+    ) -> dict:
+        """업로드 대기 중인 대본을 작업자에게 할당
 
-        except YouTubeUploadError:
-            # YouTube 업로드 실패 시 상태 업데이트
-            script.status = "error"
-            script.updated_at = datetime.utcnow()
-            self.repository.update(script)
-            raise
+        반환된 lease_owner를 upload_to_youtube에 전달하면 임대가 만료되기
+        전까지 해당 작업자만 업로드할 수 있습니다.
+        """
+        lease_owner = worker_id or self._new_lease_owner()
+        try:
+            scripts = self.repository.claim_next_for_upload(
+                lease_owner, limit, self.settings.upload_lease_seconds
+            )
         except Exception as e:
-            # 기타 예외 처리
-            script.status = "error"
-            script.updated_at = datetime.utcnow()
-            self.repository.update(script)
-            raise YouTubeUploadError(str(e))
+            raise DatabaseError(f"업로드 작업 할당 실패: {str(e)}")
+
+        return {
+            "lease_owner": lease_owner,
+            "jobs": [self._claimed_job(script) for script in scripts],
+        }
 
+    def get_upload_status_etag(self, script_id: int) -> str:
+        """업로드 상태 ETag (대본 단건 ETag와 동일 기준)"""
+        script = self.repository.find_by_id(script_id)
+        if not script:
+            raise ScriptNotFoundError(script_id)
+        return script_etag(script)
+
+    @traced()
     def get_upload_status(self, script_id: int) -> dict:
-        """업로드 상태 조회"""
-        script = self.repository.get_by_id(script_id)
+        """업로드 상태 조회 (보관된 대본 포함)"""
+        script = self.repository.find_by_id(script_id)
         if not script:
             raise ScriptNotFoundError(script_id)
 
         result = {
             "id": script.id,
+            "archived": isinstance(script, ArchivedScript),
             "title": script.title,
             "status": script.status,
             "created_at": script.created_at,
@@ -191,6 +523,26 @@ class UploadService:
 
         return result
 
+    @traced()
+    def get_upload_statistics(self, days: int = 7) -> dict:
+        """최근 days일 동안의 일자별 업로드 성공률, 평균 전송 시간, 오류 분포"""
+        # 아직 버퍼에 남아 있는 이벤트까지 반영
+        self.event_log.flush()
+
+        since = datetime.utcnow().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=days - 1)
+        repository = UploadLogRepository(self.db)
+        try:
+            return {
+                "since": since.date().isoformat(),
+                "daily": repository.get_daily_upload_summary(since),
+                "errors": repository.get_daily_error_breakdown(since),
+            }
+        except Exception as e:
+            raise DatabaseError(f"업로드 통계 조회 실패: {str(e)}")
+
+    @traced()
     def delete_video_file(self, script_id: int) -> dict:
         """업로드된 비디오 파일 삭제"""
         script = self.repository.get_by_id(script_id)
@@ -202,6 +554,7 @@ class UploadService:
 
         file_path = script.video_file_path
         file_existed = os.path.exists(file_path)
+        file_size = os.path.getsize(file_path) if file_existed else None
 
         try:
             # 파일 삭제
@@ -220,6 +573,13 @@ class UploadService:
             script.updated_at = datetime.utcnow()
 
             updated_script = self.repository.update(script)
+            self.event_log.record(
+                script_id,
+                EVENT_VIDEO_DELETED,
+                from_status=old_status,
+                to_status=updated_script.status,
+                bytes=file_size,
+            )
 
             return {
                 "id": updated_script.id,
@@ -239,75 +599,118 @@ class UploadService:
         except Exception as e:
             raise FileUploadError(f"파일 삭제 실패: {str(e)}")
 
-    def _validate_video_file(self, video_file: UploadFile) -> None:
-        """비디오 파일 검증"""
-        if not video_file.filename:
-            raise FileValidationError("파일명이 없습니다.")
 
-        # 파일 확장자 검증
-        file_extension = (
-            "." + video_file.filename.split(".")[-1].lower()
-            if "." in video_file.filename
-            else ""
-        )
+class AsyncUploadService(BaseUploadService):
+    """업로드 관리 서비스 (비동기 세션용)
 
-        if file_extension not in self.settings.allowed_video_extensions:
-            raise FileValidationError(
-                f"지원되지 않는 비디오 형식입니다. 지원 형식: {', '.join(self.settings.allowed_video_extensions)}"
-            )
+    DB 호출은 await 하고, 파일 저장 및 YouTube 업로드 같은 블로킹 I/O는
+    스레드풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    """
 
-    def _save_video_file(self, script_id: int, video_file: UploadFile) -> str:
-        """비디오 파일 저장"""
-        upload_dir = self.settings.upload_dir
-        os.makedirs(upload_dir, exist_ok=True)
+    def __init__(self, db: AsyncSession):
+        super().__init__()
+        self.db = db
+        self.repository = AsyncScriptRepository(db)
 
-        # 안전한 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_filename = f"script_{script_id}_{timestamp}_{video_file.filename}"
-        file_path = os.path.join(upload_dir, safe_filename)
+    @traced()
+    async def upload_video_file(self, script_id: int, video_file: UploadFile) -> dict:
+        """영상 파일 업로드 및 대본과 매칭"""
+        script = await self.repository.get_by_id(script_id)
+        self._check_ready_for_video(script, script_id)
+
+        self._validate_video_file(video_file)
+
+        started = time.perf_counter()
+        file_path = await run_in_threadpool(
+            self._save_video_file, script_id, video_file
+        )
 
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(video_file.file, buffer)
-            return file_path
-        except Exception as e:
-            raise FileUploadError(f"파일 저장 실패: {str(e)}")
+            self._apply_video_file(script, file_path)
+            updated_script = await self.repository.update(script)
+            self._record_video_attached(updated_script, file_path, started)
 
-    def _validate_privacy_status(self, privacy_status: str) -> None:
-        """공개 설정 검증"""
-        valid_privacy_statuses = ["private", "unlisted", "public"]
-        if privacy_status not in valid_privacy_statuses:
-            raise FileValidationError(
-                f"잘못된 공개 설정입니다. 가능한 값: {', '.join(valid_privacy_statuses)}"
-            )
+            return self._video_upload_result(updated_script, file_path, video_file)
 
-    def _build_upload_metadata(
+        except Exception as e:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise DatabaseError(f"데이터베이스 업데이트 실패: {str(e)}")
+
+    @traced()
+    async def upload_to_youtube(
         self,
-        script: Script,
-        privacy_status: str,
-        category_id: int,
-        scheduled_time: Optional[str],
+        script_id: int,
+        scheduled_time: Optional[str] = None,
+        privacy_status: Optional[str] = None,
+        category_id: Optional[int] = None,
+        lease_owner: Optional[str] = None,
     ) -> dict:
-        """업로드 메타데이터 구성"""
-        metadata = {
-            "title": script.title,
-            "description": script.description or "",
-            "tags": script.tags or "",
-            "category_id": category_id,
-            "privacy_status": privacy_status,
-        }
+        """YouTube에 비디오 업로드 (업로드 작업 점유 후 실행)"""
+        script = await self.repository.get_by_id(script_id)
+        self._check_ready_for_youtube(script, script_id)
 
-        # 예약 발행 시간 설정
-        if scheduled_time:
-            try:
-                scheduled_datetime = datetime.fromisoformat(
-                    scheduled_time.replace("Z", "+00:00")
-                )
-                metadata["scheduled_time"] = scheduled_datetime.isoformat()
-                metadata["privacy_status"] = "private"  # 예약 발행시 일단 private
-            except ValueError:
-                raise FileValidationError(
-                    "잘못된 날짜 형식입니다. ISO 8601 형식을 사용하세요 (예: 2025-01-20T14:00:00)"
-                )
+        privacy_status, category_id = self._resolve_upload_options(
+            privacy_status, category_id
+        )
 
-        return metadata
+        lease_owner = lease_owner or self._new_lease_owner()
+        script = await self.repository.claim_script(
+            script_id, lease_owner, self.settings.upload_lease_seconds
+        )
+        if not script:
+            raise UploadLeaseConflictError(script_id)
+
+        video_file_path = script.video_file_path
+        started = time.perf_counter()
+        try:
+            metadata = self._build_upload_metadata(
+                script,
+                privacy_status,
+                category_id,
+                scheduled_time,
+                await self.repository.get_tag_names(script_id),
+            )
+
+            video_id = await run_in_threadpool(
+                self._upload_via_youtube, video_file_path, metadata
+            )
+
+        except YouTubeUploadError as e:
+            self._record_youtube_event(
+                script_id, video_file_path, started, lease_owner, error=e
+            )
+            await self.repository.finish_upload(
+                script_id, lease_owner, self._error_values()
+            )
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            self._record_youtube_event(
+                script_id, video_file_path, started, lease_owner, error=e
+            )
+            await self.repository.finish_upload(
+                script_id, lease_owner, self._error_values()
+            )
+            raise YouTubeUploadError(str(e))
+
+        values = self._youtube_result_values(video_id, scheduled_time)
+        self._record_youtube_event(
+            script_id,
+            video_file_path,
+            started,
+            lease_owner,
+            to_status=values["status"],
+            video_id=video_id,
+        )
+        try:
+            updated_script = await self.repository.finish_upload(
+                script_id, lease_owner, values
+            )
+        except Exception as e:
+            await self.db.rollback()
+            raise self._result_not_saved(script_id, video_id, str(e))
+        if not updated_script:
+            raise self._result_not_saved(script_id, video_id, "작업 임대 만료")
+
+        return self._youtube_upload_result(updated_script, video_id, metadata)
@@ -3,23 +3,30 @@ YouTube API 인증 관리자
 """
 
 import os
-import pickle
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+from typing import TYPE_CHECKING
 
 from ...config import get_settings
 from ...core.exceptions import YouTubeAuthenticationError
+from ...core.tracing import traced
+from .credential_store import get_credential_store
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 
 class YouTubeAuthManager:
-    """YouTube API 인증 관리"""
+    """YouTube API 인증 관리
+
+    토큰은 프로세스 간에 공유되는 CredentialStore에서 가져오므로
+    매 인증마다 파일을 읽거나 역직렬화하지 않습니다.
+    """
 
     def __init__(self):
         self.settings = get_settings()
+        self.store = get_credential_store(self.settings)
         self.credentials = None
 
+    @traced()
     def authenticate(self) -> bool:
         """OAuth 2.0 인증 수행
 
@@ -27,34 +34,21 @@ class YouTubeAuthManager:
             인증 성공 여부
         """
         creds = None
-        token_path = str(self.settings.token_file_path)
-
-        # 기존 토큰이 있으면 로드
-        if os.path.exists(token_path):
-            with open(token_path, "rb") as token:
-                creds = pickle.load(token)
+        try:
+            # 만료된 토큰은 저장소에서 한 프로세스만 갱신
+            creds = self.store.get_valid_credentials()
+        except YouTubeAuthenticationError as e:
+            print(f"❌ {e.message}")
 
         # 유효한 자격증명이 없으면 새로 인증
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                print("🔄 기존 토큰 갱신 중...")
-                try:
-                    creds.refresh(Request())
-                    print("✅ 토큰 갱신 성공")
-                except Exception as e:
-                    print(f"❌ 토큰 갱신 실패: {e}")
-                    creds = None
-
-            if not creds:
-                creds = self._perform_oauth_flow()
-
-            # 토큰 저장
-            self._save_credentials(creds, token_path)
+        if not creds:
+            creds = self._perform_oauth_flow()
+            self._save_credentials(creds)
 
         self.credentials = creds
         return True
 
-    def _perform_oauth_flow(self) -> Credentials:
+    def _perform_oauth_flow(self) -> "Credentials":
         """OAuth 플로우 수행"""
         print("🔐 새로운 OAuth 인증 시작...")
 
@@ -64,6 +58,8 @@ class YouTubeAuthManager:
                 f"credentials.json 파일을 찾을 수 없습니다: {credentials_path}"
             )
 
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         try:
             flow = InstalledAppFlow.from_client_secrets_file(
                 credentials_path, self.settings.youtube_api_scopes
@@ -74,16 +70,15 @@ class YouTubeAuthManager:
         except Exception as e:
             raise YouTubeAuthenticationError(f"OAuth 인증 실패: {e}")
 
-    def _save_credentials(self, creds: Credentials, token_path: str) -> None:
+    def _save_credentials(self, creds: "Credentials") -> None:
         """인증 정보 저장"""
         try:
-            with open(token_path, "wb") as token:
-                pickle.dump(creds, token)
-            print(f"💾 토큰 저장 완료: {token_path}")
+            self.store.save(creds)
+            print(f"💾 토큰 저장 완료: {self.store.token_path}")
         except Exception as e:
             print(f"⚠️  토큰 저장 실패: {e}")
 
-    def get_credentials(self) -> Credentials:
+    def get_credentials(self) -> "Credentials":
         """인증된 자격증명 반환"""
         if not self.credentials:
             raise YouTubeAuthenticationError(
@@ -4,9 +4,8 @@ YouTube 채널 관리자
 
 from typing import Optional
 
-from googleapiclient.discovery import build
-
 from ...core.exceptions import YouTubeAuthenticationError
+from ...core.tracing import span, traced
 from .auth_manager import YouTubeAuthManager
 
 
@@ -23,9 +22,14 @@ class YouTubeChannelManager:
             raise YouTubeAuthenticationError("인증이 필요합니다.")
 
         if not self.youtube:
+            # googleapiclient는 import 비용이 커서 첫 사용 시점에 로드
+            from googleapiclient.discovery import build
+
             credentials = self.auth_manager.get_credentials()
-            self.youtube = build("youtube", "v3", credentials=credentials)
+            with span("youtube.discovery_build"):
+                self.youtube = build("youtube", "v3", credentials=credentials)
 
+    @traced()
     def get_channel_info(self) -> Optional[dict]:
         """현재 인증된 채널 정보 조회
 
@@ -0,0 +1,261 @@
+"""
+YouTube OAuth 자격증명 저장소
+
+여러 uvicorn 워커가 같은 토큰 파일을 안전하게 공유하도록
+- 프로세스 내 메모리 캐시 (파일이 바뀌었을 때만 다시 읽음)
+- JSON 형식 원자적 쓰기 (임시 파일 + os.replace)
+- 프로세스 간 파일 잠금
+- 단일 갱신(single-flight): 한 번에 한 프로세스/스레드만 토큰 갱신
+을 제공하고, 기존 token.pickle 토큰을 JSON으로 이전합니다.
+"""
+
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from ...core.exceptions import YouTubeAuthenticationError
+from ...core.tracing import span
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+logger = logging.getLogger(__name__)
+
+if os.name == "nt":  # pragma: no cover - Windows
+    import msvcrt
+
+    def _lock_file(handle) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(handle) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(handle) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(handle) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class CredentialStore:
+    """토큰 파일 기반 자격증명 저장소 (프로세스당 하나를 공유)"""
+
+    def __init__(
+        self,
+        token_path: Path,
+        scopes: List[str],
+        legacy_pickle_path: Optional[Path] = None,
+    ):
+        self.token_path = Path(token_path)
+        self.lock_path = self.token_path.with_name(self.token_path.name + ".lock")
+        self.scopes = scopes
+        self.legacy_pickle_path = (
+            Path(legacy_pickle_path) if legacy_pickle_path else None
+        )
+        self._credentials: Optional["Credentials"] = None
+        self._loaded_mtime: Optional[int] = None
+        # 같은 프로세스 내 스레드 간 단일 갱신
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 잠금 / 파일 I/O
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _process_lock(self) -> Iterator[None]:
+        """프로세스 간 배타 잠금 (토큰 파일 옆 .lock 파일)"""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.lock_path, "a+b") as handle:
+            _lock_file(handle)
+            try:
+                yield
+            finally:
+                _unlock_file(handle)
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return self.token_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _read(self) -> Optional["Credentials"]:
+        """디스크에서 JSON 토큰 로드 (mtime 기록)"""
+        mtime = self._file_mtime()
+        if mtime is None:
+            self._credentials, self._loaded_mtime = None, None
+            return None
+
+        from google.oauth2.credentials import Credentials
+
+        with open(self.token_path, encoding="utf-8") as token_file:
+            info = json.load(token_file)
+        self._credentials = Credentials.from_authorized_user_info(info, self.scopes)
+        self._loaded_mtime = mtime
+        return self._credentials
+
+    def _write(self, credentials: "Credentials") -> None:
+        """임시 파일에 쓴 뒤 os.replace로 원자적으로 교체"""
+        self.token_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.token_path.parent, prefix=f".{self.token_path.name}."
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(credentials.to_json())
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.token_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._credentials = credentials
+        self._loaded_mtime = self._file_mtime()
+
+    def _migrate_legacy_pickle(self) -> Optional["Credentials"]:
+        """기존 token.pickle이 있으면 JSON으로 이전 (잠금 안에서 호출)"""
+        legacy = self.legacy_pickle_path
+        if legacy is None or self.token_path.exists() or not legacy.exists():
+            return None
+
+        try:
+            with open(legacy, "rb") as token_file:
+                credentials = pickle.load(token_file)
+        except Exception as e:
+            logger.warning(f"기존 pickle 토큰을 읽을 수 없습니다 ({legacy}): {e}")
+            return None
+
+        self._write(credentials)
+        legacy.rename(legacy.with_name(legacy.name + ".migrated"))
+        logger.info(f"pickle 토큰을 JSON으로 이전: {legacy} -> {self.token_path}")
+        return credentials
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def load(self) -> Optional["Credentials"]:
+        """자격증명 조회 (파일이 바뀌지 않았으면 메모리 캐시 사용)"""
+        with self._lock:
+            if (
+                self._credentials is not None
+                and self._loaded_mtime == self._file_mtime()
+            ):
+                return self._credentials
+
+        with self._process_lock():
+            return self._migrate_legacy_pickle() or self._read()
+
+    def save(self, credentials: "Credentials") -> None:
+        """자격증명 저장 (원자적 쓰기)"""
+        with self._process_lock():
+            self._write(credentials)
+
+    def get_valid_credentials(
+        self, refresh: Optional[Callable[["Credentials"], None]] = None
+    ) -> Optional["Credentials"]:
+        """유효한 자격증명 반환 (만료 시 단일 갱신)
+
+        잠금을 얻은 뒤 파일을 다시 읽어, 다른 프로세스가 이미 갱신했으면
+        그 결과를 사용하고 직접 갱신하지 않습니다.
+
+        Returns:
+            유효한 자격증명, 저장된 토큰이 없거나 갱신할 수 없으면 None
+        """
+        credentials = self.load()
+        if credentials is None or credentials.valid:
+            return credentials
+        if not credentials.refresh_token:
+            return None
+
+        with self._process_lock():
+            credentials = self._read()
+            if credentials is None or credentials.valid:
+                return credentials
+            return self._refresh_locked(credentials, refresh)
+
+    def refresh_if_expiring(
+        self,
+        margin_seconds: float,
+        refresh: Optional[Callable[["Credentials"], None]] = None,
+    ) -> Optional["Credentials"]:
+        """만료까지 margin_seconds 이하로 남았으면 미리 갱신
+
+        Returns:
+            현재(또는 갱신된) 자격증명, 저장된 토큰이 없으면 None
+        """
+        with self._process_lock():
+            credentials = self._read()
+            if credentials is None:
+                return None
+            remaining = seconds_until_expiry(credentials)
+            if credentials.token and (remaining is None or remaining > margin_seconds):
+                return credentials
+            return self._refresh_locked(credentials, refresh)
+
+    def _refresh_locked(
+        self,
+        credentials: "Credentials",
+        refresh: Optional[Callable[["Credentials"], None]],
+    ) -> "Credentials":
+        """토큰 갱신 후 저장 (프로세스 잠금 안에서 호출)"""
+        if not credentials.refresh_token:
+            raise YouTubeAuthenticationError("refresh token이 없어 갱신할 수 없습니다.")
+
+        logger.info("YouTube 액세스 토큰 갱신")
+        try:
+            with span("youtube.token_refresh"):
+                (refresh or _refresh_with_google)(credentials)
+        except Exception as e:
+            raise YouTubeAuthenticationError(f"토큰 갱신 실패: {e}")
+        self._write(credentials)
+        return credentials
+
+    def clear_cache(self) -> None:
+        """메모리 캐시 비우기 (다음 조회 시 파일에서 다시 읽음)"""
+        with self._lock:
+            self._credentials, self._loaded_mtime = None, None
+
+
+def seconds_until_expiry(credentials: "Credentials") -> Optional[float]:
+    """만료까지 남은 시간(초), 만료 시각이 없으면 None"""
+    if credentials.expiry is None:
+        return None
+    return (credentials.expiry - datetime.utcnow()).total_seconds()
+
+
+def _refresh_with_google(credentials: "Credentials") -> None:
+    from google.auth.transport.requests import Request
+
+    credentials.refresh(Request())
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_credential_store(settings) -> CredentialStore:
+    """토큰 경로별 공유 CredentialStore 반환"""
+    token_path = settings.token_file_path.resolve()
+    with _stores_lock:
+        store = _stores.get(token_path)
+        if store is None:
+            store = CredentialStore(
+                token_path,
+                settings.youtube_api_scopes,
+                legacy_pickle_path=settings.legacy_token_file_path,
+            )
+            _stores[token_path] = store
+        return store
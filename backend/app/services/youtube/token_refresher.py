@@ -0,0 +1,160 @@
+"""
+YouTube 액세스 토큰 백그라운드 갱신기
+
+만료 TOKEN_REFRESH_MARGIN_SECONDS 전에 미리 토큰을 갱신하여 업로드 요청
+경로에서 Google 토큰 엔드포인트 왕복이 일어나지 않도록 합니다.
+갱신에 실패하면 지수 백오프로 재시도합니다.
+"""
+
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+
+from ...config import get_settings
+from ...core.logging import get_service_logger
+from .credential_store import (
+    CredentialStore,
+    get_credential_store,
+    seconds_until_expiry,
+)
+
+logger = get_service_logger("token_refresher")
+
+
+class TokenRefresher:
+    """주기적으로 토큰 만료를 확인하고 갱신하는 백그라운드 스레드"""
+
+    def __init__(
+        self,
+        store_factory: Optional[Callable[[], CredentialStore]] = None,
+        margin_seconds: float = 600.0,
+        check_interval: float = 60.0,
+        backoff_base: float = 5.0,
+        backoff_max: float = 900.0,
+    ):
+        self.store_factory = store_factory
+        self.margin_seconds = margin_seconds
+        self.check_interval = check_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.consecutive_failures = 0
+        self.last_error: Optional[str] = None
+        self.last_refresh_at: Optional[datetime] = None
+        self.last_check_at: Optional[datetime] = None
+        self.next_delay = 0.0
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _store(self) -> CredentialStore:
+        if self.store_factory is not None:
+            return self.store_factory()
+        return get_credential_store(get_settings())
+
+    def run_once(self) -> float:
+        """만료 확인 및 필요 시 갱신 1회 실행
+
+        Returns:
+            다음 확인까지 대기할 시간(초)
+        """
+        store = self._store()
+        self.last_check_at = datetime.utcnow()
+        previous = store.load()
+        previous_token = previous.token if previous is not None else None
+
+        try:
+            credentials = store.refresh_if_expiring(self.margin_seconds)
+        except Exception as e:
+            self.consecutive_failures += 1
+            self.last_error = str(e)
+            self.next_delay = min(
+                self.backoff_max,
+                self.backoff_base * 2 ** (self.consecutive_failures - 1),
+            )
+            logger.warning(
+                f"토큰 갱신 실패 ({self.consecutive_failures}회 연속), "
+                f"{self.next_delay:.0f}초 후 재시도: {e}"
+            )
+            return self.next_delay
+
+        self.consecutive_failures = 0
+        self.last_error = None
+        if credentials is not None and credentials.token != previous_token:
+            self.last_refresh_at = datetime.utcnow()
+            logger.info(f"토큰 사전 갱신 완료 (만료: {credentials.expiry})")
+
+        # 만료 margin 직전에 다시 깨어나도록 대기 시간 조정
+        remaining = seconds_until_expiry(credentials) if credentials else None
+        self.next_delay = self.check_interval
+        if remaining is not None:
+            self.next_delay = max(
+                1.0, min(self.check_interval, remaining - self.margin_seconds)
+            )
+        return self.next_delay
+
+    def health(self) -> dict:
+        """토큰 상태 (/health 응답용)"""
+        try:
+            credentials = self._store().load()
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+
+        if credentials is None:
+            return {"status": "missing"}
+
+        remaining = seconds_until_expiry(credentials)
+        if remaining is not None and remaining <= 0:
+            status = "expired"
+        elif self.consecutive_failures:
+            status = "degraded"
+        elif remaining is not None and remaining <= self.margin_seconds:
+            status = "expiring"
+        else:
+            status = "ok"
+
+        return {
+            "status": status,
+            "expires_at": credentials.expiry,
+            "seconds_remaining": round(remaining) if remaining is not None else None,
+            "refresher_running": self._thread is not None,
+            "last_refresh_at": self.last_refresh_at,
+            "last_check_at": self.last_check_at,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+    def start(self) -> None:
+        """백그라운드 갱신 시작"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="token-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 갱신 중지"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                delay = self.run_once()
+            except Exception as e:
+                logger.error(f"토큰 갱신기 오류: {str(e)}")
+                delay = self.check_interval
+            self._stopped.wait(delay)
+
+
+_settings = get_settings()
+token_refresher = TokenRefresher(
+    margin_seconds=_settings.token_refresh_margin_seconds,
+    check_interval=_settings.token_refresh_check_interval_seconds,
+    backoff_base=_settings.token_refresh_backoff_base_seconds,
+    backoff_max=_settings.token_refresh_backoff_max_seconds,
+)
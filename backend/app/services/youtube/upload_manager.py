@@ -5,9 +5,6 @@ YouTube 업로드 관리자
 import os
 from typing import Optional
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-
 from ...config import get_settings
 from ...core.exceptions import (
     UnverifiedProjectRestrictionError,
@@ -15,6 +12,7 @@ from ...core.exceptions import (
     YouTubeAuthenticationError,
     YouTubeUploadError,
 )
+from ...core.tracing import span, traced
 from .auth_manager import YouTubeAuthManager
 
 
@@ -32,9 +30,14 @@ class YouTubeUploadManager:
             raise YouTubeAuthenticationError("인증이 필요합니다.")
 
         if not self.youtube:
+            # googleapiclient는 import 비용이 커서 첫 사용 시점에 로드
+            from googleapiclient.discovery import build
+
             credentials = self.auth_manager.get_credentials()
-            self.youtube = build("youtube", "v3", credentials=credentials)
+            with span("youtube.discovery_build"):
+                self.youtube = build("youtube", "v3", credentials=credentials)
 
+    @traced()
     def upload_video(self, video_path: str, metadata: dict) -> Optional[str]:
         """YouTube에 비디오 업로드
 
@@ -76,6 +79,8 @@ class YouTubeUploadManager:
             print(f"📤 비디오 업로드 시작: {video_path}")
             print(f"📝 제목: {metadata['title']}")
 
+            from googleapiclient.http import MediaFileUpload
+
             # 미디어 파일 업로드 객체 생성
             media = MediaFileUpload(
                 video_path, chunksize=-1, resumable=True  # 한 번에 전체 파일 업로드
@@ -86,7 +91,8 @@ class YouTubeUploadManager:
                 part=",".join(body.keys()), body=body, media_body=media
             )
 
-            response = request.execute()
+            with span("youtube.transfer", bytes=os.path.getsize(video_path)):
+                response = request.execute()
             video_id = response["id"]
 
             print(f"✅ 업로드 성공! 비디오 ID: {video_id}")
@@ -97,6 +103,7 @@ class YouTubeUploadManager:
         except Exception as e:
             raise YouTubeUploadError(f"비디오 업로드 실패: {e}")
 
+    @traced()
     def get_video_info(self, video_id: str) -> Optional[dict]:
         """비디오 정보 조회
 
@@ -135,6 +142,7 @@ class YouTubeUploadManager:
             print(f"❌ 비디오 정보 조회 실패: {e}")
             return None
 
+    @traced()
     def update_video_metadata(self, video_id: str, metadata: dict) -> bool:
         """비디오 메타데이터 업데이트"""
         self._ensure_authenticated()
@@ -183,6 +191,17 @@ class YouTubeUploadManager:
             print(f"❌ 비디오 메타데이터 업데이트 실패: {e}")
             return False
 
+    @staticmethod
+    def _limit_tags(tags: list, max_length: int = 500) -> list:
+        """태그 목록을 구분자 포함 전체 길이 max_length 이내로 제한"""
+        limited, length = [], 0
+        for tag in tags:
+            length += len(tag) + (1 if limited else 0)
+            if length > max_length:
+                break
+            limited.append(tag)
+        return limited
+
     def _build_upload_body(self, metadata: dict) -> dict:
         """업로드용 메타데이터 구성"""
         # 태그 처리 (최대 500자 제한)
@@ -192,7 +211,10 @@ class YouTubeUploadManager:
             if len(tags) > 500:
                 tags = tags[:500]
             tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
-        elif not isinstance(tags, list):
+        elif isinstance(tags, list):
+            # 이미 정규화된 목록은 분리 없이 전체 길이 제한만 적용
+            tags = self._limit_tags(tags)
+        else:
             tags = []
 
         # 설명 바이트 단위 제한 (5000 바이트)
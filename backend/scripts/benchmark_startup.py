@@ -0,0 +1,108 @@
+"""
+콜드 스타트 벤치마크
+
+새 인터프리터에서 app.main import 시간과 lifespan 시작 시간을 반복 측정하고,
+python -X importtime 결과를 최상위 패키지별로 묶어 import 시간 분포를 출력합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.benchmark_startup --runs 5 --top 15
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# import와 lifespan 시작을 분리하여 측정 (결과는 "import_s startup_s" 한 줄)
+MEASURE_CODE = """
+import asyncio, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+async def run_lifespan():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = asyncio.run(run_lifespan())
+print(f"{imported - started:.6f} {ready - imported:.6f}")
+"""
+
+
+def measure_once() -> Tuple[float, float]:
+    """새 프로세스에서 (import 시간, lifespan 시작 시간) 측정"""
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_s, startup_s = result.stdout.strip().splitlines()[-1].split()
+    return float(import_s), float(startup_s)
+
+
+def import_breakdown() -> Dict[str, int]:
+    """python -X importtime 결과를 최상위 패키지별 자체 시간(us)으로 집계"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    totals: Dict[str, int] = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        top_level = module.strip().split(".")[0]
+        if top_level == "app":
+            top_level = ".".join(module.strip().split(".")[:2])
+        totals[top_level] += int(self_us)
+    return dict(totals)
+
+
+def _summary(label: str, samples: List[float]) -> str:
+    return (
+        f"{label:<10} median={statistics.median(samples) * 1000:8.1f}ms "
+        f"min={min(samples) * 1000:8.1f}ms max={max(samples) * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="app.main 콜드 스타트 측정")
+    parser.add_argument("--runs", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--top", type=int, default=15, help="출력할 패키지 수")
+    args = parser.parse_args()
+
+    samples = [measure_once() for _ in range(args.runs)]
+    imports = [sample[0] for sample in samples]
+    startups = [sample[1] for sample in samples]
+
+    print(f"=== Cold start ({args.runs} runs) ===")
+    print(_summary("import", imports))
+    print(_summary("lifespan", startups))
+    print(_summary("total", [i + s for i, s in samples]))
+
+    breakdown = import_breakdown()
+    total_us = sum(breakdown.values())
+    print(f"\n=== Import time by package (top {args.top}) ===")
+    for package, self_us in sorted(breakdown.items(), key=lambda item: -item[1])[
+        : args.top
+    ]:
+        print(f"{package:<32} {self_us / 1000:8.1f}ms {self_us / total_us * 100:5.1f}%")
+
+    loaded_youtube = [
+        package for package in breakdown if package in ("google", "googleapiclient")
+    ]
+    print(f"\nYouTube stack loaded at import: {'yes' if loaded_youtube else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,22 +6,46 @@ import pytest
 import tempfile
 import shutil
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 
 from app.database import Base
 from app.main import app
 from app.config import Settings
-from app.database import get_db
+from app.core.query_metrics import instrument_engine, route_query_metrics
+from app.database import (
+    get_async_db,
+    get_db,
+    get_session_factory,
+    to_async_url,
+)
+from app.repositories.script_repository import script_cache, statistics_cache
+from app.services.upload_event_log import upload_event_log
 
 
 @pytest.fixture
-def test_db():
-    """테스트용 인메모리 데이터베이스"""
-    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+def test_db(tmp_path):
+    """테스트용 임시 파일 데이터베이스
+
+    동기 세션(get_db)과 비동기 세션(get_async_db)이 같은 DB를 바라보도록
+    임시 파일 SQLite를 사용합니다.
+    """
+    db_url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(db_url, connect_args={"check_same_thread": False})
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # TestClient는 요청마다 이벤트 루프가 달라질 수 있으므로 커넥션을 재사용하지 않음
+    async_engine = create_async_engine(to_async_url(db_url), poolclass=NullPool)
+    TestingAsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+    
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
     
     Base.metadata.create_all(bind=engine)
+    route_query_metrics.reset()
+    statistics_cache.clear()
+    script_cache.clear()
     
     def override_get_db():
         try:
@@ -29,12 +53,25 @@ def test_db():
             yield db
         finally:
             db.close()
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    upload_event_log.session_factory = TestingSessionLocal
     
-    yield TestingSessionLocal()
+    session = TestingSessionLocal()
+    yield session
     
+    session.close()
+    # 남은 업로드 이벤트는 테스트 DB에 기록하고 기본 세션으로 복귀
+    upload_event_log.flush()
+    upload_event_log.session_factory = None
     app.dependency_overrides.clear()
+    engine.dispose()
 
 
 @pytest.fixture
@@ -0,0 +1,116 @@
+"""
+대본 보관(archive) 테스트
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.archived_script import ArchivedScript
+from app.models.script import Script
+from app.repositories.script_repository import ScriptRepository
+from app.services.script_archiver import ScriptArchiver
+
+
+def add_uploaded(repository: ScriptRepository, index: int, age_days: int, **kwargs):
+    """age_days 전에 업로드 완료된 대본 생성"""
+    values = {
+        "title": f"대본 {index}",
+        "content": "본문 " * 500,
+        "tags": "시니어",
+        "status": "uploaded",
+        "youtube_video_id": f"vid-{index}",
+        "updated_at": datetime.utcnow() - timedelta(days=age_days),
+    }
+    values.update(kwargs)
+    return repository.create(Script(**values))
+
+
+def test_archive_moves_old_uploaded_scripts(test_db):
+    """오래된 uploaded 대본만 이동"""
+    repository = ScriptRepository(test_db)
+    old = add_uploaded(repository, 0, 400)
+    recent = add_uploaded(repository, 1, 10)
+    pending = add_uploaded(
+        repository, 2, 400, status="video_ready", youtube_video_id=None
+    )
+    newest = add_uploaded(repository, 3, 400)
+    old_id, recent_id, pending_id, newest_id = old.id, recent.id, pending.id, newest.id
+
+    archived_ids = repository.archive_uploaded_before(
+        datetime.utcnow() - timedelta(days=180)
+    )
+
+    assert archived_ids == [old_id, newest_id]
+    assert repository.get_by_id(old_id) is None
+    assert repository.get_tag_names(old_id) == []
+    assert {s.id for s in test_db.query(Script)} == {recent_id, pending_id}
+
+    # 최대 ID 행을 보관해도 새 대본에 그 ID가 재사용되지 않음
+    created = add_uploaded(repository, 4, 1)
+    assert created.id > newest_id
+
+    archived = repository.find_by_id(old_id)
+    assert isinstance(archived, ArchivedScript)
+    assert archived.content.startswith("본문")
+    assert repository.find_by_youtube_id("vid-0").id == old_id
+
+
+def test_archive_lookup_and_restore_endpoints(test_client, test_db):
+    """보관된 대본의 투명 조회와 복원"""
+    repository = ScriptRepository(test_db)
+    script_id = add_uploaded(repository, 0, 400).id
+    add_uploaded(repository, 1, 1)
+    assert test_client.get("/api/scripts/stats/summary").json()["archived"] == 0
+
+    response = test_client.post("/api/scripts/archive")
+    assert response.json()["archived"] == 1
+
+    detail = test_client.get(f"/api/scripts/{script_id}").json()
+    assert detail["archived_at"] is not None
+    assert test_client.get("/api/scripts/youtube/vid-0").json()["id"] == script_id
+    status = test_client.get(f"/api/upload/status/{script_id}").json()
+    assert status["archived"] is True
+    summary = test_client.get("/api/scripts/stats/summary")
+    assert summary.json()["archived"] == 1
+    # 보관 개수도 통계 캐시에서 제공
+    cached = test_client.get("/api/scripts/stats/summary")
+    assert cached.headers["x-db-query-count"] == "0"
+
+    restored = test_client.post(f"/api/scripts/{script_id}/restore")
+    assert restored.status_code == 200
+    assert restored.json()["status"] == "uploaded"
+    assert test_client.get("/api/scripts/stats/summary").json()["archived"] == 0
+    assert test_db.query(ArchivedScript).count() == 0
+    assert repository.get_tag_names(script_id) == ["시니어"]
+
+    assert test_client.post(f"/api/scripts/{script_id}/restore").status_code == 404
+
+
+def test_import_restores_archived_youtube_id(test_db):
+    """가져오기 시 보관된 youtube_video_id는 복원 후 갱신"""
+    repository = ScriptRepository(test_db)
+    script_id = add_uploaded(repository, 0, 400).id
+    add_uploaded(repository, 1, 1)
+    repository.archive_uploaded_before(datetime.utcnow() - timedelta(days=180))
+
+    rows = [{"title": "갱신", "youtube_video_id": "vid-0"}]
+    assert repository.match_import_rows(rows) == [script_id]
+    repository.upsert_rows([], {script_id: rows[0]})
+
+    test_db.expire_all()
+    assert repository.get_by_id(script_id).title == "갱신"
+    assert test_db.query(ArchivedScript).count() == 0
+
+
+def test_archiver_run_once(test_db):
+    """백그라운드 보관기 1회 실행"""
+    from sqlalchemy.orm import sessionmaker
+
+    repository = ScriptRepository(test_db)
+    add_uploaded(repository, 0, 400)
+    add_uploaded(repository, 1, 400)
+    add_uploaded(repository, 2, 1)
+
+    archiver = ScriptArchiver(sessionmaker(bind=test_db.bind))
+
+    assert archiver.run_once() == 2
+    assert archiver.run_once() == 0
@@ -0,0 +1,85 @@
+"""
+비동기 Script Repository 및 async 라우트 테스트
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import Base, to_async_url
+from app.models.script import Script
+from app.repositories.async_script_repository import AsyncScriptRepository
+
+
+@pytest.fixture
+async def async_session(tmp_path):
+    """테스트용 비동기 세션"""
+    engine = create_async_engine(
+        to_async_url(f"sqlite:///{tmp_path / 'async.db'}"), poolclass=NullPool
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
+
+
+def test_to_async_url():
+    """동기 URL을 비동기 드라이버 URL로 변환"""
+    assert to_async_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert (
+        to_async_url("postgresql://user:pw@db/app")
+        == "postgresql+asyncpg://user:pw@db/app"
+    )
+
+
+async def test_async_repository_crud(async_session):
+    """비동기 Repository 생성/조회/상태 변경"""
+    repository = AsyncScriptRepository(async_session)
+
+    script = await repository.create(Script(title="비동기 대본", content="본문"))
+    assert script.id is not None
+
+    assert (await repository.get_by_id(script.id)).title == "비동기 대본"
+    assert await repository.count_by_status("script_ready") == 1
+
+    updated = await repository.update_status(script.id, "video_ready")
+    assert updated.status == "video_ready"
+    assert [s.id for s in await repository.get_by_status("video_ready")] == [script.id]
+
+    assert await repository.delete(script.id) is True
+    assert await repository.get_by_id(script.id) is None
+
+
+@pytest.mark.parametrize("update_returning", [True, False])
+async def test_async_claim_script(async_session, monkeypatch, update_returning):
+    """RETURNING 미지원 DB에서도 동기 Repository와 같은 점유 결과"""
+    dialect = async_session.get_bind().dialect
+    monkeypatch.setattr(dialect, "update_returning", update_returning)
+    repository = AsyncScriptRepository(async_session)
+    script = await repository.create(
+        Script(title="대본", content="본문", status="video_ready")
+    )
+
+    claimed = await repository.claim_script(script.id, "worker-a", 60)
+    assert claimed.lease_owner == "worker-a"
+    assert claimed.version == 2
+
+    assert await repository.claim_script(script.id, "worker-b", 60) is None
+    assert (await repository.claim_script(script.id, "worker-a", 60)).version == 3
+
+
+def test_upload_script_uses_async_session(test_client, sample_script_content):
+    """async 대본 업로드 라우트가 비동기 세션으로 저장"""
+    response = test_client.post(
+        "/api/scripts/upload",
+        files={"file": ("script.txt", sample_script_content.encode("utf-8"))},
+    )
+
+    assert response.status_code == 200
+    script_id = response.json()["id"]
+
+    detail = test_client.get(f"/api/scripts/{script_id}").json()
+    assert detail["title"] == "시니어의 지혜 이야기"
@@ -0,0 +1,72 @@
+"""
+응답 직렬화 및 압축 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.middleware import compression
+from app.middleware.compression import CompressionMiddleware
+from app.models.script import Script
+
+
+def _create_app():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse("할머니의 지혜 " * 200)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    return app
+
+
+def test_large_response_is_gzipped():
+    response = TestClient(_create_app()).get(
+        "/large", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == "할머니의 지혜 " * 200
+
+
+def test_small_response_is_not_compressed():
+    response = TestClient(_create_app()).get(
+        "/small", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli 미설치")
+def test_brotli_preferred_when_accepted():
+    response = TestClient(_create_app()).get(
+        "/large", headers={"Accept-Encoding": "br, gzip"}
+    )
+
+    assert response.headers["content-encoding"] == "br"
+
+
+def test_script_list_uses_response_model_and_compression(test_client, test_db):
+    test_db.add_all(
+        [
+            Script(title=f"대본 {i}", content="내용 " * 100, status="script_ready")
+            for i in range(20)
+        ]
+    )
+    test_db.commit()
+
+    response = test_client.get(
+        "/api/scripts/?fields=full", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["scripts"]) == 20
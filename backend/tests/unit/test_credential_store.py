@@ -0,0 +1,107 @@
+"""
+YouTube 자격증명 저장소 테스트
+"""
+
+import json
+import pickle
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from app.core.exceptions import YouTubeAuthenticationError
+from app.services.youtube.credential_store import CredentialStore
+
+SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+
+
+def _credentials(token="access", expires_in=3600):
+    return Credentials(
+        token=token,
+        refresh_token="refresh",
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client",
+        client_secret="secret",
+        scopes=SCOPES,
+        expiry=datetime.utcnow() + timedelta(seconds=expires_in),
+    )
+
+
+def _fake_refresh(calls):
+    def refresh(credentials):
+        calls.append(credentials.token)
+        time.sleep(0.05)
+        credentials.token = "refreshed"
+        credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+
+    return refresh
+
+
+def test_save_writes_json_and_load_uses_memory_cache(tmp_path, monkeypatch):
+    store = CredentialStore(tmp_path / "token.json", SCOPES)
+    store.save(_credentials())
+
+    assert json.loads((tmp_path / "token.json").read_text())["token"] == "access"
+
+    reader = CredentialStore(tmp_path / "token.json", SCOPES)
+    assert reader.load().token == "access"
+
+    reads = []
+    original_read = reader._read
+    monkeypatch.setattr(reader, "_read", lambda: reads.append(1) or original_read())
+    reader.load()
+    assert reads == []
+
+    # 다른 프로세스가 파일을 바꾸면 다시 읽음
+    store.save(_credentials(token="other"))
+    assert reader.load().token == "other"
+    assert reads == [1]
+
+
+def test_legacy_pickle_is_migrated(tmp_path):
+    legacy = tmp_path / "token.pickle"
+    legacy.write_bytes(pickle.dumps(_credentials(token="legacy")))
+
+    store = CredentialStore(tmp_path / "token.json", SCOPES, legacy_pickle_path=legacy)
+
+    assert store.load().token == "legacy"
+    assert (tmp_path / "token.json").exists()
+    assert not legacy.exists()
+    assert (tmp_path / "token.pickle.migrated").exists()
+
+
+def test_expired_token_is_refreshed_once_across_stores(tmp_path):
+    path = tmp_path / "token.json"
+    CredentialStore(path, SCOPES).save(_credentials(expires_in=-60))
+
+    # 서로 다른 저장소 인스턴스 = 서로 다른 워커 프로세스
+    stores = [CredentialStore(path, SCOPES) for _ in range(4)]
+    calls, results = [], []
+    threads = [
+        threading.Thread(
+            target=lambda s=store: results.append(
+                s.get_valid_credentials(_fake_refresh(calls)).token
+            )
+        )
+        for store in stores
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["access"]
+    assert results == ["refreshed"] * 4
+
+
+def test_refresh_failure_raises_auth_error(tmp_path):
+    store = CredentialStore(tmp_path / "token.json", SCOPES)
+    store.save(_credentials(expires_in=-60))
+
+    def failing_refresh(credentials):
+        raise RuntimeError("invalid_grant")
+
+    with pytest.raises(YouTubeAuthenticationError):
+        store.get_valid_credentials(failing_refresh)
@@ -0,0 +1,96 @@
+"""
+전역 에러 핸들링 미들웨어 테스트
+"""
+
+import asyncio
+
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import BaseAppException
+from app.middleware.error_handler import ErrorHandlerMiddleware
+
+
+def _create_app(background_calls=None):
+    app = FastAPI()
+    app.add_middleware(ErrorHandlerMiddleware)
+
+    @app.get("/app-error")
+    def app_error():
+        raise BaseAppException("잘못된 요청", 400)
+
+    @app.get("/crash")
+    def crash():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (f"chunk-{i}\n".encode() for i in range(3)), media_type="text/plain"
+        )
+
+    @app.get("/background")
+    def background(tasks: BackgroundTasks):
+        tasks.add_task(background_calls.append, "done")
+        return {"status": "ok"}
+
+    return app
+
+
+def test_app_exception_is_rendered_as_json():
+    response = TestClient(_create_app()).get("/app-error")
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "error": "Application Error",
+        "message": "잘못된 요청",
+        "status_code": 400,
+    }
+
+
+def test_unhandled_exception_returns_500():
+    response = TestClient(_create_app()).get("/crash")
+
+    assert response.status_code == 500
+    assert response.json()["error"] == "Internal Server Error"
+
+
+def test_streaming_response_is_not_buffered():
+    app = _create_app()
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+
+    chunks = [
+        m["body"] for m in messages if m["type"] == "http.response.body" and m["body"]
+    ]
+    assert chunks == [b"chunk-0\n", b"chunk-1\n", b"chunk-2\n"]
+
+
+def test_background_tasks_run():
+    calls = []
+    response = TestClient(_create_app(calls)).get("/background")
+
+    assert response.status_code == 200
+    assert calls == ["done"]
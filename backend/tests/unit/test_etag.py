@@ -0,0 +1,77 @@
+"""
+ETag / If-None-Match 조건부 요청 테스트
+"""
+
+from app.core.etag import etag_matches, weak_etag
+from app.models.script import Script
+
+
+def _create_script(session, title="대본"):
+    script = Script(title=title, content="내용", status="script_ready")
+    session.add(script)
+    session.commit()
+    return script.id
+
+
+def test_etag_matches_weak_and_list_values():
+    etag = weak_etag("script", 1, 0)
+
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('W/"other"', etag)
+
+
+def test_script_detail_returns_304_until_modified(test_client, test_db):
+    script_id = _create_script(test_db)
+
+    first = test_client.get(f"/api/scripts/{script_id}")
+    etag = first.headers["etag"]
+
+    cached = test_client.get(
+        f"/api/scripts/{script_id}", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    test_client.put(f"/api/scripts/{script_id}", data={"title": "수정된 제목"})
+    changed = test_client.get(
+        f"/api/scripts/{script_id}", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "수정된 제목"
+    assert changed.headers["etag"] != etag
+
+
+def test_script_list_etag_changes_on_create_and_params(test_client, test_db):
+    _create_script(test_db)
+
+    etag = test_client.get("/api/scripts/").headers["etag"]
+    cached = test_client.get("/api/scripts/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    # 304 응답은 목록 조회 없이 버전 쿼리 1건만 실행
+    assert cached.headers["x-db-query-count"] == "1"
+
+    other_page = test_client.get(
+        "/api/scripts/?limit=5", headers={"If-None-Match": etag}
+    )
+    assert other_page.status_code == 200
+
+    _create_script(test_db, "새 대본")
+    refreshed = test_client.get("/api/scripts/", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["total"] == 2
+
+
+def test_upload_status_returns_304(test_client, test_db):
+    script_id = _create_script(test_db)
+
+    etag = test_client.get(f"/api/upload/status/{script_id}").headers["etag"]
+    cached = test_client.get(
+        f"/api/upload/status/{script_id}", headers={"If-None-Match": etag}
+    )
+
+    assert cached.status_code == 304
@@ -0,0 +1,67 @@
+"""
+큐 기반 로깅 파이프라인 테스트
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+
+from app.core.logging import JsonFormatter, LocalQueueHandler, SamplingFilter
+
+
+def _record(name="app.test", level=logging.INFO, msg="hello", args=(), **extra):
+    record = logging.LogRecord(name, level, __file__, 10, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_escapes_quotes_and_includes_extra():
+    record = _record(msg='제목 "%s"', args=("할머니의 지혜",), script_id=3)
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == '제목 "할머니의 지혜"'
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "app.test"
+    assert payload["script_id"] == 3
+
+
+def test_sampling_filter_uses_longest_prefix_and_keeps_warnings():
+    sampling = SamplingFilter({"app": 1.0, "app.repositories": 0.0})
+
+    assert sampling.filter(_record("app.routers.scripts"))
+    assert not sampling.filter(_record("app.repositories.script"))
+    assert sampling.filter(_record("app.repositories.script", logging.WARNING))
+
+
+def test_queue_handler_defers_output_to_listener():
+    class ListHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.lines = []
+
+        def emit(self, record):
+            self.lines.append(self.format(record))
+
+    target = ListHandler()
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, target)
+    logger = logging.getLogger("app.test_queue")
+    logger.addHandler(LocalQueueHandler(log_queue))
+    logger.propagate = False
+
+    listener.start()
+    try:
+        logger.warning("업로드 %d건", 2)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("실패")
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+
+    assert target.lines[0] == "업로드 2건"
+    assert target.lines[1].startswith("실패\nTraceback")
+    assert "ValueError: boom" in target.lines[1]
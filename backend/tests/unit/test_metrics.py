@@ -0,0 +1,84 @@
+"""
+Prometheus 메트릭 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.metrics import (
+    EventLoopLagMonitor,
+    MetricsRegistry,
+    _Metric,
+    event_loop_lag,
+    observe_transfer,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)
+    )
+
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(5.0, route="/a")
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+
+
+def test_incomplete_metric_fails_on_creation():
+    class SamplesOnly(_Metric):
+        def samples(self):
+            return []
+
+    with pytest.raises(TypeError):
+        SamplesOnly("incomplete", "Incomplete")
+
+
+def test_observe_transfer_records_throughput():
+    registry = MetricsRegistry()
+    total = registry.counter("bytes_total", "Bytes")
+    seconds = registry.counter("seconds_total", "Seconds")
+    throughput = registry.histogram("throughput", "B/s", buckets=(1000.0,))
+
+    observe_transfer(4000, 2.0, total, seconds, throughput)
+    observe_transfer(None, 1.0, total, seconds, throughput)
+
+    assert total.value() == 4000
+    assert seconds.value() == 2.0
+    assert throughput.count() == 1
+
+
+def test_event_loop_lag_monitor_samples():
+    before = event_loop_lag.count()
+
+    async def run():
+        monitor = EventLoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(run())
+    assert event_loop_lag.count() > before
+
+
+def test_metrics_endpoint_reports_route_latency(test_client, test_db):
+    test_client.get("/api/scripts/")
+
+    response = test_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/scripts/",status="200"}'
+        in response.text
+    )
+    assert "http_requests_in_flight" in response.text
+    assert "db_pool_connections" in response.text
@@ -0,0 +1,89 @@
+"""
+요청 단위 SQL 계측 테스트
+"""
+
+import logging
+
+from app.config import get_settings
+from app.core.query_metrics import QueryStats, RouteQueryMetrics
+from app.models.script import Script
+
+
+def _create_scripts(session, count):
+    session.add_all(
+        [
+            Script(title=f"대본 {i}", content="내용", status="script_ready")
+            for i in range(count)
+        ]
+    )
+    session.commit()
+
+
+def test_query_stats_keeps_slowest_statements():
+    stats = QueryStats(slowest_limit=2)
+    stats.record("SELECT 1", 1.0)
+    stats.record("SELECT   2\n FROM t", 5.0)
+    stats.record("SELECT 3", 3.0)
+
+    assert stats.count == 3
+    assert stats.total_ms == 9.0
+    assert [s["statement"] for s in stats.slowest] == ["SELECT 2 FROM t", "SELECT 3"]
+
+
+def test_route_metrics_counts_over_budget():
+    metrics = RouteQueryMetrics()
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT 1", 1.0)
+
+    metrics.observe("GET /x", stats, budget=2)
+    metrics.observe("GET /x", QueryStats(), budget=2)
+
+    entry = metrics.snapshot()["routes"]["GET /x"]
+    assert entry["requests"] == 2
+    assert entry["max_queries"] == 3
+    assert entry["avg_queries"] == 1.5
+    assert entry["over_budget"] == 1
+
+
+def test_response_headers_report_query_count(test_client, test_db):
+    _create_scripts(test_db, 3)
+
+    response = test_client.get("/api/scripts/")
+
+    assert response.status_code == 200
+    assert int(response.headers["x-db-query-count"]) >= 1
+    assert float(response.headers["x-db-time-ms"]) >= 0
+
+
+def test_list_endpoint_query_count_is_independent_of_rows(test_client, test_db):
+    _create_scripts(test_db, 2)
+    small = int(test_client.get("/api/scripts/").headers["x-db-query-count"])
+
+    _create_scripts(test_db, 20)
+    large = int(test_client.get("/api/scripts/").headers["x-db-query-count"])
+
+    assert small == large
+
+
+def test_route_aggregates_use_route_template(test_client, test_db):
+    _create_scripts(test_db, 1)
+    script_id = test_db.query(Script.id).scalar()
+
+    test_client.get(f"/api/scripts/{script_id}")
+    test_client.get(f"/api/scripts/{script_id}")
+
+    routes = test_client.get("/health/queries").json()["routes"]
+    assert routes["GET /api/scripts/{script_id}"]["requests"] == 2
+
+
+def test_budget_exceeded_logs_warning(test_client, test_db, caplog, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setitem(settings.query_budgets, "GET /api/scripts/", 1)
+
+    with caplog.at_level(logging.WARNING, logger="app.middleware.query_metrics"):
+        test_client.get("/api/scripts/")
+
+    assert any("쿼리 예산 초과" in record.message for record in caplog.records)
+    routes = test_client.get("/health/queries").json()["routes"]
+    assert routes["GET /api/scripts/"]["over_budget"] == 1
@@ -0,0 +1,729 @@
+"""
+ScriptRepository 및 대본 목록 API 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models.script import Script
+from app.repositories.script_repository import ScriptRepository
+
+
+def make_script(index: int, status: str = "script_ready", **kwargs) -> Script:
+    """테스트용 대본 엔티티 생성"""
+    values = {
+        "title": f"테스트 대본 {index}",
+        "content": "본문 " * 1000,
+        "description": f"설명 {index}",
+        "tags": "시니어, 테스트",
+        "imagefx_prompt": "prompt",
+        "status": status,
+        "created_at": datetime(2025, 1, 1) + timedelta(minutes=index),
+    }
+    values.update(kwargs)
+    return Script(**values)
+
+
+@pytest.fixture
+def repository(test_db):
+    """샘플 데이터가 저장된 Repository"""
+    for i in range(5):
+        test_db.add(make_script(i, "script_ready" if i % 2 else "video_ready"))
+    test_db.commit()
+    return ScriptRepository(test_db)
+
+
+def test_get_page_defers_heavy_columns(repository):
+    """요약 조회는 대용량 컬럼을 로드하지 않음"""
+    repository.db.expunge_all()
+    page = repository.get_page()
+
+    assert len(page.items) == 5
+    assert page.items[0].title.startswith("테스트 대본")
+    with pytest.raises(InvalidRequestError):
+        _ = page.items[0].content
+
+
+def test_get_page_filters_by_status(repository):
+    """상태 필터 적용 시 최신순 정렬"""
+    page = repository.get_page(status="video_ready")
+
+    assert [s.status for s in page.items] == ["video_ready"] * 3
+    assert page.items[0].created_at > page.items[-1].created_at
+
+
+def test_get_page_cursor_round_trip(repository):
+    """next/prev 커서로 앞뒤 페이지 이동"""
+    first = repository.get_page(limit=2)
+    assert first.prev_cursor is None
+    assert [s.title for s in first.items] == ["테스트 대본 4", "테스트 대본 3"]
+
+    second = repository.get_page(limit=2, cursor=first.next_cursor)
+    assert [s.title for s in second.items] == ["테스트 대본 2", "테스트 대본 1"]
+
+    last = repository.get_page(limit=2, cursor=second.next_cursor)
+    assert [s.title for s in last.items] == ["테스트 대본 0"]
+    assert last.next_cursor is None
+
+    back = repository.get_page(limit=2, cursor=last.prev_cursor)
+    assert [s.title for s in back.items] == ["테스트 대본 2", "테스트 대본 1"]
+
+    front = repository.get_page(limit=2, cursor=back.prev_cursor)
+    assert [s.title for s in front.items] == ["테스트 대본 4", "테스트 대본 3"]
+    assert front.prev_cursor is None
+    assert front.next_cursor is not None
+
+
+def test_get_page_offset_compatibility(repository):
+    """cursor 없이 skip을 사용하는 기존 방식 유지"""
+    page = repository.get_page(limit=2, skip=2)
+
+    assert [s.title for s in page.items] == ["테스트 대본 2", "테스트 대본 1"]
+    assert page.prev_cursor is not None
+
+
+def test_list_endpoint_fields(test_client, repository):
+    """fields 파라미터에 따른 목록 응답"""
+    summary = test_client.get("/api/scripts/").json()
+    assert summary["total"] == 5
+    assert summary["fields"] == "summary"
+    assert "content" not in summary["scripts"][0]
+
+    full = test_client.get("/api/scripts/", params={"fields": "full"}).json()
+    assert full["fields"] == "full"
+    assert full["scripts"][0]["content"].startswith("본문")
+
+    invalid = test_client.get("/api/scripts/", params={"fields": "all"})
+    assert invalid.status_code == 422
+
+
+def test_list_endpoint_cursor(test_client, repository):
+    """목록 API의 커서 페이지네이션"""
+    first = test_client.get("/api/scripts/", params={"limit": 3}).json()
+    assert first["next_cursor"]
+
+    second = test_client.get(
+        "/api/scripts/", params={"limit": 3, "cursor": first["next_cursor"]}
+    ).json()
+    assert len(second["scripts"]) == 2
+    assert second["next_cursor"] is None
+
+    invalid = test_client.get("/api/scripts/", params={"cursor": "not-a-cursor"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "query, index_name",
+    [
+        (
+            "SELECT id FROM scripts WHERE status = 'video_ready' "
+            "ORDER BY created_at DESC LIMIT 10",
+            "ix_scripts_status_created_at",
+        ),
+        (
+            "SELECT id FROM scripts WHERE status = 'error' "
+            "ORDER BY updated_at DESC LIMIT 10",
+            "ix_scripts_status_updated_at",
+        ),
+        (
+            "SELECT id FROM scripts WHERE youtube_video_id = 'abc'",
+            "ix_scripts_youtube_video_id",
+        ),
+    ],
+)
+def test_query_plans_use_indexes(test_db, query, index_name):
+    """상태/시간순 조회가 인덱스를 사용하고 정렬을 생략하는지 확인"""
+    from sqlalchemy import text
+
+    plan = " ".join(
+        row[-1] for row in test_db.execute(text(f"EXPLAIN QUERY PLAN {query}"))
+    )
+
+    assert index_name in plan
+    assert "USE TEMP B-TREE" not in plan
+
+
+def test_statistics_histogram_and_cache(repository):
+    """통계는 GROUP BY 결과를 캐시하고 쓰기 시 무효화"""
+    stats = repository.get_statistics()
+    assert stats["statistics"] == {
+        "total": 5,
+        "script_ready": 2,
+        "video_ready": 3,
+        "uploaded": 0,
+        "scheduled": 0,
+        "error": 0,
+    }
+    assert stats["recent_script"]["title"] == "테스트 대본 4"
+
+    # 캐시 적중 시 동일 객체 반환
+    assert repository.get_statistics() is stats
+
+    repository.update_status(1, "error")
+    refreshed = repository.get_statistics()
+    assert refreshed is not stats
+    assert refreshed["statistics"]["error"] == 1
+
+
+def test_full_text_search(repository):
+    """FTS5 검색은 본문/태그까지 검색하고 트리거로 동기화됨"""
+    repository.create(
+        make_script(10, title="할머니의 비밀", content="1960년대 시댁살이 이야기")
+    )
+
+    hits = repository.full_text_search("시댁살이")
+    assert [hit["id"] for hit in hits] == [6]
+    assert "<mark>" in hits[0]["snippet"]
+
+    # trigram 부분 일치: "할머니" -> "할머니의", 단어 중간 "댁살" 포함
+    assert repository.full_text_search("할머니")[0]["title"] == "할머니의 비밀"
+    assert [hit["id"] for hit in repository.full_text_search("댁살이")] == [6]
+
+    script = repository.get_by_id(6)
+    script.title = "할아버지의 비밀"
+    repository.update(script)
+    assert repository.full_text_search("할머니") == []
+
+    repository.delete(6)
+    assert repository.full_text_search("할아버지") == []
+
+
+def test_full_text_search_short_terms_and_escaped_snippet(repository):
+    """3글자 미만 단어는 LIKE로 검색하고 snippet은 HTML 이스케이프됨"""
+    repository.create(
+        make_script(
+            10,
+            title="건강 이야기",
+            content="<script>alert(1)</script> 외할머니의 100% 건강 비법",
+        )
+    )
+
+    # 단어 중간 일치 ("외할머니" 안의 "할머니")와 짧은 단어 결합
+    hits = repository.full_text_search("할머니 건강")
+    assert [hit["id"] for hit in hits] == [6]
+    assert "<script>" not in hits[0]["snippet"]
+    assert "&lt;script&gt;" in hits[0]["snippet"]
+    assert "<mark>할머니</mark>" in hits[0]["snippet"]
+
+    # 짧은 단어만 있으면 LIKE 검색 (% 등 특수 문자는 그대로 일치)
+    hits = repository.full_text_search("건강")
+    assert [hit["id"] for hit in hits] == [6]
+    assert hits[0]["rank"] is None
+    assert [hit["id"] for hit in repository.full_text_search("0%")] == [6]
+    assert repository.full_text_search("_0") == []
+    assert repository.full_text_search("할머니 감기") == []
+
+
+def test_search_endpoint(test_client, repository):
+    """검색 API 응답"""
+    response = test_client.get("/api/scripts/search", params={"q": "테스트 대본"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["results"]) == 5
+    assert body["results"][0]["rank"] is not None
+
+
+def test_bulk_update_status_compare_and_set(repository):
+    """expected 상태인 대본만 변경하고 변경된 ID 반환"""
+    # id 1, 3, 5: video_ready / id 2, 4: script_ready
+    updated = repository.bulk_update_status([1, 2, 3], "error", "video_ready")
+
+    assert sorted(updated) == [1, 3]
+    assert repository.get_by_id(1).status == "error"
+    assert repository.get_by_id(2).status == "script_ready"
+
+    # 이미 변경된 대본은 다시 변경되지 않음
+    assert repository.bulk_update_status([1, 3], "error", "video_ready") == []
+
+
+def test_bulk_update_status_requires_side_data(repository):
+    """단건 경로가 함께 기록하는 값이 없는 대본은 변경하지 않음"""
+    # 비디오 파일 없이 video_ready로 변경 불가
+    assert repository.bulk_update_status([2], "video_ready", "script_ready") == []
+
+    # YouTube ID 없이 uploaded/scheduled로 변경 불가
+    assert repository.bulk_update_status([1], "uploaded", "video_ready") == []
+    assert repository.bulk_update_status([1], "scheduled", "video_ready") == []
+
+    # 비디오 파일이 남아 있으면 script_ready로 되돌릴 수 없음
+    script = repository.get_by_id(1)
+    script.video_file_path = "uploads/videos/1.mp4"
+    repository.update(script)
+    assert repository.bulk_update_status([1], "script_ready", "video_ready") == []
+
+    repository.bulk_update_status([1], "error", "video_ready")
+    assert repository.bulk_update_status([1], "video_ready", "error") == [1]
+
+    script = repository.get_by_id(3)
+    script.youtube_video_id = "abc123"
+    repository.update(script)
+    assert repository.bulk_update_status([3], "uploaded", "video_ready") == [3]
+
+
+def test_bulk_create_and_delete(repository):
+    """일괄 생성/삭제"""
+    created = repository.bulk_create(
+        [make_script(i, youtube_video_id=f"video-{i}") for i in range(10, 13)]
+    )
+    assert len(created) == 3
+    assert repository.count() == 8
+
+    repository.bulk_update_status([created[0]], "uploaded")
+    deleted = repository.bulk_delete(created, Script.status != "uploaded")
+
+    assert sorted(deleted) == sorted(created[1:])
+    assert repository.count() == 6
+
+
+def test_bulk_endpoints(test_client, repository, sample_script_content):
+    """일괄 처리 API"""
+    upload = test_client.post(
+        "/api/scripts/bulk/upload",
+        files=[
+            ("files", ("a.txt", sample_script_content.encode("utf-8"))),
+            ("files", ("b.txt", "=== 대본 ===\n".encode("utf-8"))),
+        ],
+    ).json()
+    assert len(upload["created_ids"]) == 1
+    assert upload["failed"][0]["filename"] == "b.txt"
+
+    status = test_client.post(
+        "/api/scripts/bulk/status",
+        json={
+            "script_ids": [1, 2, 3],
+            "expected_status": "video_ready",
+            "new_status": "error",
+        },
+    ).json()
+    assert sorted(status["updated_ids"]) == [1, 3]
+    assert status["skipped_ids"] == [2]
+
+    # YouTube ID 없는 대본은 uploaded로 변경되지 않음
+    status = test_client.post(
+        "/api/scripts/bulk/status",
+        json={
+            "script_ids": [5],
+            "expected_status": "video_ready",
+            "new_status": "uploaded",
+        },
+    ).json()
+    assert status["updated_ids"] == []
+    assert status["skipped_ids"] == [5]
+
+    invalid = test_client.post(
+        "/api/scripts/bulk/status",
+        json={"script_ids": [2], "expected_status": "uploaded", "new_status": "error"},
+    )
+    assert invalid.status_code == 400
+
+    deleted = test_client.post(
+        "/api/scripts/bulk/delete", json={"script_ids": [2, 4, 99]}
+    ).json()
+    assert sorted(deleted["deleted_ids"]) == [2, 4]
+    assert deleted["skipped_ids"] == [99]
+
+
+def test_claim_next_for_upload(repository):
+    """업로드 대기 대본을 작업자별로 중복 없이 점유"""
+    first = repository.claim_next_for_upload("worker-a", limit=2, lease_seconds=60)
+    second = repository.claim_next_for_upload("worker-b", limit=5, lease_seconds=60)
+
+    # video_ready: id 1, 3, 5 (오래된 순)
+    assert [s.id for s in first] == [1, 3]
+    assert [s.id for s in second] == [5]
+    assert all(s.lease_owner == "worker-a" for s in first)
+    assert repository.claim_next_for_upload("worker-c") == []
+
+    # 다른 작업자는 점유된 대본을 가져갈 수 없고, 소유자는 재점유 가능
+    assert repository.claim_script(1, "worker-c", 60) is None
+    assert repository.claim_script(1, "worker-a", 60).lease_owner == "worker-a"
+
+
+def test_expired_lease_is_reclaimable(repository):
+    """만료된 임대는 다른 작업자가 다시 점유"""
+    claimed = repository.claim_next_for_upload("worker-a", limit=1, lease_seconds=-1)
+    assert [s.id for s in claimed] == [1]
+    claimed_version = claimed[0].version
+
+    reclaimed = repository.claim_next_for_upload("worker-b", limit=1)
+    assert [s.id for s in reclaimed] == [1]
+    assert reclaimed[0].lease_owner == "worker-b"
+    assert reclaimed[0].version == claimed_version + 1
+
+    assert repository.release_lease(1, "worker-a") is False
+    assert repository.release_lease(1, "worker-b") is True
+    assert repository.get_by_id(1).lease_owner is None
+
+
+def test_upload_to_youtube_rejects_leased_script(test_client, repository, tmp_path):
+    """다른 작업자가 점유한 대본은 409로 거부"""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    script = repository.get_by_id(1)
+    script.video_file_path = str(video)
+    repository.update(script)
+    repository.claim_script(1, "worker-a", 600)
+
+    response = test_client.post("/api/upload/youtube/1")
+
+    assert response.status_code == 409
+    assert repository.get_by_id(1).status == "video_ready"
+
+
+def test_upload_result_survives_concurrent_edit(repository, tmp_path, monkeypatch):
+    """업로드 중 다른 요청이 version을 올려도 게시된 YouTube ID를 기록"""
+    from sqlalchemy import text
+    from sqlalchemy.orm import sessionmaker
+
+    from app.services.upload_service import BaseUploadService, UploadService
+
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    script = repository.get_by_id(1)
+    script.video_file_path = str(video)
+    repository.update(script)
+
+    def upload_during_edit(self, video_file_path, metadata):
+        # 업로드 중 다른 세션에서 제목 수정 (version 증가)
+        with sessionmaker(bind=repository.db.get_bind())() as other:
+            other.execute(
+                text(
+                    "UPDATE scripts SET title = '수정된 제목', version = version + 1 "
+                    "WHERE id = 1"
+                )
+            )
+            other.commit()
+        return "video-123"
+
+    monkeypatch.setattr(BaseUploadService, "_upload_via_youtube", upload_during_edit)
+
+    result = UploadService(repository.db).upload_to_youtube(1)
+
+    assert result["status"] == "uploaded"
+    assert result["youtube_video_id"] == "video-123"
+    repository.db.expunge_all()
+    saved = repository.get_by_id(1)
+    assert (saved.status, saved.youtube_video_id) == ("uploaded", "video-123")
+    assert saved.title == "수정된 제목"
+    assert saved.lease_owner is None
+
+
+def test_upload_result_not_saved_after_lease_lost(
+    test_client, repository, tmp_path, monkeypatch
+):
+    """임대를 잃으면 에러 상태로 바꾸지 않고 video_id와 함께 실패 응답"""
+    from app.services.upload_service import BaseUploadService
+
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    script = repository.get_by_id(1)
+    script.video_file_path = str(video)
+    repository.update(script)
+
+    def upload_after_lease_lost(self, video_file_path, metadata):
+        repository.db.expire_all()
+        script = repository.get_by_id(1)
+        script.lease_owner = "worker-b"
+        repository.update(script)
+        return "video-456"
+
+    monkeypatch.setattr(
+        BaseUploadService, "_upload_via_youtube", upload_after_lease_lost
+    )
+
+    response = test_client.post("/api/upload/youtube/1")
+
+    assert response.status_code == 500
+    assert "video-456" in response.json()["message"]
+    repository.db.expire_all()
+    assert repository.get_by_id(1).status == "video_ready"
+
+
+def test_iter_columns_batches(repository):
+    """지정 컬럼만 배치 단위로 순회"""
+    batches = list(repository.iter_columns(["id", "title"], batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert tuple(batches[0][0]) == (1, "테스트 대본 0")
+
+
+def test_export_endpoint(test_client, repository):
+    """NDJSON/CSV 스트리밍 내보내기"""
+    import csv
+    import io
+    import json
+
+    response = test_client.get(
+        "/api/scripts/export", params={"columns": "id,title,created_at"}
+    )
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 5
+    assert rows[0] == {
+        "id": 1,
+        "title": "테스트 대본 0",
+        "created_at": "2025-01-01T00:00:00",
+    }
+
+    response = test_client.get(
+        "/api/scripts/export", params={"format": "csv", "status": "video_ready"}
+    )
+    assert "attachment" in response.headers["content-disposition"]
+    reader = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert reader[0][:3] == ["id", "title", "status"]
+    assert len(reader) == 4
+
+    invalid = test_client.get("/api/scripts/export", params={"columns": "lease_owner"})
+    assert invalid.status_code == 400
+
+
+def test_match_and_upsert_import_rows(repository):
+    """id/youtube_video_id 기준 갱신 대상 조회와 일괄 생성/갱신"""
+    script = repository.get_by_id(1)
+    script.youtube_video_id, script.status = "vid-1", "uploaded"
+    repository.update(script)
+    version = repository.get_by_id(1).version
+
+    rows = [
+        {"youtube_video_id": "vid-1", "title": "갱신"},
+        {"id": 2, "status": "video_ready"},
+        # 없는 id는 youtube_video_id로 다시 찾음
+        {"id": 999, "youtube_video_id": "vid-1"},
+        {"title": "신규", "content": "본문", "youtube_video_id": "vid-2"},
+    ]
+    assert repository.match_import_rows(rows) == [1, 2, 1, None]
+
+    repository.upsert_rows(
+        [{"title": "신규", "content": "본문", "youtube_video_id": "vid-2"}],
+        {1: {"title": "갱신"}, 2: {"id": 2, "status": "video_ready"}},
+    )
+
+    updated_script = repository.db.get(Script, 1, populate_existing=True)
+    assert updated_script.title == "갱신"
+    # 행에 없는 컬럼은 유지
+    assert updated_script.content.startswith("본문")
+    assert updated_script.version == version + 1
+    assert repository.db.get(Script, 2, populate_existing=True).status == "video_ready"
+    assert repository.get_by_youtube_id("vid-2").title == "신규"
+    assert repository.count() == 6
+
+
+def test_import_endpoint(test_client, repository):
+    """NDJSON/CSV 가져오기 요약과 거부 행 보고"""
+    import json
+
+    script = repository.get_by_id(1)
+    script.youtube_video_id, script.status = "vid-1", "uploaded"
+    repository.update(script)
+    lines = [
+        {"title": "갱신된 제목", "content": "본문", "youtube_video_id": "vid-1"},
+        {"title": "새 대본", "content": "본문", "created_at": "2024-05-01T09:00:00Z"},
+        {"title": "", "content": "본문"},
+        {"title": "잘못된 상태", "content": "본문", "status": "unknown"},
+    ]
+    body = "\n".join(json.dumps(line, ensure_ascii=False) for line in lines)
+    body += "\n{not json}\n"
+
+    response = test_client.post(
+        "/api/scripts/import",
+        files={"file": ("catalog.ndjson", body.encode("utf-8"))},
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["inserted"], result["updated"], result["rejected"]) == (1, 1, 3)
+    assert result["duplicates"] == 0
+    assert [error["line"] for error in result["errors"]] == [3, 4, 5]
+    repository.db.expire_all()
+    assert repository.get_by_youtube_id("vid-1").title == "갱신된 제목"
+
+    csv_body = "﻿title,content,status\nCSV 대본,본문,script_ready\n,본문,\n"
+    response = test_client.post(
+        "/api/scripts/import",
+        files={"file": ("catalog.csv", csv_body.encode("utf-8"))},
+    )
+    result = response.json()
+    assert (result["inserted"], result["rejected"]) == (1, 1)
+    assert result["errors"][0]["line"] == 3
+
+    unsupported = test_client.post(
+        "/api/scripts/import", files={"file": ("catalog.txt", b"")}
+    )
+    assert unsupported.status_code == 400
+
+
+def test_export_import_round_trip(test_client, repository):
+    """기본 컬럼 내보내기 결과를 그대로 가져오면 기존 대본 갱신"""
+    import json
+
+    exported = test_client.get("/api/scripts/export").content.decode("utf-8")
+    records = [json.loads(line) for line in exported.splitlines()]
+    assert "content" not in records[0]
+    records[0]["title"] = "가져오기로 수정"
+    body = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+
+    response = test_client.post(
+        "/api/scripts/import",
+        files={"file": ("catalog.ndjson", body.encode("utf-8"))},
+    )
+
+    result = response.json()
+    assert (result["inserted"], result["updated"], result["rejected"]) == (0, 5, 0)
+    assert repository.count() == 5
+    repository.db.expire_all()
+    script = repository.get_by_id(records[0]["id"])
+    assert script.title == "가져오기로 수정"
+    assert script.content.startswith("본문")
+    assert script.status == records[0]["status"]
+
+
+def test_import_reports_in_batch_duplicates(test_db):
+    """같은 배치에서 같은 대본을 가리키는 행은 duplicates로 집계"""
+    import io
+    import json
+
+    from app.services.script_service import ScriptService
+
+    lines = [
+        {"title": "첫 행", "content": "본문", "youtube_video_id": "vid-9"},
+        {"title": "마지막 행", "content": "본문", "youtube_video_id": "vid-9"},
+    ]
+    body = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+    service = ScriptService(test_db)
+
+    result = service.import_scripts(io.BytesIO(body.encode("utf-8")), "ndjson")
+    assert (result["inserted"], result["updated"], result["duplicates"]) == (1, 0, 1)
+
+    result = service.import_scripts(io.BytesIO(body.encode("utf-8")), "ndjson")
+    assert (result["inserted"], result["updated"], result["duplicates"]) == (0, 1, 1)
+    assert ScriptRepository(test_db).get_by_youtube_id("vid-9").title == "마지막 행"
+
+
+def test_import_commits_per_batch(test_db):
+    """batch_size 행마다 하나의 트랜잭션으로 커밋"""
+    import io
+    import json
+
+    from app.services.script_service import ScriptService
+
+    body = "".join(
+        json.dumps({"title": f"대본 {i}", "content": "본문"}) + "\n" for i in range(5)
+    )
+    result = ScriptService(test_db).import_scripts(
+        io.BytesIO(body.encode("utf-8")), "ndjson", batch_size=2
+    )
+
+    assert result["batches"] == 3
+    assert result["inserted"] == 5
+
+
+def test_import_rolls_back_only_failed_batch(test_db, repository):
+    """제약 조건을 위반한 배치만 되돌리고 나머지 배치는 계속 가져옴"""
+    import io
+    import json
+
+    from app.services.script_service import ScriptService
+
+    script = repository.get_by_id(2)
+    script.youtube_video_id = "vid-2"
+    repository.update(script)
+    lines = [
+        {"title": "대본 A", "content": "본문"},
+        {"title": "대본 B", "content": "본문"},
+        # id 1에 이미 대본 2가 사용하는 YouTube ID를 지정 (고유 인덱스 위반)
+        {"id": 1, "youtube_video_id": "vid-2"},
+        {"title": "대본 C", "content": "본문"},
+        {"title": "", "content": "본문"},
+        {"title": "대본 D", "content": "본문"},
+    ]
+    body = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+
+    result = ScriptService(test_db).import_scripts(
+        io.BytesIO(body.encode("utf-8")), "ndjson", batch_size=2
+    )
+
+    assert (result["inserted"], result["updated"]) == (3, 0)
+    assert (result["failed"], result["rejected"], result["batches"]) == (2, 1, 2)
+    assert [error["line"] for error in result["errors"]] == [3, 4, 5]
+    assert result["errors"][0]["error"].startswith("배치 저장 실패")
+    test_db.expire_all()
+    assert repository.count() == 8
+    assert repository.get_by_id(1).youtube_video_id is None
+    assert not repository.search_by_title("대본 C")
+
+
+def test_get_by_id_read_through_cache(test_db, repository):
+    """읽기 전용 단건 조회 캐시 적중, 분리된 스냅샷, 쓰기 시 무효화"""
+    from sqlalchemy import event
+
+    from app.repositories.script_repository import script_cache
+
+    statements = []
+    event.listen(
+        test_db.bind, "before_cursor_execute", lambda *args: statements.append(1)
+    )
+    hits = script_cache.hits
+
+    first = repository.get_by_id(1)
+    test_db.expunge_all()
+    executed = len(statements)
+    second = repository.get_by_id(1, use_cache=True)
+
+    assert len(statements) == executed
+    assert script_cache.hits == hits + 1
+    assert second is not first
+    assert second.title == first.title
+    assert script_cache.get(1) is not second
+
+    # 기본 조회는 캐시를 거치지 않음
+    test_db.expunge_all()
+    repository.get_by_id(1)
+    assert len(statements) == executed + 1
+
+    # 쓰기 후 캐시 무효화
+    script = repository.get_by_id(1)
+    script.title = "수정된 제목"
+    repository.update(script)
+    test_db.expunge_all()
+    assert repository.find_by_id(1).title == "수정된 제목"
+
+    # Core UPDATE 경로도 무효화
+    repository.find_by_id(2)
+    repository.bulk_update_status([2], "error", "script_ready")
+    test_db.expunge_all()
+    assert repository.find_by_id(2).status == "error"
+
+
+def test_write_path_ignores_stale_cache(test_client, test_db, repository):
+    """다른 작업자가 바꾼 대본을 캐시 스냅샷으로 덮어쓰지 않음"""
+    from sqlalchemy import text
+
+    assert test_client.get("/api/scripts/1").status_code == 200
+
+    # 캐시를 무효화하지 않는 다른 프로세스의 변경
+    test_db.execute(
+        text(
+            "UPDATE scripts SET version = version + 1, title = '외부 수정' WHERE id = 1"
+        )
+    )
+    test_db.commit()
+
+    response = test_client.put("/api/scripts/1", data={"description": "새 설명"})
+
+    assert response.status_code == 200
+    updated = test_client.get("/api/scripts/1").json()
+    assert updated["title"] == "외부 수정"
+    assert updated["description"] == "새 설명"
+
+
+def test_status_polling_uses_cache(test_client, repository):
+    """업로드 상태 폴링 시 캐시 적중 통계 노출"""
+    for _ in range(3):
+        assert test_client.get("/api/upload/status/1").status_code == 200
+
+    stats = test_client.get("/health/cache").json()["scripts"]
+    assert stats["hits"] >= 2
+    assert stats["size"] >= 1
@@ -0,0 +1,34 @@
+"""
+콜드 스타트 지연 초기화 테스트
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def test_importing_app_does_not_load_youtube_stack(tmp_path):
+    code = (
+        "import sys, app.main; "
+        "print(sorted(m for m in sys.modules "
+        "if m.split('.')[0] in ('google', 'googleapiclient', 'google_auth_oauthlib')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            "PATH": "",
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'startup.db'}",
+            "UPLOAD_DIR": str(tmp_path / "uploads"),
+        },
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+    # 디렉토리/테이블 생성은 lifespan 시작 시점으로 미뤄짐
+    assert not (tmp_path / "uploads").exists()
+    assert not (tmp_path / "startup.db").exists()
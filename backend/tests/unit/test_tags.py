@@ -0,0 +1,134 @@
+"""
+정규화된 태그 인덱스 테스트
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.script import Script
+from app.models.tag import Tag, script_tags
+from app.repositories.script_repository import ScriptRepository
+from app.repositories.tag_repository import (
+    TagRepository,
+    insert_missing_tags,
+    split_tags,
+)
+from app.services.youtube.upload_manager import YouTubeUploadManager
+
+
+def add_script(repository: ScriptRepository, index: int, tags: str, **kwargs):
+    """태그가 있는 대본 생성"""
+    return repository.create(
+        Script(
+            title=f"대본 {index}",
+            content="본문",
+            tags=tags,
+            created_at=datetime(2025, 1, 1) + timedelta(minutes=index),
+            **kwargs,
+        )
+    )
+
+
+def test_split_tags():
+    """공백 제거, 빈 값 제외, 순서 유지 중복 제거"""
+    assert split_tags(" 시니어, 건강 ,, 시니어,일상") == ["시니어", "건강", "일상"]
+    assert split_tags(None) == []
+
+
+def test_insert_missing_tags_skips_existing_names(test_db):
+    """다른 요청이 먼저 만든 태그와 중복 이름은 충돌 없이 건너뜀"""
+    from sqlalchemy.orm import sessionmaker
+
+    other = sessionmaker(bind=test_db.bind)()
+    other.add(Tag(name="건강"))
+    other.commit()
+    other.close()
+
+    dialect_name = test_db.get_bind().dialect.name
+    test_db.execute(insert_missing_tags(dialect_name, ["건강", "일상", "일상"]))
+    tag_ids = TagRepository(test_db).get_or_create_ids(["건강", "일상", "시니어"])
+
+    assert sorted(tag_ids) == ["건강", "시니어", "일상"]
+    assert test_db.query(Tag).count() == 3
+
+
+def test_tag_links_follow_script_writes(test_db):
+    """생성/수정/삭제 시 script_tags 동기화"""
+    repository = ScriptRepository(test_db)
+    script = add_script(repository, 0, "시니어, 건강")
+    assert repository.get_tag_names(script.id) == ["시니어", "건강"]
+
+    script.tags = "건강, 일상"
+    repository.update(script)
+    assert repository.get_tag_names(script.id) == ["건강", "일상"]
+
+    created_ids = repository.bulk_create(
+        [Script(title="일괄", content="본문", tags="일상, 시니어")]
+    )
+    assert repository.get_tag_names(created_ids[0]) == ["일상", "시니어"]
+    assert test_db.query(Tag).count() == 3
+
+    repository.delete(script.id)
+    repository.bulk_delete(created_ids)
+    assert test_db.execute(script_tags.select()).all() == []
+
+
+def test_upsert_replaces_tag_links(test_db):
+    """가져오기(upsert) 경로의 태그 연결"""
+    repository = ScriptRepository(test_db)
+    repository.upsert_rows(
+        [
+            {
+                "title": "가져온 대본",
+                "content": "본문",
+                "tags": "시니어",
+                "youtube_video_id": "v1",
+            }
+        ],
+        {},
+    )
+    script_id = repository.get_by_youtube_id("v1").id
+    assert repository.get_tag_names(script_id) == ["시니어"]
+
+    repository.upsert_rows([], {script_id: {"tags": "건강, 일상"}})
+    assert repository.get_tag_names(script_id) == ["건강", "일상"]
+
+
+def test_tag_filter_and_frequency_endpoints(test_client, test_db):
+    """태그 필터 목록과 태그 빈도 조회"""
+    repository = ScriptRepository(test_db)
+    add_script(repository, 0, "시니어, 건강")
+    add_script(repository, 1, "시니어")
+    add_script(repository, 2, "건강", status="video_ready")
+    add_script(repository, 3, "시니어, 일상")
+
+    response = test_client.get("/api/scripts/", params={"tag": "시니어", "limit": 2})
+    body = response.json()
+    assert body["total"] == 3
+    assert body["tag_filter"] == "시니어"
+    assert [script["title"] for script in body["scripts"]] == ["대본 3", "대본 1"]
+
+    next_page = test_client.get(
+        "/api/scripts/", params={"tag": "시니어", "cursor": body["next_cursor"]}
+    ).json()
+    assert [script["title"] for script in next_page["scripts"]] == ["대본 0"]
+
+    frequencies = test_client.get("/api/scripts/tags").json()["tags"]
+    assert frequencies == [
+        {"tag": "시니어", "count": 3},
+        {"tag": "건강", "count": 2},
+        {"tag": "일상", "count": 1},
+    ]
+
+    filtered = test_client.get("/api/scripts/tags", params={"status": "video_ready"})
+    assert filtered.json()["tags"] == [{"tag": "건강", "count": 1}]
+
+
+def test_upload_body_uses_tag_list_without_resplitting():
+    """정규화된 태그 목록은 그대로 사용하고 전체 길이만 제한"""
+    manager = YouTubeUploadManager.__new__(YouTubeUploadManager)
+    tags = ["시니어", "건강, 일상"] + [f"태그{i:03d}" for i in range(100)]
+
+    body = manager._build_upload_body({"title": "제목", "tags": tags})
+
+    assert body["snippet"]["tags"][:2] == ["시니어", "건강, 일상"]
+    assert len(",".join(body["snippet"]["tags"])) <= 500
@@ -0,0 +1,88 @@
+"""
+YouTube 토큰 백그라운드 갱신기 테스트
+"""
+
+from datetime import datetime, timedelta
+
+from google.oauth2.credentials import Credentials
+
+from app.services.youtube import credential_store
+from app.services.youtube.credential_store import CredentialStore
+from app.services.youtube.token_refresher import TokenRefresher
+
+SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+
+
+def _store(tmp_path, expires_in):
+    store = CredentialStore(tmp_path / "token.json", SCOPES)
+    store.save(
+        Credentials(
+            token="access",
+            refresh_token="refresh",
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id="client",
+            client_secret="secret",
+            scopes=SCOPES,
+            expiry=datetime.utcnow() + timedelta(seconds=expires_in),
+        )
+    )
+    return store
+
+
+def test_refreshes_before_expiry(tmp_path, monkeypatch):
+    store = _store(tmp_path, expires_in=120)
+
+    def refresh(credentials):
+        credentials.token = "refreshed"
+        credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+
+    monkeypatch.setattr(credential_store, "_refresh_with_google", refresh)
+    refresher = TokenRefresher(lambda: store, margin_seconds=300, check_interval=60)
+
+    delay = refresher.run_once()
+
+    assert store.load().token == "refreshed"
+    assert refresher.last_refresh_at is not None
+    assert delay == 60
+    assert refresher.health()["status"] == "ok"
+
+
+def test_does_not_refresh_fresh_token(tmp_path, monkeypatch):
+    store = _store(tmp_path, expires_in=3600)
+    monkeypatch.setattr(
+        credential_store,
+        "_refresh_with_google",
+        lambda credentials: (_ for _ in ()).throw(AssertionError("갱신 불필요")),
+    )
+    refresher = TokenRefresher(lambda: store, margin_seconds=300, check_interval=60)
+
+    refresher.run_once()
+
+    assert store.load().token == "access"
+    assert refresher.last_refresh_at is None
+
+
+def test_backs_off_on_failure(tmp_path, monkeypatch):
+    store = _store(tmp_path, expires_in=-10)
+
+    def failing_refresh(credentials):
+        raise RuntimeError("network down")
+
+    monkeypatch.setattr(credential_store, "_refresh_with_google", failing_refresh)
+    refresher = TokenRefresher(
+        lambda: store, margin_seconds=300, backoff_base=5, backoff_max=12
+    )
+
+    delays = [refresher.run_once() for _ in range(3)]
+
+    assert delays == [5, 10, 12]
+    health = refresher.health()
+    assert health["status"] == "expired"
+    assert health["consecutive_failures"] == 3
+    assert "network down" in health["last_error"]
+
+
+def test_health_reports_missing_token(tmp_path):
+    refresher = TokenRefresher(lambda: CredentialStore(tmp_path / "token.json", SCOPES))
+
+    assert refresher.health() == {"status": "missing"}
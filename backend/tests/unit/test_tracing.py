@@ -0,0 +1,188 @@
+"""
+요청 단위 트레이싱 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.tracing import (
+    JsonlSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+    Tracer,
+    current_trace_id,
+    parse_traceparent,
+    span,
+    traced,
+    tracer,
+)
+from app.models.script import Script
+
+
+class MemoryExporter(SpanExporter):
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def memory_exporter():
+    """전역 tracer를 메모리 내보내기로 교체"""
+    exporter = MemoryExporter()
+    previous = (tracer.exporter, tracer.sample_rate)
+    tracer.configure(exporter)
+    yield exporter
+    tracer.configure(*previous)
+
+
+def test_span_outside_trace_is_noop():
+    with span("orphan") as active:
+        assert active is None
+    assert current_trace_id() is None
+
+
+def test_span_exporter_requires_export():
+    class IncompleteExporter(SpanExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteExporter()
+
+
+def test_nested_spans_share_trace_across_threads_and_tasks():
+    exporter = MemoryExporter()
+    local_tracer = Tracer(exporter)
+
+    @traced("sync.work")
+    def sync_work():
+        with span("sync.inner", size=3):
+            return current_trace_id()
+
+    @traced()
+    async def async_work():
+        return await run_in_threadpool(sync_work)
+
+    async def scenario():
+        with local_tracer.start_trace("root") as root:
+            assert await async_work() == root.trace_id
+            return root.trace_id
+
+    trace_id = asyncio.run(scenario())
+    local_tracer.shutdown()
+
+    by_name = {item["name"]: item for item in exporter.spans}
+    assert set(by_name) == {
+        "root",
+        "test_nested_spans_share_trace_across_threads_and_tasks.<locals>.async_work",
+        "sync.work",
+        "sync.inner",
+    }
+    assert {item["trace_id"] for item in exporter.spans} == {trace_id}
+    assert by_name["sync.inner"]["parent_id"] == by_name["sync.work"]["span_id"]
+    assert by_name["sync.inner"]["attributes"] == {"size": 3}
+    assert by_name["root"]["parent_id"] is None
+
+
+def test_span_records_error_and_unsampled_trace_is_not_exported():
+    exporter = MemoryExporter()
+    local_tracer = Tracer(exporter)
+
+    with pytest.raises(ValueError):
+        with local_tracer.start_trace("root"):
+            with span("failing"):
+                raise ValueError("boom")
+
+    local_tracer.sample_rate = 0.0
+    with local_tracer.start_trace("dropped") as root:
+        assert root.trace_id
+        with span("child") as child:
+            assert child is None
+    local_tracer.shutdown()
+
+    assert [item["name"] for item in exporter.spans] == ["failing", "root"]
+    assert exporter.spans[0]["status"] == "error"
+    assert exporter.spans[0]["error"] == "ValueError: boom"
+
+
+def test_traceparent_continues_upstream_trace():
+    header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    assert parse_traceparent(header) == (
+        "4bf92f3577b34da6a3ce929d0e0e4736",
+        "00f067aa0ba902b7",
+        True,
+    )
+    assert parse_traceparent("00-xyz-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("00-" + "0" * 32 + "-00f067aa0ba902b7-01") is None
+
+    exporter = MemoryExporter()
+    local_tracer = Tracer(exporter)
+    with local_tracer.start_trace("root", header) as root:
+        assert root.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert root.parent_id == "00f067aa0ba902b7"
+    local_tracer.shutdown()
+    assert len(exporter.spans) == 1
+
+
+def test_jsonl_and_otlp_exporters(tmp_path):
+    path = tmp_path / "traces" / "traces.jsonl"
+    local_tracer = Tracer(JsonlSpanExporter(str(path)))
+    with local_tracer.start_trace("root", **{"http.method": "GET"}):
+        with span("child"):
+            pass
+    local_tracer.shutdown()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [item["name"] for item in spans] == ["child", "root"]
+
+    payload = OtlpHttpSpanExporter("http://collector", "api").to_otlp(spans)
+    resource_spans = payload["resourceSpans"][0]
+    otlp_spans = resource_spans["scopeSpans"][0]["spans"]
+    assert resource_spans["resource"]["attributes"][0]["value"] == {
+        "stringValue": "api"
+    }
+    assert otlp_spans[0]["parentSpanId"] == otlp_spans[1]["spanId"]
+    assert "parentSpanId" not in otlp_spans[1]
+    assert otlp_spans[1]["attributes"] == [
+        {"key": "http.method", "value": {"stringValue": "GET"}}
+    ]
+    assert int(otlp_spans[1]["endTimeUnixNano"]) >= int(
+        otlp_spans[1]["startTimeUnixNano"]
+    )
+
+
+def test_request_returns_trace_id_and_records_layers(
+    test_client, test_db, memory_exporter
+):
+    script = Script(title="대본", content="내용", status="script_ready")
+    test_db.add(script)
+    test_db.commit()
+
+    response = test_client.get(f"/api/upload/status/{script.id}")
+    tracer.shutdown()
+
+    trace_id = response.headers["x-trace-id"]
+    trace_spans = [
+        item for item in memory_exporter.spans if item["trace_id"] == trace_id
+    ]
+    spans = {item["name"]: item for item in trace_spans}
+    root = spans["GET /api/upload/status/{script_id}"]
+    assert root["attributes"]["http.status_code"] == 200
+    assert root["attributes"]["http.route"] == "/api/upload/status/{script_id}"
+
+    router_span = spans["router.upload.get_upload_status"]
+    service_span = spans["UploadService.get_upload_status"]
+    assert router_span["parent_id"] == root["span_id"]
+    assert service_span["parent_id"] == router_span["span_id"]
+    # 첫 조회는 DB, 이후 조회는 캐시에서 처리
+    repository_queries = [
+        item["attributes"]["db.query_count"]
+        for item in trace_spans
+        if item["name"] == "ScriptRepository.find_by_id"
+    ]
+    assert max(repository_queries) >= 1
+    assert root["attributes"]["db.query_count"] >= max(repository_queries)
@@ -0,0 +1,135 @@
+"""
+업로드 이벤트 로그 테스트
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.exceptions import YouTubeUploadError
+from app.models.script import Script
+from app.models.upload_log import (
+    EVENT_YOUTUBE_FAILED,
+    EVENT_YOUTUBE_UPLOADED,
+    UploadLog,
+)
+from app.services.upload_event_log import UploadEventLog
+from app.services.upload_service import BaseUploadService
+
+
+def test_event_log_buffers_until_flush(test_db):
+    """record()는 커밋하지 않고, flush()는 한 번의 INSERT로 기록"""
+    inserts = []
+    event.listen(
+        test_db.bind,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statement.startswith("INSERT")
+        and inserts.append(statement),
+    )
+    event_log = UploadEventLog(sessionmaker(bind=test_db.bind), batch_size=100)
+
+    for script_id in range(3):
+        event_log.record(script_id, EVENT_YOUTUBE_UPLOADED, duration_ms=10.0)
+
+    assert event_log.pending() == 3
+    assert test_db.query(UploadLog).count() == 0
+
+    assert event_log.flush() == 3
+    assert len(inserts) == 1
+    assert test_db.query(UploadLog).count() == 3
+    assert event_log.pending() == 0
+    event_log.close()
+
+
+def test_upload_statistics_endpoint(test_client, test_db):
+    """일자별 성공률, 평균 전송 시간, 오류 분포 집계"""
+    today = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    yesterday = today - timedelta(days=1)
+    test_db.add_all(
+        [
+            UploadLog(
+                script_id=1,
+                event=EVENT_YOUTUBE_UPLOADED,
+                duration_ms=1000,
+                bytes=100,
+                created_at=yesterday,
+            ),
+            UploadLog(
+                script_id=2,
+                event=EVENT_YOUTUBE_UPLOADED,
+                duration_ms=3000,
+                bytes=300,
+                created_at=today,
+            ),
+            UploadLog(
+                script_id=3,
+                event=EVENT_YOUTUBE_FAILED,
+                duration_ms=50,
+                error_type="HttpError",
+                created_at=today,
+            ),
+            UploadLog(
+                script_id=4,
+                event=EVENT_YOUTUBE_FAILED,
+                duration_ms=50,
+                error_type="HttpError",
+                created_at=today,
+            ),
+            # 조회 기간 이전 이벤트는 제외
+            UploadLog(
+                script_id=5,
+                event=EVENT_YOUTUBE_FAILED,
+                error_type="Timeout",
+                created_at=today - timedelta(days=30),
+            ),
+        ]
+    )
+    test_db.commit()
+
+    response = test_client.get("/api/upload/stats", params={"days": 2})
+
+    assert response.status_code == 200
+    daily = response.json()["daily"]
+    assert [day["day"] for day in daily] == [
+        yesterday.date().isoformat(),
+        today.date().isoformat(),
+    ]
+    assert daily[0]["success_rate"] == 1.0
+    assert daily[1]["total"] == 3
+    assert daily[1]["success_rate"] == round(1 / 3, 4)
+    assert daily[1]["mean_transfer_ms"] == 3000.0
+    assert daily[1]["bytes"] == 300
+    assert response.json()["errors"] == [
+        {"day": today.date().isoformat(), "error_type": "HttpError", "count": 2}
+    ]
+
+
+def test_failed_youtube_upload_is_logged(test_client, test_db, tmp_path, monkeypatch):
+    """YouTube 업로드 실패 시 오류 유형과 전송 바이트 기록"""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"x" * 64)
+    test_db.add(
+        Script(
+            title="대본",
+            content="본문",
+            status="video_ready",
+            video_file_path=str(video),
+        )
+    )
+    test_db.commit()
+
+    def fail_upload(self, video_file_path, metadata):
+        raise YouTubeUploadError("quota exceeded")
+
+    monkeypatch.setattr(BaseUploadService, "_upload_via_youtube", fail_upload)
+
+    response = test_client.post("/api/upload/youtube/1")
+    assert response.status_code == 500
+
+    errors = test_client.get("/api/upload/stats").json()["errors"]
+    assert errors[0]["error_type"] == "YouTubeUploadError"
+
+    log = test_db.query(UploadLog).one()
+    assert (log.from_status, log.to_status, log.bytes) == ("video_ready", "error", 64)
+    assert log.lease_owner is not None